@@ -30,3 +30,4 @@ application = get_wsgi_application()
 # /media/	/home/exerdiet/exerdiet/static/media
 # set -a; source /home/exerdiet/exerdiet/.env; set +a
 # set -a; source /home/exerdiet/exerdiet/.env; set +a && /home/exerdiet/.virtualenvs/exerdiet/bin/python /home/exerdiet/exerdiet/manage.py update_streak
+# set -a; source /home/exerdiet/exerdiet/.env; set +a && /home/exerdiet/.virtualenvs/exerdiet/bin/python /home/exerdiet/exerdiet/manage.py send_outbox
@@ -0,0 +1,139 @@
+from datetime import date
+from django.db import transaction
+from django.utils import timezone
+from .models import ActivityBitmap, Trainee
+
+
+# Activity is recorded at most once per trainee per day: the day is kept on
+# the trainee and only written while it is not today, with an UPDATE that
+# leaves the rest of the row (and its calculated needs) alone, and the day is
+# then set in the trainee's activity bitmap. The was_active_today flag is only
+# cleared by the nightly streak update, which may run well after midnight, so
+# it cannot tell on its own whether today was recorded.
+def mark_active(trainee):
+    today = timezone.localdate()
+    if trainee.was_active_today and trainee.last_active_on == today:
+        return False
+    marked = Trainee.objects\
+        .filter(pk=trainee.pk)\
+        .exclude(was_active_today=True, last_active_on=today)\
+        .update(was_active_today=True, last_active_on=today)
+    trainee.was_active_today = True
+    trainee.last_active_on = today
+    if marked:
+        record(trainee.pk, today)
+    return marked > 0
+
+
+# The days of a year are stored as the bits of a little-endian integer, bit 0
+# being January 1st, so every query below is a handful of integer operations
+# per trainee and year.
+def _index(day):
+    return (day - date(day.year, 1, 1)).days
+
+
+def _to_int(bits):
+    return int.from_bytes(bytes(bits), 'little')
+
+
+def _to_bytes(value):
+    return value.to_bytes((value.bit_length() + 7) // 8, 'little')
+
+
+def _mask(first, last):
+    return (1 << (last + 1)) - (1 << first)
+
+
+def _year_masks(start, end):
+    for year in range(start.year, end.year + 1):
+        first = _index(start) if year == start.year else 0
+        last = _index(end) if year == end.year else _index(date(year, 12, 31))
+        yield year, _mask(first, last)
+
+
+def _load(years, trainee_ids=None):
+    bitmaps = ActivityBitmap.objects.filter(year__in=years)
+    if trainee_ids is not None:
+        bitmaps = bitmaps.filter(trainee_id__in=trainee_ids)
+    values = {}
+    for trainee_id, year, bits in bitmaps.values_list('trainee_id', 'year', 'bits'):
+        values.setdefault(trainee_id, {})[year] = _to_int(bits)
+    return values
+
+
+def record(trainee_id, day):
+    with transaction.atomic():
+        bitmap, _ = ActivityBitmap.objects.select_for_update()\
+            .get_or_create(trainee_id=trainee_id, year=day.year)
+        value = _to_int(bitmap.bits)
+        bit = 1 << _index(day)
+        if value & bit:
+            return False
+        bitmap.bits = _to_bytes(value | bit)
+        bitmap.save(update_fields=['bits'])
+    return True
+
+
+def is_active(trainee_id, day):
+    return active_days(trainee_id, day, day) > 0
+
+
+def active_days(trainee_id, start, end):
+    masks = dict(_year_masks(start, end))
+    years = _load(masks, [trainee_id]).get(trainee_id, {})
+    return sum((value & masks[year]).bit_count() for year, value in years.items())
+
+
+def current_streaks(day, trainee_ids=None):
+    # Returns {trainee_id: number of consecutive active days ending on day},
+    # reading one more year only for the streaks that reach back to January 1st.
+    streaks = {}
+    pending = None if trainee_ids is None else list(trainee_ids)
+    year, last = day.year, _index(day)
+    while pending is None or pending:
+        bitmaps = _load([year], pending)
+        pending = []
+        for trainee_id, years in bitmaps.items():
+            gaps = ~years[year] & _mask(0, last)
+            if gaps:
+                run = last - (gaps.bit_length() - 1)
+            else:
+                run = last + 1
+                pending.append(trainee_id)
+            if run:
+                streaks[trainee_id] = streaks.get(trainee_id, 0) + run
+        year, last = year - 1, _index(date(year - 1, 12, 31))
+    return streaks
+
+
+def current_streak(trainee_id, day):
+    return current_streaks(day, [trainee_id]).get(trainee_id, 0)
+
+
+def longest_streak(trainee_id):
+    bitmaps = ActivityBitmap.objects.filter(trainee_id=trainee_id)\
+        .order_by('year').values_list('year', 'bits')
+    history, origin = 0, None
+    for year, bits in bitmaps:
+        origin = origin or date(year, 1, 1)
+        history |= _to_int(bits) << (date(year, 1, 1) - origin).days
+    longest = 0
+    while history:
+        history &= history >> 1
+        longest += 1
+    return longest
+
+
+def retention(cohort_start, cohort_end, start, end, trainee_ids=None):
+    # Of the trainees active at least once between cohort_start and cohort_end,
+    # counts those also active at least once between start and end.
+    cohort_masks = dict(_year_masks(cohort_start, cohort_end))
+    window_masks = dict(_year_masks(start, end))
+    bitmaps = _load({*cohort_masks, *window_masks}, trainee_ids)
+
+    def was_active(years, masks):
+        return any(years.get(year, 0) & mask for year, mask in masks.items())
+
+    cohort = [years for years in bitmaps.values() if was_active(years, cohort_masks)]
+    retained = [years for years in cohort if was_active(years, window_masks)]
+    return {'cohort': len(cohort), 'retained': len(retained)}
@@ -5,8 +5,9 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.forms import ValidationError
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.html import format_html
-from . import models
+from . import images, models
 
 CALORIE_LEVEL_LOW = 1800
 CALORIE_LEVEL_HIGH = 2200
@@ -209,7 +210,7 @@ class TraineeAdmin(admin.ModelAdmin):
 
     def thumbnail(self, trainee: models.Trainee):
         if trainee.image.name != '':
-            return format_html(f'<img src="{trainee.image.url}" class="thumbnail"/>')
+            return format_html(f'<img src="{images.thumbnail_url(trainee)}" class="thumbnail"/>')
         return ''
 
     def get_form(self, request: Any, obj: Any | None = ..., change: bool = ..., **kwargs: Any) -> Any:
@@ -282,3 +283,44 @@ class TraineeAdmin(admin.ModelAdmin):
         updated_count = queryset.update(daily_streak=0)
         message = f'{updated_count} trainees` streaks were cleared.'
         self.message_user(request, message)
+
+
+@admin.register(models.OutboxEmail)
+class OutboxEmailAdmin(admin.ModelAdmin):
+    actions = ['retry_emails']
+    list_display = ['subject', 'recipients', 'status', 'attempts',
+                    'created_at', 'next_attempt_at', 'sent_at']
+    list_filter = ['status']
+    list_per_page = 100
+    ordering = ['-created_at']
+    search_fields = ['subject']
+
+    def recipients(self, email):
+        return ', '.join(email.to)
+
+    @admin.action(description='Retry selected emails')
+    def retry_emails(self, request, queryset):
+        updated_count = queryset.exclude(status=models.OutboxEmail.Status.SENT)\
+            .update(status=models.OutboxEmail.Status.PENDING,
+                    attempts=0, next_attempt_at=timezone.now())
+        message = f'{updated_count} emails will be retried.'
+        self.message_user(request, message)
+
+
+@admin.register(models.ImageJob)
+class ImageJobAdmin(admin.ModelAdmin):
+    actions = ['retry_jobs']
+    list_display = ['model', 'object_id', 'name', 'status', 'attempts',
+                    'created_at', 'next_attempt_at', 'done_at']
+    list_filter = ['status', 'model']
+    list_per_page = 100
+    ordering = ['-created_at']
+    search_fields = ['name']
+
+    @admin.action(description='Retry selected jobs')
+    def retry_jobs(self, request, queryset):
+        updated_count = queryset.filter(status=models.ImageJob.Status.FAILED)\
+            .update(status=models.ImageJob.Status.PENDING,
+                    attempts=0, next_attempt_at=timezone.now())
+        message = f'{updated_count} jobs will be retried.'
+        self.message_user(request, message)
@@ -0,0 +1,109 @@
+from django.conf import settings
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer as BaseTokenObtainPairSerializer, TokenRefreshSerializer as BaseTokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from .models import User, Trainee
+
+# Access tokens carry everything most requests need to know about their user,
+# so safe requests are authenticated from the token alone. Requests matching
+# settings.JWT_DB_CHECK still load the user and check it is active.
+CLAIMS = ['trainee_id', 'is_staff', 'is_active']
+
+
+def set_claims(token, user):
+    token['trainee_id'] = Trainee.objects.filter(user_id=user.id)\
+        .values_list('id', flat=True).first()
+    token['is_staff'] = user.is_staff
+    token['is_active'] = user.is_active
+
+
+class TraineeRefreshToken(RefreshToken):
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        set_claims(token, user)
+        return token
+
+
+class TokenObtainPairSerializer(BaseTokenObtainPairSerializer):
+    token_class = TraineeRefreshToken
+
+
+class TokenRefreshSerializer(BaseTokenRefreshSerializer):
+    token_class = TraineeRefreshToken
+
+    def validate(self, attrs):
+        # The claims are read again from the database whenever tokens are
+        # refreshed, and only active users get new tokens.
+        refresh = self.token_class(attrs['refresh'])
+        user = User.objects.filter(
+            **{api_settings.USER_ID_FIELD: refresh[api_settings.USER_ID_CLAIM]}).first()
+        if user is None or not api_settings.USER_AUTHENTICATION_RULE(user):
+            raise AuthenticationFailed(
+                _('No active account found for the given token.'),
+                code='no_active_account')
+        set_claims(refresh, user)
+
+        data = {'access': str(refresh.access_token)}
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            if api_settings.BLACKLIST_AFTER_ROTATION:
+                try:
+                    refresh.blacklist()
+                except AttributeError:
+                    pass
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            data['refresh'] = str(refresh)
+        return data
+
+
+class TraineeTokenUser(TokenUser):
+    @cached_property
+    def trainee_id(self):
+        return self.token.get('trainee_id')
+
+    @cached_property
+    def is_active(self):
+        return self.token.get('is_active', False)
+
+
+class TraineeJWTAuthentication(JWTAuthentication):
+    def authenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        if self.requires_db_check(request, validated_token):
+            return self.get_user(validated_token), validated_token
+        return self.get_token_user(validated_token), validated_token
+
+    def requires_db_check(self, request, validated_token):
+        db_check = settings.JWT_DB_CHECK
+        # Tokens issued before the claims existed are always checked.
+        if any(claim not in validated_token for claim in CLAIMS):
+            return True
+        if db_check['UNSAFE_METHODS'] and request.method not in SAFE_METHODS:
+            return True
+        if db_check['STAFF'] and validated_token['is_staff']:
+            return True
+        return request.path.startswith(tuple(db_check['PATH_PREFIXES']))
+
+    def get_token_user(self, validated_token):
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken(_('Token contained no recognizable user identification'))
+        user = api_settings.TOKEN_USER_CLASS(validated_token)
+        if not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+        return user
@@ -0,0 +1,187 @@
+from collections import OrderedDict
+from decimal import Decimal
+import hashlib
+import json
+import threading
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework.response import Response
+from .models import CatalogVersion
+
+# The food and exercise catalogs only change when they are edited by admins
+# or seeded, which bumps their version. Catalog responses are tagged with the
+# version, so clients revalidate them without the catalog being queried again.
+FOODS = 'foods'
+EXERCISES = 'exercises'
+CATALOGS = {'diet.Food': FOODS, 'gym.Exercise': EXERCISES}
+
+
+def get_version(name):
+    catalog, _ = CatalogVersion.objects.get_or_create(name=name)
+    return catalog
+
+
+def bump(name):
+    updated = CatalogVersion.objects.filter(name=name)\
+        .update(version=F('version') + 1, updated_at=timezone.now())
+    if not updated:
+        CatalogVersion.objects.get_or_create(name=name)
+
+
+def bump_for(instance):
+    # Custom foods and exercises are not part of the catalogs.
+    name = CATALOGS.get(type(instance)._meta.label)
+    if name is not None:
+        bump(name)
+
+
+def get_etag(catalog, request):
+    query = '&'.join(sorted(f'{key}={value}' for key, values in request.query_params.lists()
+                            for value in values))
+    key = ':'.join([catalog.name, str(catalog.version), catalog.updated_at.isoformat(),
+                    request.accepted_media_type or '', request.scheme, request.get_host(),
+                    request.path, query])
+    return '"' + hashlib.sha256(key.encode()).hexdigest()[:32] + '"'
+
+
+class RenderedResponse(Response):
+    # A response whose content was already rendered by renderer, as cached
+    # lists are. Its data is parsed back from the content only when read,
+    # which the views never do, with numbers as the serializers' Decimals.
+    def __init__(self, content, renderer):
+        super().__init__()
+        self.content = content
+        if renderer.charset is None:
+            self['Content-Type'] = renderer.media_type
+        else:
+            self['Content-Type'] = f'{renderer.media_type}; charset={renderer.charset}'
+
+    @property
+    def data(self):
+        return json.loads(self.content, parse_float=Decimal) if self.content else None
+
+    @data.setter
+    def data(self, value):
+        pass
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.data = None
+
+
+class ResponseCache:
+    # An in-process LRU cache of rendered catalog lists, bounded by
+    # settings.CATALOG_CACHE. Entries are the bytes sent to clients, which
+    # cannot be changed by the requests sharing them. Keys embed the catalog
+    # version, so entries of older versions are never hit again and age out
+    # of the cache. Concurrent misses of the same key wait for the first one
+    # to build the content.
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._size = 0
+        self._flights = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = self.misses = 0
+
+    def _store(self, key, content):
+        size = len(content)
+        limits = settings.CATALOG_CACHE
+        if size > limits['MAX_BYTES']:
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = (content, size)
+            self._size += size
+            while len(self._entries) > limits['MAX_ENTRIES'] or \
+                    self._size > limits['MAX_BYTES']:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+
+    def get_or_build(self, key, build):
+        # build returns the content to cache, or None when it is not cacheable.
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+            flight = self._flights.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = self._flights[key] = _Flight()
+
+        if not is_leader:
+            flight.done.wait()
+            if flight.data is not None:
+                return flight.data
+            return build()
+
+        try:
+            flight.data = build()
+            if flight.data is not None:
+                self._store(key, flight.data)
+            return flight.data
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+
+response_cache = ResponseCache()
+
+
+class CatalogConditionalMixin:
+    catalog = None
+
+    def list(self, request, *args, **kwargs):
+        return self.get_conditional_response(self.get_cached_list, request, *args, **kwargs)
+
+    def get_cached_list(self, request, *args, **kwargs):
+        # Only lists rendered as JSON are cached, as they are sent.
+        renderer = request.accepted_renderer
+        if renderer.format != 'json':
+            return super().list(request, *args, **kwargs)
+        responses = []
+
+        def build():
+            response = super(CatalogConditionalMixin, self).list(request, *args, **kwargs)
+            responses.append(response)
+            if response.status_code != 200:
+                return None
+            return renderer.render(response.data, request.accepted_media_type,
+                                   self.get_renderer_context())
+
+        content = response_cache.get_or_build(self.etag, build)
+        if content is None:
+            return responses[0]
+        return RenderedResponse(content, renderer)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.get_conditional_response(super().retrieve, request, *args, **kwargs)
+
+    def get_conditional_response(self, handler, request, *args, **kwargs):
+        catalog = self.catalog_version = get_version(self.catalog)
+        etag = self.etag = get_etag(catalog, request)
+        last_modified = int(catalog.updated_at.timestamp())
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = handler(request, *args, **kwargs)
+        if response.status_code not in (200, 304):
+            return response
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        return response
@@ -0,0 +1,174 @@
+from decimal import Decimal
+from django.db.models import Case, When, F, Q, Sum, DecimalField, IntegerField, ExpressionWrapper
+from django.db.models.functions import Cast, Mod, Round
+from django.db.models.lookups import Exact, GreaterThan
+from diet.models import Food, FoodInstance, Water
+from gym.models import ExerciseInstance
+
+
+# Quantities and macronutrients have a single decimal place, so every total
+# is computed over integer tenths to reproduce the per-item truncation and
+# half-even rounding of the model helpers exactly on every backend.
+_WIDE_DECIMAL = DecimalField(max_digits=65, decimal_places=0)
+
+
+def _as_integer(expression):
+    return ExpressionWrapper(expression, output_field=IntegerField())
+
+
+def _tenths(field):
+    return Cast(Round(F(field) * 10), IntegerField())
+
+
+def _floor_div(dividend, divisor):
+    return _as_integer((dividend - Mod(dividend, divisor)) / divisor)
+
+
+def _round_half_even_div(dividend, divisor):
+    quotient = _floor_div(dividend, divisor)
+    remainder = _as_integer(Mod(dividend, divisor))
+    return _as_integer(quotient + Case(
+        When(GreaterThan(remainder, divisor // 2), then=1),
+        When(Q(Exact(remainder, divisor // 2)) & Q(Exact(Mod(quotient, 2), 1)),
+             then=1),
+        default=0,
+        output_field=IntegerField()
+    ))
+
+
+def _food_instance_calories():
+    # calories * quantity, scaled by ten
+    calories = _as_integer(F('food__calories') * _tenths('quantity'))
+    return Case(
+        When(food__category=Food.Category.SEASONING,
+             then=_floor_div(calories * 101, 1000)),
+        default=_floor_div(calories, 1000),
+        output_field=IntegerField()
+    )
+
+
+def _food_instance_macro_tenths(macro):
+    # macro * quantity, scaled by ten thousand
+    product = _as_integer(_tenths(f'food__{macro}') * _tenths('quantity'))
+    return _round_half_even_div(product, 1000)
+
+
+def _exercise_instance_calories():
+    # The product can exceed a 64-bit integer, so it is kept as a decimal.
+    calories = ExpressionWrapper(
+        Cast('exercise__calories_burned', _WIDE_DECIMAL) *
+        Cast('duration', _WIDE_DECIMAL) * Cast('sets', _WIDE_DECIMAL),
+        output_field=_WIDE_DECIMAL)
+    return Case(
+        When(exercise__is_repetitive=True,
+             then=(calories - Mod(calories, 10)) / 10),
+        default=(calories - Mod(calories, 60)) / 60,
+        output_field=_WIDE_DECIMAL
+    )
+
+
+def _food_instances_totals(queryset, trainee_path, day_path):
+    return queryset.values(trainee_id=F(trainee_path), day=F(day_path))\
+        .annotate(calories=Sum(_food_instance_calories()),
+                  carbs=Sum(_food_instance_macro_tenths('carbs')),
+                  fats=Sum(_food_instance_macro_tenths('fats')),
+                  protein=Sum(_food_instance_macro_tenths('protein')))\
+        .order_by()
+
+
+def _exercise_instances_totals(queryset, trainee_path, day_path):
+    return queryset.values(trainee_id=F(trainee_path), day=F(day_path))\
+        .annotate(calories_burned=Sum(_exercise_instance_calories()))\
+        .order_by()
+
+
+def _to_macro(tenths):
+    return Decimal(int(tenths or 0)) / 10
+
+
+def _filter_range(queryset, trainee_path, day_path, trainee_ids, start, end):
+    # Conditions on a multi-valued relation must share a single filter() call
+    # so that they apply to the same joined row.
+    conditions = {f'{trainee_path}__isnull': False}
+    if trainee_ids is not None:
+        conditions[f'{trainee_path}__in'] = trainee_ids
+    if start is not None:
+        conditions[f'{day_path}__gte'] = start
+    if end is not None:
+        conditions[f'{day_path}__lte'] = end
+    return queryset.filter(**conditions)
+
+
+def empty_totals():
+    return {
+        'calories': 0,
+        'carbs': Decimal('0.0'),
+        'fats': Decimal('0.0'),
+        'protein': Decimal('0.0'),
+        'water': 0,
+        'calories_burned': 0,
+    }
+
+
+def get_totals_by_day(trainee_ids=None, start=None, end=None):
+    # Returns {(trainee_id, day): totals} for every day with logged activity,
+    # using a fixed number of grouped aggregate queries.
+    sums = {}
+
+    def add(row, keys):
+        key = (row['trainee_id'], row['day'])
+        entry = sums.setdefault(key, dict.fromkeys(empty_totals(), 0))
+        for name in keys:
+            entry[name] += int(row[name] or 0)
+
+    meal_food_instances = _filter_range(
+        FoodInstance.objects.all(),
+        'meal__trainee_id', 'meal__eaten_on', trainee_ids, start, end)
+    # A recipe counts once for every meal it was added to.
+    recipe_food_instances = _filter_range(
+        FoodInstance.objects.all(),
+        'recipe__meals__trainee_id', 'recipe__meals__eaten_on',
+        trainee_ids, start, end)
+    performed_exercise_instances = _filter_range(
+        ExerciseInstance.objects.all(),
+        'performed_workout__trainee_id', 'performed_workout__performed_on',
+        trainee_ids, start, end)
+    workout_exercise_instances = _filter_range(
+        ExerciseInstance.objects.all(),
+        'workout__performed_workouts__trainee_id',
+        'workout__performed_workouts__performed_on',
+        trainee_ids, start, end)
+    waters = _filter_range(Water.objects.all(), 'trainee_id', 'drinking_date',
+                           trainee_ids, start, end)
+
+    macros = ['calories', 'carbs', 'fats', 'protein']
+    for row in _food_instances_totals(meal_food_instances,
+                                      'meal__trainee_id', 'meal__eaten_on'):
+        add(row, macros)
+    for row in _food_instances_totals(recipe_food_instances,
+                                      'recipe__meals__trainee_id',
+                                      'recipe__meals__eaten_on'):
+        add(row, macros)
+    for row in _exercise_instances_totals(performed_exercise_instances,
+                                          'performed_workout__trainee_id',
+                                          'performed_workout__performed_on'):
+        add(row, ['calories_burned'])
+    for row in _exercise_instances_totals(workout_exercise_instances,
+                                          'workout__performed_workouts__trainee_id',
+                                          'workout__performed_workouts__performed_on'):
+        add(row, ['calories_burned'])
+    for row in waters.values('trainee_id', day=F('drinking_date'))\
+            .annotate(water=Sum('amount')).order_by():
+        add(row, ['water'])
+
+    totals = {}
+    for key, entry in sums.items():
+        totals[key] = {
+            'calories': entry['calories'],
+            'carbs': _to_macro(entry['carbs']),
+            'fats': _to_macro(entry['fats']),
+            'protein': _to_macro(entry['protein']),
+            'water': entry['water'],
+            'calories_burned': entry['calories_burned'],
+        }
+    return totals
@@ -0,0 +1,90 @@
+import time
+from django.conf import settings
+from django.core.cache import caches
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.permissions import SAFE_METHODS
+
+# The serialized dashboard of a trainee is cached under a per-trainee version
+# stamp, so a write only has to bump the stamp to invalidate every entry.
+# Trainees are identified by their user id, which the views already know
+# without a query. Hit and miss counters are only kept when
+# settings.DASHBOARD_CACHE['STATS'] is set, as they write to the cache on
+# every read.
+HITS_KEY = 'dashboard:stats:hits'
+MISSES_KEY = 'dashboard:stats:misses'
+
+
+def _cache():
+    return caches[settings.DASHBOARD_CACHE['ALIAS']]
+
+
+def _version_key(user_id):
+    return f'dashboard:version:{user_id}'
+
+
+def _incr(cache, key):
+    if not settings.DASHBOARD_CACHE.get('STATS'):
+        return
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, None):
+            cache.incr(key)
+
+
+def get_version(user_id):
+    cache = _cache()
+    key = _version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        # A fresh stamp can never collide with entries written under a stamp
+        # that was evicted from the cache.
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+def bump(user_id):
+    cache = _cache()
+    key = _version_key(user_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)
+
+
+def get_or_build(user_id, build):
+    cache = _cache()
+    key = f'dashboard:{user_id}:{get_version(user_id)}:{timezone.localdate()}'
+    data = cache.get(key)
+    if data is not None:
+        _incr(cache, HITS_KEY)
+        return data
+    _incr(cache, MISSES_KEY)
+    data = build()
+    cache.set(key, data, settings.DASHBOARD_CACHE['TIMEOUT'])
+    return data
+
+
+def stats():
+    cache = _cache()
+    hits = cache.get(HITS_KEY, 0)
+    misses = cache.get(MISSES_KEY, 0)
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': hits / (hits + misses) if hits + misses else 0,
+    }
+
+
+def reset_stats():
+    _cache().delete_many([HITS_KEY, MISSES_KEY])
+
+
+class DashboardInvalidationMixin:
+    def finalize_response(self, request, response, *args, **kwargs):
+        if request.method not in SAFE_METHODS and status.is_success(response.status_code) \
+                and request.user.is_authenticated:
+            bump(request.user.id)
+        return super().finalize_response(request, response, *args, **kwargs)
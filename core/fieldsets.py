@@ -0,0 +1,102 @@
+from rest_framework.relations import PrimaryKeyRelatedField
+from rest_framework.serializers import BaseSerializer, ListSerializer
+
+# GET requests can select fields with ?fields=id,name,recipes.name and choose
+# the nested objects to embed with ?expand=recipes,food_instances.food. Nested
+# objects that are not expanded are rendered as their ids. Without these
+# parameters every field is rendered and every nested object is expanded.
+EXPANDED = 'expanded'
+COLLAPSED = 'collapsed'
+
+
+def parse_fields(value):
+    if value is None:
+        return None
+    tree = {}
+    for path in value.split(','):
+        node = tree
+        for name in filter(None, path.strip().split('.')):
+            node = node.setdefault(name, {})
+    return tree
+
+
+def parse_expand(value):
+    if value is None:
+        return None
+    expand = set()
+    for path in filter(None, (path.strip() for path in value.split(','))):
+        names = path.split('.')
+        # Expanding a nested object also expands the objects around it.
+        expand.update('.'.join(names[:index]) for index in range(1, len(names) + 1))
+    return expand
+
+
+def get_state(fields, expand, path, is_nested):
+    # Returns whether the field at path is rendered expanded, collapsed to
+    # ids, or not at all (None).
+    node = fields
+    for name in path.split('.'):
+        if not node:
+            break
+        if name not in node:
+            return None
+        node = node[name]
+    if not is_nested or expand is None or path in expand:
+        return EXPANDED
+    return COLLAPSED
+
+
+def _collapse(name, field):
+    kwargs = {'read_only': True}
+    if field.source != name:
+        kwargs['source'] = field.source
+    if isinstance(field, ListSerializer):
+        kwargs['many'] = True
+    return PrimaryKeyRelatedField(**kwargs)
+
+
+def prune(serializer, fields, expand, path=''):
+    if isinstance(serializer, ListSerializer):
+        serializer = serializer.child
+    for name, field in list(serializer.fields.items()):
+        field_path = path + name
+        is_nested = isinstance(field, BaseSerializer)
+        state = get_state(fields, expand, field_path, is_nested)
+        if state is None:
+            serializer.fields.pop(name)
+        elif state == COLLAPSED:
+            serializer.fields[name] = _collapse(name, field)
+        elif is_nested:
+            prune(field, fields, expand, field_path + '.')
+
+
+class SparseFieldsetMixin:
+    # Maps the fields of the view's serializer to the lookups they need when
+    # expanded. Collapsed fields only prefetch their own relation.
+    prefetches = {}
+
+    def get_fieldsets(self):
+        if self.request.method != 'GET':
+            return None, None
+        params = self.request.query_params
+        return parse_fields(params.get('fields')), parse_expand(params.get('expand'))
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        fields, expand = self.get_fieldsets()
+        if fields is not None or expand is not None:
+            prune(serializer, fields, expand)
+        return serializer
+
+    def prefetch(self, queryset):
+        fields, expand = self.get_fieldsets()
+        serializer_fields = self.get_serializer_class()().fields
+        lookups = []
+        for name, field_lookups in self.prefetches.items():
+            is_nested = isinstance(serializer_fields.get(name), BaseSerializer)
+            state = get_state(fields, expand, name, is_nested)
+            if state == EXPANDED:
+                lookups.extend(field_lookups)
+            elif state == COLLAPSED:
+                lookups.append(name)
+        return queryset.prefetch_related(*dict.fromkeys(lookups))
@@ -0,0 +1,217 @@
+import os
+from datetime import timedelta
+from io import BytesIO
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.utils import timezone
+from PIL import Image, ImageOps
+from . import catalog, dashboard_cache
+from .models import ImageJob, Trainee
+
+# Uploaded images are stored as they are, and the renditions served by the API
+# and the admin are generated later by the process_images command. The
+# renditions of an image are kept next to the name of the image they were made
+# from, so renditions of a replaced image are never served.
+IMAGE_MODELS = ['core.Trainee', 'diet.Food', 'diet.Recipe',
+                'gym.Exercise', 'gym.Workout']
+FORMATS = {'webp': 'WEBP', 'jpeg': 'JPEG'}
+QUALITY = 80
+
+
+def image_models():
+    return tuple(apps.get_model(label) for label in IMAGE_MODELS)
+
+
+def image_senders():
+    # The image models and their subclasses.
+    models = image_models()
+    return [model for model in apps.get_models() if issubclass(model, models)]
+
+
+def is_current(instance):
+    renditions = instance.image_renditions
+    return bool(instance.image) and bool(renditions) and \
+        renditions.get('source') == instance.image.name
+
+
+def rendition_urls(instance):
+    if not is_current(instance):
+        return None
+    return _urls(instance.image.storage, instance.image_renditions)
+
+
+def rendition_urls_from(storage, image, renditions):
+    # rendition_urls for the image name and renditions of a .values() row.
+    if not image or not renditions or renditions.get('source') != image:
+        return None
+    return _urls(storage, renditions)
+
+
+def _urls(storage, renditions):
+    return {size: {fmt: storage.url(name) for fmt, name in formats.items()}
+            for size, formats in renditions.items()
+            if size != 'source'}
+
+
+def thumbnail_url(instance):
+    urls = rendition_urls(instance)
+    if urls and 'thumb' in urls:
+        return urls['thumb']['webp']
+    return instance.image.url
+
+
+def enqueue(instance):
+    if not instance.image or is_current(instance):
+        return None
+    job, _ = ImageJob.objects.get_or_create(
+        model=instance._meta.label, object_id=instance.pk,
+        name=instance.image.name, status=ImageJob.Status.PENDING)
+    return job
+
+
+def _encode(image, fmt):
+    if fmt == 'jpeg' and image.mode != 'RGB':
+        image = image.convert('RGB')
+    elif fmt == 'webp' and image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA')
+    buffer = BytesIO()
+    # Nothing but the pixels is saved, which drops EXIF and any other metadata.
+    image.save(buffer, format=FORMATS[fmt], quality=QUALITY)
+    return buffer.getvalue()
+
+
+def _strip_original(storage, name, image):
+    # Saves a copy of the original without its EXIF data, in the same format,
+    # and returns the name storage gave it. The orientation tag is applied to
+    # the pixels first. Originals without EXIF data are kept.
+    if not image.getexif():
+        return name
+    original = ImageOps.exif_transpose(image)
+    buffer = BytesIO()
+    if image.format == 'JPEG':
+        original.save(buffer, format='JPEG', quality=95)
+    else:
+        original.save(buffer, format=image.format)
+    return storage.save(name, ContentFile(buffer.getvalue()))
+
+
+def render(storage, name):
+    stem, _ = os.path.splitext(name)
+    directory, filename = os.path.split(stem)
+    renditions = {'source': name}
+    with storage.open(name, 'rb') as file, Image.open(file) as image:
+        image.load()
+        transposed = ImageOps.exif_transpose(image)
+        for size, dimensions in settings.IMAGE_RENDITIONS.items():
+            resized = transposed.copy()
+            resized.thumbnail(dimensions, Image.LANCZOS)
+            renditions[size] = {}
+            for fmt in FORMATS:
+                path = os.path.join(directory, 'renditions',
+                                    f'{filename}.{size}.{fmt}')
+                storage.delete(path)
+                renditions[size][fmt] = storage.save(
+                    path, ContentFile(_encode(resized, fmt)))
+        if settings.IMAGE_STRIP_ORIGINAL_EXIF:
+            renditions['source'] = _strip_original(storage, name, image)
+    return renditions
+
+
+def _rendition_names(renditions):
+    return {name for size, formats in (renditions or {}).items()
+            if size != 'source' for name in formats.values()}
+
+
+def _process(job):
+    model = apps.get_model(job.model)
+    instance = model.objects.filter(pk=job.object_id).first()
+    # Jobs of deleted objects and replaced images have nothing left to do.
+    if instance is None or instance.image.name != job.name:
+        return
+    storage = instance.image.storage
+    renditions = render(storage, job.name)
+    source = renditions['source']
+    updated = model.objects.filter(pk=job.object_id, image=job.name)\
+        .update(image=source, image_renditions=renditions)
+    # The original is only deleted once the object points at its stripped
+    # copy, and the copy is deleted if the image was replaced meanwhile.
+    if source != job.name:
+        storage.delete(job.name if updated else source)
+    if isinstance(instance, Trainee):
+        dashboard_cache.bump(instance.user_id)
+    catalog.bump_for(instance)
+    for name in _rendition_names(instance.image_renditions) - \
+            _rendition_names(renditions):
+        storage.delete(name)
+
+
+def _failed(job, error, max_attempts, backoff):
+    # Retries back off exponentially: backoff, 2 * backoff, 4 * backoff...
+    job.attempts += 1
+    job.last_error = str(error) or type(error).__name__
+    if job.attempts >= max_attempts:
+        job.status = ImageJob.Status.FAILED
+    else:
+        job.next_attempt_at = timezone.now() + \
+            timedelta(seconds=backoff * 2 ** (job.attempts - 1))
+
+
+def _claim(batch_size, lease):
+    # Claimed jobs stay pending, but are only due again once the lease runs
+    # out, so the jobs of a process that dies while rendering are retried.
+    # The rows are not kept locked while the images are being rendered.
+    now = timezone.now()
+    with transaction.atomic():
+        jobs = list(ImageJob.objects
+                    .select_for_update(skip_locked=True)
+                    .filter(status=ImageJob.Status.PENDING,
+                            next_attempt_at__lte=now)
+                    .order_by('next_attempt_at', 'id')[:batch_size])
+        ImageJob.objects.filter(pk__in=[job.pk for job in jobs])\
+            .update(next_attempt_at=now + timedelta(seconds=lease))
+    return jobs
+
+
+def _record(job):
+    job.save(update_fields=['status', 'attempts', 'last_error',
+                            'next_attempt_at', 'done_at'])
+
+
+def process_batch(batch_size=20, max_attempts=3, backoff=60, lease=600):
+    # Renders the due jobs of one batch and returns the number of jobs done,
+    # retried and failed. The result of each job is recorded as soon as it
+    # is known.
+    counts = {'done': 0, 'retried': 0, 'failed': 0}
+    jobs = _claim(batch_size, lease)
+    for job in jobs:
+        try:
+            _process(job)
+        except Exception as error:
+            _failed(job, error, max_attempts, backoff)
+        else:
+            job.status = ImageJob.Status.DONE
+            job.done_at = timezone.now()
+            job.attempts += 1
+        _record(job)
+
+    for job in jobs:
+        if job.status == ImageJob.Status.DONE:
+            counts['done'] += 1
+        elif job.status == ImageJob.Status.FAILED:
+            counts['failed'] += 1
+        else:
+            counts['retried'] += 1
+    return counts
+
+
+def enqueue_missing():
+    # Queues the images stored before renditions existed, or whose job failed.
+    count = 0
+    for model in image_models():
+        for instance in model.objects.exclude(image='').exclude(image__isnull=True)\
+                .only('id', 'image', 'image_renditions').iterator():
+            if not is_current(instance) and enqueue(instance) is not None:
+                count += 1
+    return count
@@ -0,0 +1,95 @@
+from datetime import timedelta
+from decimal import Decimal
+from django.db import transaction
+from .dashboard import empty_totals, get_totals_by_day
+from .models import DailyLedger
+
+LEDGER_FIELDS = ['calories', 'carbs', 'fats',
+                 'protein', 'water', 'calories_burned']
+# Totals of absurd entries are clamped to what the ledger columns can hold.
+MAX_TOTAL = 2 ** 63 - 1
+MAX_MACRO = Decimal('99999999999.9')
+
+
+def get_day_totals(trainee, day):
+    totals = DailyLedger.objects.filter(trainee=trainee, day=day)\
+        .values(*LEDGER_FIELDS).first()
+    return totals or empty_totals()
+
+
+def get_history(trainee, start, end):
+    # Returns the totals of every day between start and end, days without a
+    # ledger row having empty totals.
+    ledgers = DailyLedger.objects\
+        .filter(trainee=trainee, day__gte=start, day__lte=end)\
+        .values('day', *LEDGER_FIELDS)
+    totals = {ledger.pop('day'): ledger for ledger in ledgers}
+    return [{'day': start + timedelta(days=offset),
+             **totals.get(start + timedelta(days=offset), empty_totals())}
+            for offset in range((end - start).days + 1)]
+
+
+def sync(trainee_ids=None, start=None, end=None, days=None, dry_run=False):
+    # Recomputes the ledger rows of the given trainees between start and end
+    # (optionally only for the given days) and writes the differences.
+    # Days without any logged activity have no row.
+    totals = get_totals_by_day(trainee_ids, start, end)
+    ledgers = DailyLedger.objects.all()
+    if trainee_ids is not None:
+        ledgers = ledgers.filter(trainee_id__in=trainee_ids)
+    if start is not None:
+        ledgers = ledgers.filter(day__gte=start)
+    if end is not None:
+        ledgers = ledgers.filter(day__lte=end)
+    if days is not None:
+        ledgers = ledgers.filter(day__in=days)
+        totals = {key: value for key, value in totals.items()
+                  if key[1] in days}
+    existing = {(ledger.trainee_id, ledger.day): ledger for ledger in ledgers}
+
+    to_create = []
+    to_update = []
+    for key, values in totals.items():
+        values = _clamped(values)
+        ledger = existing.pop(key, None)
+        if ledger is None:
+            to_create.append(DailyLedger(trainee_id=key[0], day=key[1],
+                                         **values))
+        elif any(getattr(ledger, name) != values[name] for name in LEDGER_FIELDS):
+            for name in LEDGER_FIELDS:
+                setattr(ledger, name, values[name])
+            to_update.append(ledger)
+    to_delete = [ledger.id for ledger in existing.values()]
+
+    if not dry_run:
+        with transaction.atomic():
+            DailyLedger.objects.bulk_create(to_create,
+                                            update_conflicts=True,
+                                            unique_fields=['trainee', 'day'],
+                                            update_fields=LEDGER_FIELDS)
+            DailyLedger.objects.bulk_update(to_update, LEDGER_FIELDS)
+            DailyLedger.objects.filter(id__in=to_delete).delete()
+
+    return {'created': len(to_create),
+            'updated': len(to_update),
+            'deleted': len(to_delete)}
+
+
+def _clamped(values):
+    return {name: max(0, min(value, MAX_MACRO if isinstance(value, Decimal) else MAX_TOTAL))
+            for name, value in values.items()}
+
+
+def refresh(trainee_id, days):
+    days = set(days)
+    if not days:
+        return
+    sync([trainee_id], min(days), max(days), days)
+
+
+def refresh_many(trainee_days):
+    days_by_trainee = {}
+    for trainee_id, day in trainee_days:
+        days_by_trainee.setdefault(trainee_id, set()).add(day)
+    for trainee_id, days in days_by_trainee.items():
+        refresh(trainee_id, days)
@@ -0,0 +1,130 @@
+import base64
+from datetime import timedelta
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.core.mail.backends.base import BaseEmailBackend
+from django.db import transaction
+from django.utils import timezone
+from .models import OutboxEmail
+
+
+# Emails are only stored by the request that sends them, and delivered later
+# by the send_outbox command over settings.OUTBOX_EMAIL_BACKEND. Enqueuing
+# inside the request's transaction also drops the emails of failed requests.
+def _attachments(message):
+    # Attachments are stored as [filename, base64 content, mimetype]. MIME
+    # parts attached as objects cannot be stored and are rejected.
+    attachments = []
+    for attachment in message.attachments:
+        if not isinstance(attachment, tuple):
+            raise ValueError('Outbox emails can only have (filename, content, mimetype) attachments.')
+        filename, content, mimetype = attachment
+        if isinstance(content, str):
+            content = content.encode()
+        attachments.append([filename, base64.b64encode(content).decode(), mimetype])
+    return attachments
+
+
+class OutboxEmailBackend(BaseEmailBackend):
+    def send_messages(self, email_messages):
+        emails = [OutboxEmail(
+            subject=message.subject,
+            body=message.body,
+            from_email=message.from_email or settings.DEFAULT_FROM_EMAIL,
+            to=list(message.to),
+            cc=list(message.cc),
+            bcc=list(message.bcc),
+            reply_to=list(message.reply_to),
+            headers=dict(message.extra_headers),
+            alternatives=[list(alternative) for alternative in
+                          getattr(message, 'alternatives', [])],
+            attachments=_attachments(message),
+        ) for message in email_messages if message.recipients()]
+        OutboxEmail.objects.bulk_create(emails)
+        return len(emails)
+
+
+def _to_message(email, connection):
+    message = EmailMultiAlternatives(
+        subject=email.subject, body=email.body, from_email=email.from_email,
+        to=email.to, cc=email.cc, bcc=email.bcc, reply_to=email.reply_to,
+        headers=email.headers, connection=connection)
+    for content, mimetype in email.alternatives:
+        message.attach_alternative(content, mimetype)
+    for filename, content, mimetype in email.attachments:
+        message.attach(filename, base64.b64decode(content), mimetype)
+    return message
+
+
+def _failed(email, error, max_attempts, backoff):
+    # Retries back off exponentially: backoff, 2 * backoff, 4 * backoff...
+    email.attempts += 1
+    email.last_error = str(error) or type(error).__name__
+    if email.attempts >= max_attempts:
+        email.status = OutboxEmail.Status.FAILED
+    else:
+        email.next_attempt_at = timezone.now() + \
+            timedelta(seconds=backoff * 2 ** (email.attempts - 1))
+
+
+def _claim(batch_size, lease):
+    # Claimed emails stay pending, but are only due again once the lease runs
+    # out, so the emails of a process that dies while sending are retried.
+    # The rows are not kept locked while the emails are being sent.
+    now = timezone.now()
+    with transaction.atomic():
+        emails = list(OutboxEmail.objects
+                      .select_for_update(skip_locked=True)
+                      .filter(status=OutboxEmail.Status.PENDING,
+                              next_attempt_at__lte=now)
+                      .order_by('next_attempt_at', 'id')[:batch_size])
+        OutboxEmail.objects.filter(pk__in=[email.pk for email in emails])\
+            .update(next_attempt_at=now + timedelta(seconds=lease))
+    return emails
+
+
+def _record(email):
+    email.save(update_fields=['status', 'attempts', 'last_error',
+                              'next_attempt_at', 'sent_at'])
+
+
+def send_batch(batch_size=100, max_attempts=5, backoff=60, lease=600):
+    # Sends the due emails of one batch over a single connection and returns
+    # the number of emails sent, retried and failed. The result of each email
+    # is recorded as soon as it is known.
+    counts = {'sent': 0, 'retried': 0, 'failed': 0}
+    emails = _claim(batch_size, lease)
+    if not emails:
+        return counts
+
+    connection = get_connection(settings.OUTBOX_EMAIL_BACKEND,
+                                fail_silently=False)
+    try:
+        connection.open()
+    except Exception as error:
+        for email in emails:
+            _failed(email, error, max_attempts, backoff)
+            _record(email)
+    else:
+        try:
+            for email in emails:
+                try:
+                    connection.send_messages([_to_message(email, connection)])
+                except Exception as error:
+                    _failed(email, error, max_attempts, backoff)
+                else:
+                    email.status = OutboxEmail.Status.SENT
+                    email.sent_at = timezone.now()
+                    email.attempts += 1
+                _record(email)
+        finally:
+            connection.close()
+
+    for email in emails:
+        if email.status == OutboxEmail.Status.SENT:
+            counts['sent'] += 1
+        elif email.status == OutboxEmail.Status.FAILED:
+            counts['failed'] += 1
+        else:
+            counts['retried'] += 1
+    return counts
@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from io import BytesIO
+import random
+import time
+from django.core.management.base import BaseCommand
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from core.parsers import ORJSONParser
+from core.renderers import ORJSONRenderer
+
+
+def decimal(rng, high):
+    return Decimal(rng.randint(0, high * 10)).scaleb(-1)
+
+
+def food_instance(rng, id):
+    return {
+        'id': id,
+        'food': {
+            'id': rng.randint(1, 300),
+            'name': f'Food {id}',
+            'category': rng.choice('FBS'),
+            'calories': rng.randint(0, 900),
+            'carbs': decimal(rng, 100),
+            'fats': decimal(rng, 100),
+            'protein': decimal(rng, 100),
+            'image': None,
+            'image_renditions': None,
+        },
+        'quantity': decimal(rng, 500),
+        'total_calories': rng.randint(0, 2000),
+        'total_carbs': decimal(rng, 300),
+        'total_fats': decimal(rng, 300),
+        'total_protein': decimal(rng, 300),
+    }
+
+
+def meal_page(count):
+    # A page of meals as MealSerializer renders them, with two recipes of four
+    # foods and three more foods in each meal.
+    rng = random.Random(count)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    results = []
+    for id in range(1, count + 1):
+        recipes = [{
+            'id': id * 10 + index,
+            'name': f'Recipe {index}',
+            'instructions': 'Mix everything and serve.',
+            'image': None,
+            'image_renditions': None,
+            'food_instances': [food_instance(rng, id * 100 + index * 10 + food)
+                               for food in range(4)],
+            'total_calories': rng.randint(0, 3000),
+            'total_carbs': decimal(rng, 500),
+            'total_fats': decimal(rng, 500),
+            'total_protein': decimal(rng, 500),
+        } for index in range(2)]
+        results.append({
+            'id': id,
+            'name': f'Meal {id}',
+            'time_eaten': start + timedelta(hours=id * 5, seconds=id),
+            'recipes': recipes,
+            'food_instances': [food_instance(rng, id * 100 + food) for food in range(3)],
+            'total_calories': rng.randint(0, 5000),
+            'total_carbs': decimal(rng, 900),
+            'total_fats': decimal(rng, 900),
+            'total_protein': decimal(rng, 900),
+        })
+    return {'count': count, 'next': None, 'previous': None, 'results': results}
+
+
+def measure(function, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        result = function()
+    return (time.perf_counter() - start) / iterations, result
+
+
+class Command(BaseCommand):
+    help = 'Compares the orjson renderer and parser with the stock JSON ones'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--meals', type=int, default=100,
+                            help='Number of meals in the rendered page')
+        parser.add_argument('--iterations', type=int, default=20,
+                            help='Number of times the page is rendered and parsed')
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        page = meal_page(options['meals'])
+
+        json_time, expected = measure(lambda: JSONRenderer().render(page), iterations)
+        orjson_time, content = measure(lambda: ORJSONRenderer().render(page), iterations)
+        identical = 'identical' if content == expected else 'DIFFERENT'
+        print(f'render ({len(expected)} bytes): json {json_time * 1000:.2f} ms, '
+              f'orjson {orjson_time * 1000:.2f} ms, '
+              f'{json_time / orjson_time:.1f}x faster, {identical} output')
+
+        json_time, expected = measure(
+            lambda: JSONParser().parse(BytesIO(content)), iterations)
+        orjson_time, data = measure(
+            lambda: ORJSONParser().parse(BytesIO(content)), iterations)
+        identical = 'identical' if data == expected else 'DIFFERENT'
+        print(f'parse: json {json_time * 1000:.2f} ms, '
+              f'orjson {orjson_time * 1000:.2f} ms, '
+              f'{json_time / orjson_time:.1f}x faster, {identical} data')
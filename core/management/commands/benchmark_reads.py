@@ -0,0 +1,55 @@
+import time
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+from diet import rows as diet_rows
+from diet.models import Food, FoodInstance
+from diet.serializers import FoodSerializer, FoodInstanceSerializer
+from gym import rows as gym_rows
+from gym.models import Exercise, ExerciseInstance
+from gym.serializers import ExerciseSerializer, ExerciseInstanceSerializer
+
+# Each endpoint is listed with its queryset, its serializer and its row reader.
+ENDPOINTS = [
+    ('foods', lambda: Food.objects.filter(is_custom=False).order_by('name'),
+     FoodSerializer, diet_rows.food_reader),
+    ('food_instances', lambda: FoodInstance.objects.select_related('food').order_by('id'),
+     FoodInstanceSerializer, diet_rows.food_instance_reader),
+    ('exercises', lambda: Exercise.objects.filter(is_custom=False).order_by('name'),
+     ExerciseSerializer, gym_rows.exercise_reader),
+    ('exercise_instances', lambda: ExerciseInstance.objects.select_related('exercise').order_by('id'),
+     ExerciseInstanceSerializer, gym_rows.exercise_instance_reader),
+]
+
+
+def measure(render, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        content = render()
+    return (time.perf_counter() - start) / iterations, content
+
+
+class Command(BaseCommand):
+    help = 'Compares the serializers with the row readers of the list endpoints'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20,
+                            help='Number of times each list is rendered')
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        renderer = JSONRenderer()
+        for name, get_queryset, serializer_class, reader in ENDPOINTS:
+            count = get_queryset().count()
+            if not count:
+                print(f'{name}: no rows, skipped')
+                continue
+            serializer_time, expected = measure(
+                lambda: renderer.render(serializer_class(get_queryset(), many=True).data),
+                iterations)
+            reader_time, content = measure(
+                lambda: renderer.render(reader.read(reader.values(get_queryset()))),
+                iterations)
+            identical = 'identical' if content == expected else 'DIFFERENT'
+            print(f'{name} ({count} rows): serializer {serializer_time * 1000:.2f} ms, '
+                  f'rows {reader_time * 1000:.2f} ms, '
+                  f'{serializer_time / reader_time:.1f}x faster, {identical} output')
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from core.uploads import clear_expired
+
+
+class Command(BaseCommand):
+    help = 'Deletes completed and expired chunked image uploads'
+
+    def handle(self, *args, **options):
+        print('clearing image uploads...')
+        print(f'{clear_expired()} uploads were cleared.')
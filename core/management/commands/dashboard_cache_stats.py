@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from core import dashboard_cache
+
+
+class Command(BaseCommand):
+    help = 'Shows the hit/miss counters of the trainee dashboard cache'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true',
+                            help='Reset the counters after showing them')
+
+    def handle(self, *args, **options):
+        if not settings.DASHBOARD_CACHE.get('STATS'):
+            print("The counters are off, set DASHBOARD_CACHE['STATS'] to keep them.")
+        stats = dashboard_cache.stats()
+        print(f"hits: {stats['hits']}")
+        print(f"misses: {stats['misses']}")
+        print(f"hit ratio: {stats['hit_ratio']:.2%}")
+        if options['reset']:
+            dashboard_cache.reset_stats()
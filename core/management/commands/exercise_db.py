@@ -1,5 +1,6 @@
 from django.core.management.base import BaseCommand
 from django.db import connection
+from core import catalog
 from pathlib import Path
 import os
 
@@ -15,3 +16,4 @@ class Command(BaseCommand):
 
         with connection.cursor() as cursor:
             cursor.execute(sql)
+        catalog.bump(catalog.EXERCISES)
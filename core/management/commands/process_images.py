@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+from core.images import enqueue_missing, process_batch
+
+
+class Command(BaseCommand):
+    help = 'Generates the queued image renditions'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=20,
+                            help='Number of images claimed at once')
+        parser.add_argument('--max-attempts', type=int, default=3,
+                            help='Number of attempts before a job is marked as failed')
+        parser.add_argument('--backoff', type=int, default=60,
+                            help='Seconds before the first retry, doubled on every further retry')
+        parser.add_argument('--lease', type=int, default=600,
+                            help='Seconds before the images of a batch that was never finished are rendered again')
+        parser.add_argument('--enqueue-missing', action='store_true',
+                            help='First queue every image without up to date renditions')
+
+    def handle(self, *args, **options):
+        if options['enqueue_missing']:
+            print(f'{enqueue_missing()} images were queued.')
+        print('generating image renditions...')
+        counts = {'done': 0, 'retried': 0, 'failed': 0}
+        while True:
+            result = process_batch(options['batch_size'],
+                                   options['max_attempts'],
+                                   options['backoff'],
+                                   options['lease'])
+            if not any(result.values()):
+                break
+            for key, value in result.items():
+                counts[key] += value
+        print(f"{counts['done']} images were processed, {counts['retried']} "
+              f"will be retried and {counts['failed']} failed.")
@@ -0,0 +1,48 @@
+from datetime import date
+from django.core.management.base import BaseCommand
+from core import ledger
+from core.models import Trainee
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds or reconciles the daily ledger of trainees'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--trainee', type=int, action='append', dest='trainee_ids',
+                            help='Only rebuild the ledger of the given trainee id (repeatable)')
+        parser.add_argument('--from', type=date.fromisoformat, dest='start',
+                            help='First day to rebuild (YYYY-MM-DD)')
+        parser.add_argument('--to', type=date.fromisoformat, dest='end',
+                            help='Last day to rebuild (YYYY-MM-DD)')
+        parser.add_argument('--chunk-size', type=int, default=1000,
+                            help='Number of trainees rebuilt per batch')
+        parser.add_argument('--check', action='store_true',
+                            help='Only report the rows that are out of sync')
+
+    def handle(self, *args, **options):
+        if options['check']:
+            print('reconciling the daily ledger...')
+        else:
+            print('rebuilding the daily ledger...')
+
+        trainee_ids = options['trainee_ids']
+        if trainee_ids is None:
+            trainee_ids = Trainee.objects.order_by('id')\
+                .values_list('id', flat=True)
+        trainee_ids = list(trainee_ids)
+
+        counts = {'created': 0, 'updated': 0, 'deleted': 0}
+        chunk_size = options['chunk_size']
+        for index in range(0, len(trainee_ids), chunk_size):
+            chunk = trainee_ids[index:index + chunk_size]
+            result = ledger.sync(chunk, options['start'], options['end'],
+                                 dry_run=options['check'])
+            for key, value in result.items():
+                counts[key] += value
+
+        if options['check']:
+            print(f"{counts['created']} missing, {counts['updated']} stale "
+                  f"and {counts['deleted']} orphaned ledger rows found.")
+        else:
+            print(f"{counts['created']} ledger rows were created, "
+                  f"{counts['updated']} updated and {counts['deleted']} deleted.")
@@ -14,27 +14,27 @@ VALUES
   ('2000-11-07', 186.0, 75.0, 2000.0, 2500, 0.4, 0.4, 0.2, 0, 1, 'H', 'K', 4, 'M', 0, 0, 0),
   ('1995-05-10', 172.0, 70.0, 2000.0, 2500, 0.5, 0.3, 0.2, 1, 3, 'H', 'G', 5, 'F', 0, 0, 0);
   
-INSERT INTO `diet_food` (`name`, `category`, `calories`, `carbs`, `fats`, `protein`) VALUES
-('Grilled chicken breast', 'F', 180.0, 0.0, 4.0, 36.0),
-('Beef steak', 'F', 250.0, 0.0, 15.0, 28.0),
-('Salmon fillet', 'F', 220.0, 0.0, 13.0, 23.0),
-('Brown rice', 'F', 218.0, 46.0, 2.0, 5.0),
-('Quinoa', 'F', 120.0, 21.0, 2.0, 4.0),
-('Lentils', 'F', 230.0, 40.0, 1.5, 18.0),
-('Spinach', 'F', 23.0, 3.6, 0.4, 2.9),
-('Broccoli', 'F', 55.0, 10.0, 1.0, 4.0),
-('Carrots', 'F', 41.0, 10.0, 0.2, 1.0),
-('Apples', 'F', 95.0, 25.0, 0.3, 0.5),
-('Bananas', 'F', 105.0, 27.0, 0.4, 1.3),
-('Almonds', 'F', 575.0, 22.0, 49.0, 21.0),
-('Peanut butter', 'F', 190.0, 6.0, 16.0, 7.0),
-('Greek yogurt', 'F', 100.0, 7.0, 0.4, 18.0),
-('Whey protein powder', 'F', 120.0, 2.0, 1.0, 25.0),
-('Green tea', 'B', 0.0, 0.0, 0.0, 0.0),
-('Black coffee', 'B', 0.0, 0.0, 0.0, 0.0),
-('Orange juice', 'B', 112.0, 26.0, 0.5, 2.0),
-('Water', 'B', 0.0, 0.0, 0.0, 0.0),
-('Salt', 'S', 0.0, 0.0, 0.0, 0.0);
+INSERT INTO `diet_food` (`name`, `category`, `calories`, `carbs`, `fats`, `protein`, `is_custom`, `owner_trainee_id`) VALUES
+('Grilled chicken breast', 'F', 180.0, 0.0, 4.0, 36.0, FALSE, NULL),
+('Beef steak', 'F', 250.0, 0.0, 15.0, 28.0, FALSE, NULL),
+('Salmon fillet', 'F', 220.0, 0.0, 13.0, 23.0, FALSE, NULL),
+('Brown rice', 'F', 218.0, 46.0, 2.0, 5.0, FALSE, NULL),
+('Quinoa', 'F', 120.0, 21.0, 2.0, 4.0, FALSE, NULL),
+('Lentils', 'F', 230.0, 40.0, 1.5, 18.0, FALSE, NULL),
+('Spinach', 'F', 23.0, 3.6, 0.4, 2.9, FALSE, NULL),
+('Broccoli', 'F', 55.0, 10.0, 1.0, 4.0, FALSE, NULL),
+('Carrots', 'F', 41.0, 10.0, 0.2, 1.0, FALSE, NULL),
+('Apples', 'F', 95.0, 25.0, 0.3, 0.5, FALSE, NULL),
+('Bananas', 'F', 105.0, 27.0, 0.4, 1.3, FALSE, NULL),
+('Almonds', 'F', 575.0, 22.0, 49.0, 21.0, FALSE, NULL),
+('Peanut butter', 'F', 190.0, 6.0, 16.0, 7.0, FALSE, NULL),
+('Greek yogurt', 'F', 100.0, 7.0, 0.4, 18.0, TRUE, 4),
+('Whey protein powder', 'F', 120.0, 2.0, 1.0, 25.0, TRUE, 4),
+('Green tea', 'B', 0.0, 0.0, 0.0, 0.0, TRUE, 4),
+('Black coffee', 'B', 0.0, 0.0, 0.0, 0.0, TRUE, 4),
+('Orange juice', 'B', 112.0, 26.0, 0.5, 2.0, TRUE, 5),
+('Water', 'B', 0.0, 0.0, 0.0, 0.0, TRUE, 5),
+('Salt', 'S', 0.0, 0.0, 0.0, 0.0, TRUE, 5);
 
 INSERT INTO diet_custom_food (food_ptr_id, trainee_id) VALUES
     (14, 4),
@@ -85,14 +85,14 @@ VALUES
 
     
 
-INSERT INTO gym_exercise (name, body_part, calories_burned, is_repetitive, image) VALUES
-    ('Bench Press', 'CH', 250.0, TRUE, NULL),
-    ('Deadlift', 'BK', 400.5, FALSE, NULL),
-    ('Bicep Curl', 'AR', 100.0, TRUE, NULL),
-    ('Squat', 'LG', 300.0, FALSE, NULL),
-    ('Treadmill', 'CR', 200.5, TRUE, NULL),
-    ('Shoulder Press', 'SH', 225.0, TRUE, NULL),
-    ('Crunch', 'AB', 75.0, TRUE, NULL);
+INSERT INTO gym_exercise (name, body_part, calories_burned, is_repetitive, image, is_custom, owner_trainee_id) VALUES
+    ('Bench Press', 'CH', 250.0, TRUE, NULL, FALSE, NULL),
+    ('Deadlift', 'BK', 400.5, FALSE, NULL, TRUE, 1),
+    ('Bicep Curl', 'AR', 100.0, TRUE, NULL, TRUE, 2),
+    ('Squat', 'LG', 300.0, FALSE, NULL, TRUE, 2),
+    ('Treadmill', 'CR', 200.5, TRUE, NULL, TRUE, 3),
+    ('Shoulder Press', 'SH', 225.0, TRUE, NULL, TRUE, 3),
+    ('Crunch', 'AB', 75.0, TRUE, NULL, TRUE, 4);
 
 
 
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+from core.mail import send_batch
+
+
+class Command(BaseCommand):
+    help = 'Sends the queued emails of the outbox'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=100,
+                            help='Number of emails sent over one connection')
+        parser.add_argument('--max-attempts', type=int, default=5,
+                            help='Number of attempts before an email is marked as failed')
+        parser.add_argument('--backoff', type=int, default=60,
+                            help='Seconds before the first retry, doubled on every further retry')
+        parser.add_argument('--lease', type=int, default=600,
+                            help='Seconds before the emails of a batch that was never finished are sent again')
+
+    def handle(self, *args, **options):
+        print('sending queued emails...')
+        counts = {'sent': 0, 'retried': 0, 'failed': 0}
+        while True:
+            result = send_batch(options['batch_size'],
+                                options['max_attempts'],
+                                options['backoff'],
+                                options['lease'])
+            if not any(result.values()):
+                break
+            for key, value in result.items():
+                counts[key] += value
+        print(f"{counts['sent']} emails were sent, {counts['retried']} "
+              f"will be retried and {counts['failed']} failed.")
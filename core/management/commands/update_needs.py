@@ -0,0 +1,27 @@
+import time
+from datetime import date
+from django.core.management.base import BaseCommand
+from core.needs import update_needs
+
+
+class Command(BaseCommand):
+    help = 'Recalculates the calories and water needs of all trainees'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--day', type=date.fromisoformat,
+                            help='Day the ages are computed at (YYYY-MM-DD), defaults to today')
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Number of trainees written per UPDATE statement')
+        parser.add_argument('--check', action='store_true',
+                            help='Only report the trainees whose needs are stale')
+
+    def handle(self, *args, **options):
+        print('recalculating needs of all trainees...')
+        started = time.perf_counter()
+        changed = update_needs(options['day'], options['batch_size'],
+                               dry_run=options['check'])
+        elapsed = time.perf_counter() - started
+        if options['check']:
+            print(f'{changed} trainees have stale needs ({elapsed:.2f}s).')
+        else:
+            print(f'{changed} trainees were updated in {elapsed:.2f}s.')
@@ -1,18 +1,30 @@
+import time
+from datetime import date, timedelta
 from django.core.management.base import BaseCommand
-from django.db import transaction
-from core.models import Trainee
+from django.utils import timezone
+from core.streak import update_streaks
 
 
 class Command(BaseCommand):
     help = 'Updates streak of all trainees'
 
+    def add_arguments(self, parser):
+        parser.add_argument('--day', type=date.fromisoformat,
+                            help='Last day counted in the streaks (YYYY-MM-DD), defaults to yesterday')
+        parser.add_argument('--from-flags', action='store_true',
+                            help='Advance streaks from the was_active_today flags instead of the activity bitmaps')
+        parser.add_argument('--chunk-size', type=int, default=0,
+                            help='Number of trainee ids updated per statement (0 updates all at once)')
+        parser.add_argument('--workers', type=int, default=1,
+                            help='Number of chunks updated concurrently, each on its own connection')
+
     def handle(self, *args, **options):
         print('updating streak of all trainees...')
-        with transaction.atomic():
-            for trainee in Trainee.objects.all():
-                if trainee.was_active_today:
-                    trainee.daily_streak += 1
-                    trainee.was_active_today = False
-                else:
-                    trainee.daily_streak = 0
-                trainee.save()
+        day = None
+        if not options['from_flags']:
+            day = options['day'] or timezone.localdate() - timedelta(days=1)
+        started = time.perf_counter()
+        counts = update_streaks(day, options['chunk_size'], options['workers'])
+        elapsed = time.perf_counter() - started
+        print(f"{counts['extended']} streaks were extended and "
+              f"{counts['reset']} reset in {elapsed:.2f}s.")
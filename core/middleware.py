@@ -0,0 +1,51 @@
+from django.http import Http404
+from django.utils.functional import SimpleLazyObject
+from .models import Trainee
+
+
+def get_trainee(request):
+    # Resolves the trainee of the authenticated user once per request. DRF
+    # sets the user it authenticated on the underlying Django request, so the
+    # lookup works the same from views, serializers and permissions. When the
+    # access token carries the trainee's id, the trainee is built from it
+    # without a query, with every other field deferred: that is all the
+    # ownership filters and the rows created for the trainee need.
+    request = getattr(request, '_request', request)
+    if not hasattr(request, '_cached_trainee'):
+        request._cached_trainee = None
+        trainee_id = getattr(request.user, 'trainee_id', None)
+        if trainee_id is not None:
+            request._cached_trainee = Trainee.from_db(
+                None, ['id', 'user_id'], [trainee_id, request.user.id])
+        elif request.user.is_authenticated:
+            request._cached_trainee = Trainee.objects\
+                .filter(user_id=request.user.id).first()
+    return request._cached_trainee
+
+
+def get_trainee_or_404(request):
+    trainee = get_trainee(request)
+    if trainee is None:
+        raise Http404('No Trainee matches the given query.')
+    return trainee
+
+
+def load_trainee(request):
+    # The trainee with every field loaded, for the views that read them.
+    trainee = get_trainee_or_404(request)
+    if trainee.get_deferred_fields():
+        request = getattr(request, '_request', request)
+        trainee = request._cached_trainee = Trainee.objects\
+            .filter(pk=trainee.pk, user_id=trainee.user_id).first()
+        if trainee is None:
+            raise Http404('No Trainee matches the given query.')
+    return trainee
+
+
+class TraineeMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.trainee = SimpleLazyObject(lambda: get_trainee_or_404(request))
+        return self.get_response(request)
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.2 on 2026-10-18 06:38
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyLedger',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('calories', models.BigIntegerField(default=0)),
+                ('carbs', models.DecimalField(decimal_places=1, default=0, max_digits=12)),
+                ('fats', models.DecimalField(decimal_places=1, default=0, max_digits=12)),
+                ('protein', models.DecimalField(decimal_places=1, default=0, max_digits=12)),
+                ('water', models.BigIntegerField(default=0)),
+                ('calories_burned', models.BigIntegerField(default=0)),
+                ('trainee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_ledgers', to='core.trainee')),
+            ],
+            options={
+                'verbose_name': 'Daily Ledger',
+                'verbose_name_plural': 'Daily Ledgers',
+                'db_table': 'core_daily_ledger',
+                'unique_together': {('trainee', 'day')},
+            },
+        ),
+    ]
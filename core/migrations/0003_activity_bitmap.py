@@ -0,0 +1,57 @@
+# Generated by Django 4.2.2 on 2026-10-18 07:24
+
+from datetime import date, timedelta
+from django.db import migrations, models
+import django.db.models.deletion
+from django.utils import timezone
+
+
+def backfill_current_streaks(apps, schema_editor):
+    # Seeds the bitmaps with the days implied by the current streaks, so that
+    # deriving streaks from the bitmaps does not reset them.
+    Trainee = apps.get_model('core', 'Trainee')
+    ActivityBitmap = apps.get_model('core', 'ActivityBitmap')
+    today = timezone.localdate()
+    bitmaps = []
+    for trainee_id, daily_streak, was_active_today in Trainee.objects\
+            .filter(models.Q(daily_streak__gt=0) | models.Q(was_active_today=True))\
+            .values_list('id', 'daily_streak', 'was_active_today'):
+        years = {}
+        days = [today - timedelta(days=offset)
+                for offset in range(1, (daily_streak or 0) + 1)]
+        if was_active_today:
+            days.append(today)
+        for day in days:
+            index = (day - date(day.year, 1, 1)).days
+            years[day.year] = years.get(day.year, 0) | (1 << index)
+        for year, value in years.items():
+            bitmaps.append(ActivityBitmap(
+                trainee_id=trainee_id, year=year,
+                bits=value.to_bytes((value.bit_length() + 7) // 8, 'little')))
+    ActivityBitmap.objects.bulk_create(bitmaps, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_daily_ledger'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ActivityBitmap',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveSmallIntegerField()),
+                ('bits', models.BinaryField(default=b'')),
+                ('trainee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='activity_bitmaps', to='core.trainee')),
+            ],
+            options={
+                'verbose_name': 'Activity Bitmap',
+                'verbose_name_plural': 'Activity Bitmaps',
+                'db_table': 'core_activity_bitmap',
+                'unique_together': {('trainee', 'year')},
+            },
+        ),
+        migrations.RunPython(backfill_current_streaks, migrations.RunPython.noop),
+    ]
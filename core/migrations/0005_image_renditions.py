@@ -0,0 +1,40 @@
+# Generated by Django 4.2.2 on 2026-10-18 07:20
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_outbox_email'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='trainee',
+            name='image_renditions',
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+        migrations.CreateModel(
+            name='ImageJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(max_length=100)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('name', models.CharField(max_length=255)),
+                ('status', models.CharField(choices=[('P', 'Pending'), ('D', 'Done'), ('F', 'Failed')], default='P', max_length=1)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('done_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Image Job',
+                'verbose_name_plural': 'Image Jobs',
+                'db_table': 'core_image_job',
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='core_image__status_532b6a_idx')],
+            },
+        ),
+    ]
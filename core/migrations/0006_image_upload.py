@@ -0,0 +1,34 @@
+# Generated by Django 4.2.2 on 2026-10-18 07:45
+
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_image_renditions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImageUpload',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('filename', models.CharField(max_length=255)),
+                ('size', models.PositiveBigIntegerField()),
+                ('checksum', models.CharField(max_length=64)),
+                ('offset', models.PositiveBigIntegerField(default=0)),
+                ('status', models.CharField(choices=[('U', 'Uploading'), ('C', 'Complete')], default='U', max_length=1)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('trainee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='image_uploads', to='core.trainee')),
+            ],
+            options={
+                'verbose_name': 'Image Upload',
+                'verbose_name_plural': 'Image Uploads',
+                'db_table': 'core_image_upload',
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.2 on 2026-10-18 08:35
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_image_upload'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogVersion',
+            fields=[
+                ('name', models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ('version', models.PositiveIntegerField(default=1)),
+                ('updated_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'verbose_name': 'Catalog Version',
+                'verbose_name_plural': 'Catalog Versions',
+                'db_table': 'core_catalog_version',
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.2 on 2026-10-18 09:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_catalog_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='trainee',
+            name='last_active_on',
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.2 on 2026-10-18 09:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_trainee_last_active_on'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='outboxemail',
+            name='attachments',
+            field=models.JSONField(default=list),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.2 on 2026-10-18 09:12
+
+from django.db import migrations
+
+CHUNK_SIZE = 1000
+
+
+def fill_daily_ledger(apps, schema_editor):
+    # The totals of the meals, waters and workouts logged before the ledger
+    # existed are written the same way rebuild_ledger does, which needs the
+    # diet and gym tables as the current models see them.
+    from core import ledger
+    Trainee = apps.get_model('core', 'Trainee')
+    trainee_ids = list(Trainee.objects.order_by('id')
+                       .values_list('id', flat=True))
+    for index in range(0, len(trainee_ids), CHUNK_SIZE):
+        ledger.sync(trainee_ids[index:index + CHUNK_SIZE])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_outbox_email_attachments'),
+        ('diet', '0005_catalog_discriminator'),
+        ('gym', '0005_catalog_discriminator'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_daily_ledger, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,9 @@
 from datetime import date
+import uuid
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.db import models
 from django.contrib.auth.models import AbstractUser
+from django.utils import timezone
 from .validators import validate_image_size
 
 
@@ -53,6 +55,7 @@ class Trainee(models.Model):
                                         validators=[MinValueValidator(0), MaxValueValidator(1)])
     is_macronutrients_ratios_custom = models.BooleanField(default=False)
     was_active_today = models.BooleanField(default=False, blank=True)
+    last_active_on = models.DateField(null=True, blank=True, editable=False)
     daily_streak = models.SmallIntegerField(
         default=0, blank=True, validators=[MinValueValidator(0)])
     activity_level = models.CharField(max_length=1,
@@ -66,6 +69,7 @@ class Trainee(models.Model):
     image = models.ImageField(
         upload_to='core/images/trainees', null=True, blank=True, validators=[validate_image_size]
     )
+    image_renditions = models.JSONField(null=True, blank=True, editable=False)
     user = models.OneToOneField(User, on_delete=models.CASCADE)
 
     def __str__(self) -> str:
@@ -142,3 +146,149 @@ class Trainee(models.Model):
             self.daily_streak = 0
 
         super().save(*args, **kwargs)
+
+
+class DailyLedger(models.Model):
+    day = models.DateField()
+    calories = models.BigIntegerField(default=0)
+    carbs = models.DecimalField(max_digits=12, decimal_places=1, default=0)
+    fats = models.DecimalField(max_digits=12, decimal_places=1, default=0)
+    protein = models.DecimalField(max_digits=12, decimal_places=1, default=0)
+    water = models.BigIntegerField(default=0)
+    calories_burned = models.BigIntegerField(default=0)
+    trainee = models.ForeignKey(
+        Trainee, on_delete=models.CASCADE, related_name='daily_ledgers'
+    )
+
+    class Meta:
+        db_table = 'core_daily_ledger'
+        verbose_name = "Daily Ledger"
+        verbose_name_plural = "Daily Ledgers"
+        unique_together = [['trainee', 'day']]
+
+    def __str__(self) -> str:
+        return str(self.trainee) + ' / ' + str(self.day)
+
+
+class ActivityBitmap(models.Model):
+    # One bit per day of the year, least significant bit first.
+    year = models.PositiveSmallIntegerField()
+    bits = models.BinaryField(default=b'')
+    trainee = models.ForeignKey(
+        Trainee, on_delete=models.CASCADE, related_name='activity_bitmaps'
+    )
+
+    class Meta:
+        db_table = 'core_activity_bitmap'
+        verbose_name = "Activity Bitmap"
+        verbose_name_plural = "Activity Bitmaps"
+        unique_together = [['trainee', 'year']]
+
+    def __str__(self) -> str:
+        return str(self.trainee) + ' / ' + str(self.year)
+
+
+class OutboxEmail(models.Model):
+    class Status(models.TextChoices):
+        PENDING = 'P', 'Pending'
+        SENT = 'S', 'Sent'
+        FAILED = 'F', 'Failed'
+
+    subject = models.TextField()
+    body = models.TextField()
+    from_email = models.CharField(max_length=255)
+    to = models.JSONField(default=list)
+    cc = models.JSONField(default=list)
+    bcc = models.JSONField(default=list)
+    reply_to = models.JSONField(default=list)
+    headers = models.JSONField(default=dict)
+    alternatives = models.JSONField(default=list)
+    attachments = models.JSONField(default=list)
+    status = models.CharField(max_length=1, choices=Status.choices,
+                              default=Status.PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'core_outbox_email'
+        verbose_name = "Outbox Email"
+        verbose_name_plural = "Outbox Emails"
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+        ]
+
+    def __str__(self) -> str:
+        return self.subject + ' / ' + ', '.join(self.to)
+
+
+class ImageJob(models.Model):
+    class Status(models.TextChoices):
+        PENDING = 'P', 'Pending'
+        DONE = 'D', 'Done'
+        FAILED = 'F', 'Failed'
+
+    model = models.CharField(max_length=100)
+    object_id = models.PositiveBigIntegerField()
+    name = models.CharField(max_length=255)
+    status = models.CharField(max_length=1, choices=Status.choices,
+                              default=Status.PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    done_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'core_image_job'
+        verbose_name = "Image Job"
+        verbose_name_plural = "Image Jobs"
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+        ]
+
+    def __str__(self) -> str:
+        return self.model + ' / ' + str(self.object_id) + ' / ' + self.name
+
+
+class ImageUpload(models.Model):
+    class Status(models.TextChoices):
+        UPLOADING = 'U', 'Uploading'
+        COMPLETE = 'C', 'Complete'
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    filename = models.CharField(max_length=255)
+    size = models.PositiveBigIntegerField()
+    checksum = models.CharField(max_length=64)
+    offset = models.PositiveBigIntegerField(default=0)
+    status = models.CharField(max_length=1, choices=Status.choices,
+                              default=Status.UPLOADING)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    trainee = models.ForeignKey(
+        Trainee, on_delete=models.CASCADE, related_name='image_uploads'
+    )
+
+    class Meta:
+        db_table = 'core_image_upload'
+        verbose_name = "Image Upload"
+        verbose_name_plural = "Image Uploads"
+
+    def __str__(self) -> str:
+        return str(self.trainee) + ' / ' + self.filename
+
+
+class CatalogVersion(models.Model):
+    name = models.CharField(max_length=50, primary_key=True)
+    version = models.PositiveIntegerField(default=1)
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = 'core_catalog_version'
+        verbose_name = "Catalog Version"
+        verbose_name_plural = "Catalog Versions"
+
+    def __str__(self) -> str:
+        return self.name + ' / ' + str(self.version)
@@ -0,0 +1,135 @@
+import numpy as np
+from django.db import transaction
+from django.utils import timezone
+from . import dashboard_cache
+from .models import Trainee
+
+# Vectorized equivalents of Trainee.calculate_daily_calories_needs and
+# Trainee.calculate_daily_water_needs. Every operation is applied in the same
+# order as the model helpers so the float results are identical.
+ACTIVITY_FACTORS = {
+    Trainee.ActivityLevel.TRACKED: 1,
+    Trainee.ActivityLevel.NONE: 1.2,
+    Trainee.ActivityLevel.LOW: 1.375,
+    Trainee.ActivityLevel.MEDIUM: 1.55,
+    Trainee.ActivityLevel.HIGH: 1.725,
+    Trainee.ActivityLevel.EXTRA: 1.9,
+}
+GOAL_FACTORS = {
+    Trainee.Goal.LOSE: 0.9,
+    Trainee.Goal.GAIN: 1.1,
+}
+FIELDS = ['id', 'user_id', 'birthdate', 'gender', 'height', 'weight',
+          'activity_level', 'goal',
+          'daily_calories_needs', 'is_daily_calories_needs_custom',
+          'daily_water_needs', 'is_daily_water_needs_custom']
+
+
+def _ages(birthdates, today):
+    years = birthdates.astype('datetime64[Y]')
+    months = birthdates.astype('datetime64[M]')
+    ages = np.datetime64(today, 'Y').astype(int) - years.astype(int)
+    month = (months - years).astype(int) + 1
+    day = (birthdates - months).astype(int) + 1
+    before_birthday = (today.month < month) | \
+        ((today.month == month) & (today.day < day))
+    return ages - before_birthday
+
+
+def calculate_daily_calories_needs(birthdates, genders, heights, weights,
+                                   activity_levels, goals, today):
+    ages = _ages(birthdates, today)
+    bmr = (10 * weights) + (6.25 * heights) - (5 * ages)
+    bmr = np.where(genders == Trainee.Gender.MALE, bmr + 5, bmr - 161)
+
+    total_calories = bmr.copy()
+    for activity_level, factor in ACTIVITY_FACTORS.items():
+        if activity_level != Trainee.ActivityLevel.TRACKED:
+            selected = activity_levels == activity_level
+            total_calories[selected] = bmr[selected] * factor
+
+    for goal, factor in GOAL_FACTORS.items():
+        selected = goals == goal
+        total_calories[selected] = total_calories[selected] * factor
+    return np.trunc(total_calories).astype(np.int64)
+
+
+def calculate_daily_water_needs(weights):
+    return np.trunc(35 * weights).astype(np.int64)
+
+
+def _load():
+    rows = list(Trainee.objects.order_by('id').values_list(*FIELDS))
+    if not rows:
+        return None
+    columns = dict(zip(FIELDS, zip(*rows)))
+    return {
+        'id': np.array(columns['id'], dtype=np.int64),
+        'user_id': np.array(columns['user_id'], dtype=np.int64),
+        'birthdate': np.array(columns['birthdate'], dtype='datetime64[D]'),
+        'gender': np.array(columns['gender'], dtype=object),
+        'height': np.array(columns['height'], dtype=np.float64),
+        'weight': np.array(columns['weight'], dtype=np.float64),
+        # Trainee.save() falls back to a medium activity level and keeping
+        # the weight when these are blank.
+        'activity_level': np.array([activity_level or Trainee.ActivityLevel.MEDIUM
+                                    for activity_level in columns['activity_level']], dtype=object),
+        'goal': np.array([goal or Trainee.Goal.KEEP
+                          for goal in columns['goal']], dtype=object),
+        'daily_calories_needs': np.array(columns['daily_calories_needs'], dtype=np.int64),
+        'is_daily_calories_needs_custom': np.array(columns['is_daily_calories_needs_custom'], dtype=bool),
+        'daily_water_needs': np.array(columns['daily_water_needs'], dtype=np.int64),
+        'is_daily_water_needs_custom': np.array(columns['is_daily_water_needs_custom'], dtype=bool),
+    }
+
+
+def update_needs(today=None, batch_size=1000, dry_run=False):
+    # Recomputes the needs that Trainee.save() would recompute and writes back
+    # only the rows that changed. Returns the number of changed trainees.
+    today = today or timezone.localdate()
+    trainees = _load()
+    if trainees is None:
+        return 0
+
+    # Needs are recalculated unless custom, and always when unset.
+    calculated_calories = ~trainees['is_daily_calories_needs_custom'] | \
+        (trainees['daily_calories_needs'] == 0)
+    calculated_water = ~trainees['is_daily_water_needs_custom'] | \
+        (trainees['daily_water_needs'] == 0)
+
+    calories_needs = np.where(
+        calculated_calories,
+        calculate_daily_calories_needs(
+            trainees['birthdate'], trainees['gender'],
+            trainees['height'], trainees['weight'],
+            trainees['activity_level'], trainees['goal'], today),
+        trainees['daily_calories_needs'])
+    water_needs = np.where(
+        calculated_water,
+        calculate_daily_water_needs(trainees['weight']),
+        trainees['daily_water_needs'])
+    is_calories_custom = trainees['is_daily_calories_needs_custom'] & ~calculated_calories
+    is_water_custom = trainees['is_daily_water_needs_custom'] & ~calculated_water
+
+    changed = np.flatnonzero(
+        (calories_needs != trainees['daily_calories_needs']) |
+        (water_needs != trainees['daily_water_needs']) |
+        (is_calories_custom != trainees['is_daily_calories_needs_custom']) |
+        (is_water_custom != trainees['is_daily_water_needs_custom']))
+    if dry_run:
+        return len(changed)
+
+    with transaction.atomic():
+        Trainee.objects.bulk_update([
+            Trainee(id=int(trainees['id'][index]),
+                    daily_calories_needs=int(calories_needs[index]),
+                    is_daily_calories_needs_custom=bool(is_calories_custom[index]),
+                    daily_water_needs=int(water_needs[index]),
+                    is_daily_water_needs_custom=bool(is_water_custom[index]))
+            for index in changed
+        ], ['daily_calories_needs', 'is_daily_calories_needs_custom',
+            'daily_water_needs', 'is_daily_water_needs_custom'],
+            batch_size=batch_size)
+    for user_id in trainees['user_id'][changed]:
+        dashboard_cache.bump(int(user_id))
+    return len(changed)
@@ -0,0 +1,36 @@
+from django.db.models import Q
+from rest_framework import serializers
+
+# Foods and exercises are either in the catalog or custom ones of a trainee.
+# A Resolver finds the ones a trainee can use among a batch of ids in a single
+# query on the base table, through its is_custom and owner_trainee columns.
+
+
+class Resolver:
+    def __init__(self, model, message):
+        self.model = model
+        self.message = message
+
+    def resolve(self, ids, trainee):
+        # Returns the usable objects by id. Missing ids are not usable.
+        return self.model.objects\
+            .filter(Q(is_custom=False) | Q(owner_trainee=trainee))\
+            .in_bulk(set(ids))
+
+
+class ResolvedIdField(serializers.IntegerField):
+    # Takes the id of an object the trainee can use and validates to the
+    # object itself, so it is not fetched again when saved.
+    def __init__(self, resolver, **kwargs):
+        self.resolver = resolver
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        id = super().to_internal_value(data)
+        obj = self.resolver.resolve([id], self.context['trainee']).get(id)
+        if obj is None:
+            raise serializers.ValidationError(self.resolver.message)
+        return obj
+
+    def to_representation(self, value):
+        return value.pk
@@ -1,5 +1,108 @@
-from rest_framework.pagination import PageNumberPagination
+import json
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination, PageNumberPagination
 
 
 class DefaultPagination(PageNumberPagination):
     page_size = 100
+
+
+class TimelineCursorPagination(CursorPagination):
+    # Keyset pagination on the view's ordering plus the id. Cursors hold the
+    # (field, id) position of the row next to the page, which is unique, so
+    # pages need no offsets and each one is a single indexed range query.
+    page_size = 100
+
+    def get_ordering(self, request, queryset, view):
+        self.ordering = view.ordering
+        ordering = tuple(super().get_ordering(request, queryset, view))
+        if not any(field.lstrip('-') in ('id', 'pk') for field in ordering):
+            ordering += ('-id' if ordering[0].startswith('-') else 'id',)
+        return ordering
+
+    def get_position(self, instance):
+        field = self.ordering[0].lstrip('-')
+        return json.dumps([str(getattr(instance, field)), instance.pk])
+
+    def filter_position(self, queryset, position, reverse):
+        # The rows after the position, or before it for reverse cursors.
+        try:
+            value, pk = json.loads(position)
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        order = self.ordering[0]
+        field = order.lstrip('-')
+        lookup = 'lt' if reverse != order.startswith('-') else 'gt'
+        return queryset.filter(Q(**{f'{field}__{lookup}': value}) |
+                               Q(**{field: value, f'pk__{lookup}': pk}))
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        reverse = self.cursor is not None and self.cursor.reverse
+        self.position = self.cursor.position if self.cursor is not None else None
+
+        if reverse:
+            queryset = queryset.order_by(*(field[1:] if field.startswith('-') else '-' + field
+                                           for field in self.ordering))
+        else:
+            queryset = queryset.order_by(*self.ordering)
+        if self.position is not None:
+            queryset = self.filter_position(queryset, self.position, reverse)
+
+        results = list(queryset[:self.page_size + 1])
+        self.page = results[:self.page_size]
+        has_more = len(results) > len(self.page)
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = self.position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, self.position is not None
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        position = self.get_position(self.page[-1]) if self.page else self.position
+        return self.encode_cursor(Cursor(offset=0, reverse=False, position=position))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        position = self.get_position(self.page[0]) if self.page else self.position
+        return self.encode_cursor(Cursor(offset=0, reverse=True, position=position))
+
+
+class TimelinePagination(DefaultPagination):
+    # Pages are numbered unless the request has a cursor parameter, which
+    # switches to TimelineCursorPagination. An empty cursor is the first page,
+    # and cursor pages skip the COUNT query of numbered pages.
+    cursor_query_param = TimelineCursorPagination.cursor_query_param
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_pagination = None
+        if self.cursor_query_param not in request.query_params:
+            return super().paginate_queryset(queryset, request, view)
+        self.cursor_pagination = TimelineCursorPagination()
+        page = self.cursor_pagination.paginate_queryset(queryset, request, view)
+        self.display_page_controls = getattr(
+            self.cursor_pagination, 'display_page_controls', False)
+        return page
+
+    def get_paginated_response(self, data):
+        if self.cursor_pagination is not None:
+            return self.cursor_pagination.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def to_html(self):
+        if self.cursor_pagination is not None:
+            return self.cursor_pagination.to_html()
+        return super().to_html()
@@ -0,0 +1,30 @@
+import io
+import orjson
+from django.conf import settings
+from rest_framework.parsers import JSONParser
+from .renderers import ORJSONRenderer
+
+# orjson reads integers beyond 64 bits as floats, so bodies with 20 digits in
+# a row are left to JSONParser.
+DIGITS = bytes(ord('1') if byte in b'0123456789' else ord(' ') for byte in range(256))
+BIG_INTEGER = b'1' * 20
+
+
+class ORJSONParser(JSONParser):
+    # Bodies in other encodings or that orjson cannot parse are left to
+    # JSONParser, which parses them or raises its own ParseError.
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        if encoding.lower().replace('-', '') != 'utf8':
+            return super().parse(stream, media_type, parser_context)
+
+        body = stream.read()
+        if BIG_INTEGER in body.translate(DIGITS):
+            return super().parse(io.BytesIO(body), media_type, parser_context)
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            return super().parse(io.BytesIO(body), media_type, parser_context)
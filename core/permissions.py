@@ -1,8 +1,8 @@
 from rest_framework import permissions
-from .models import Trainee
+from .middleware import get_trainee
 
 
 class IsAuthenticatedAndNotTraineeAndNotAdmin(permissions.BasePermission):
     def has_permission(self, request, view):
-        is_trainee = Trainee.objects.filter(user=request.user.id).exists()
+        is_trainee = get_trainee(request) is not None
         return bool(request.user and request.user.is_authenticated and not is_trainee and not request.user.is_staff)
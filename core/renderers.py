@@ -0,0 +1,45 @@
+from decimal import Decimal
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# orjson renders the same JSON as JSONRenderer with two exceptions. Floats
+# below 1e-4 or from 1e16 on are written in another notation, so responses
+# with them are rendered by JSONRenderer. NaN and infinities, which
+# JSONRenderer refuses, render as null. Decimals and the other types orjson
+# does not know are converted by DRF's encoder, as they always were.
+OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+# Maps 0 to 0, the other digits to 1 and keeps e and dots, so floats in
+# another notation are found with a few substring searches.
+NOTATION = bytes(byte if byte in b'0e.' else ord('1') if byte in b'123456789' else ord(' ')
+                 for byte in range(256))
+encoder_default = JSONEncoder().default
+
+
+def default(obj):
+    # Decimals make up most of the values orjson hands back, so they skip the
+    # checks of DRF's encoder.
+    if type(obj) is Decimal:
+        return float(obj)
+    return encoder_default(obj)
+
+
+class ORJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        # orjson only indents by 2 spaces and has no ASCII-only output.
+        if self.get_indent(accepted_media_type, renderer_context) is not None \
+                or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=default, option=OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        notation = ret.translate(NOTATION)
+        if b'0e' in notation or b'1e' in notation or b'0.0000' in notation:
+            return super().render(data, accepted_media_type, renderer_context)
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
@@ -0,0 +1,48 @@
+import decimal
+from rest_framework.response import Response
+
+# List endpoints whose rows are flat can skip the serializers: their querysets
+# are read with .values_list() and each row is turned into the dict the
+# serializer would have rendered by a plain function, which renders the same
+# JSON without building model instances and serializer fields for each row.
+
+
+class RowReader:
+    def __init__(self, columns, to_dict):
+        self.columns = columns
+        self.to_dict = to_dict
+
+    def values(self, queryset):
+        return queryset.values_list(*self.columns)
+
+    def read(self, rows):
+        to_dict = self.to_dict
+        return [to_dict(*row) for row in rows]
+
+
+def decimal_field(model, name):
+    # Quantizes the values of a DecimalField like the serializers' DecimalField.
+    field = model._meta.get_field(name)
+    exponent = decimal.Decimal(1).scaleb(-field.decimal_places)
+    context = decimal.getcontext().copy()
+    context.prec = field.max_digits
+
+    def quantize(value):
+        return value.quantize(exponent, context=context)
+    return quantize
+
+
+class FastListMixin:
+    # GET lists are read with row_reader unless the request selects its own
+    # ?fields= or ?expand=, which needs the serializers.
+    row_reader = None
+
+    def list(self, request, *args, **kwargs):
+        if self.row_reader is None or self.get_fieldsets() != (None, None):
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.row_reader.values(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.row_reader.read(page))
+        return Response(self.row_reader.read(queryset))
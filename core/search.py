@@ -0,0 +1,143 @@
+from bisect import bisect_left
+import math
+import re
+import threading
+from django.db.models import Case, IntegerField, When
+from rest_framework.filters import SearchFilter
+from rest_framework.settings import api_settings
+from . import catalog
+from .pagination import DefaultPagination
+
+# The names of each catalog are searched with an inverted index kept in
+# memory. It is built on the first search of a process and rebuilt when the
+# catalog version changes. Every word of a query must match a word of the
+# name, either exactly or as its prefix, and names are ranked with BM25.
+K1 = 1.2
+B = 0.75
+# Prefix matches score less than the exact word.
+PREFIX_WEIGHT = 0.5
+TOKEN = re.compile(r'[^\W_]+')
+
+
+def tokenize(text):
+    return TOKEN.findall(text.casefold())
+
+
+class SearchIndex:
+    def __init__(self, documents):
+        # documents are (id, name) pairs.
+        self.postings = {}
+        self.lengths = {}
+        self.names = {}
+        for id, name in documents:
+            self.names[id] = name.casefold()
+            tokens = tokenize(name)
+            self.lengths[id] = len(tokens)
+            for token in tokens:
+                postings = self.postings.setdefault(token, {})
+                postings[id] = postings.get(id, 0) + 1
+        self.vocabulary = sorted(self.postings)
+        self.average_length = sum(self.lengths.values()) / len(self.lengths) \
+            if self.lengths else 0
+
+    def _expand(self, term):
+        # The words of the index that start with term.
+        index = bisect_left(self.vocabulary, term)
+        while index < len(self.vocabulary) and self.vocabulary[index].startswith(term):
+            yield self.vocabulary[index]
+            index += 1
+
+    def _idf(self, token):
+        count = len(self.postings[token])
+        return math.log(1 + (len(self.lengths) - count + 0.5) / (count + 0.5))
+
+    def _score(self, term):
+        scores = {}
+        for token in self._expand(term):
+            weight = self._idf(token) * (1 if token == term else PREFIX_WEIGHT)
+            for id, frequency in self.postings[token].items():
+                norm = 1 - B + B * self.lengths[id] / self.average_length
+                score = weight * frequency * (K1 + 1) / (frequency + K1 * norm)
+                scores[id] = max(scores.get(id, 0), score)
+        return scores
+
+    def search(self, query):
+        # Returns the ids of the matching names with their scores, best first
+        # and in name order for the same score.
+        terms = tokenize(query)
+        if not terms:
+            return []
+        totals = None
+        for term in dict.fromkeys(terms):
+            scores = self._score(term)
+            if totals is None:
+                totals = scores
+            else:
+                totals = {id: total + scores[id] for id, total in totals.items()
+                          if id in scores}
+            if not totals:
+                return []
+        return sorted(totals.items(), key=lambda item: (
+            -round(item[1], 6), self.names[item[0]], item[0]))
+
+
+_indexes = {}
+_lock = threading.Lock()
+
+
+def clear():
+    with _lock:
+        _indexes.clear()
+
+
+def get_index(version, queryset):
+    # version is the catalog's CatalogVersion, queryset the names to index.
+    # Searches keep using the current index while a new one is built.
+    key = (version.version, version.updated_at)
+    entry = _indexes.get(version.name)
+    if entry is not None and entry[0] == key:
+        return entry[1]
+    index = SearchIndex(queryset.values_list('id', 'name'))
+    with _lock:
+        entry = _indexes.get(version.name)
+        # An index of a newer version built meanwhile is kept.
+        if entry is None or entry[0] <= key:
+            _indexes[version.name] = (key, index)
+    return index
+
+
+class CatalogSearchFilter(SearchFilter):
+    # ?search= for the catalog views. Matches are filtered by primary key and,
+    # unless the request has its own ordering, their ranking is left on the
+    # view for CatalogSearchPagination.
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, '')
+        if not tokenize(query):
+            return queryset
+
+        version = getattr(view, 'catalog_version', None) or catalog.get_version(view.catalog)
+        results = get_index(version, view.get_queryset()).search(query)
+        if not results:
+            return queryset.none()
+        ids = [id for id, _ in results]
+        if not request.query_params.get(api_settings.ORDERING_PARAM):
+            view.search_ranking = ids
+        return queryset.filter(id__in=ids)
+
+
+class CatalogSearchPagination(DefaultPagination):
+    # Pages of ranked searches are cut from the ranking, so the database only
+    # reads and orders the rows of the page.
+    def paginate_queryset(self, queryset, request, view=None):
+        ranking = getattr(view, 'search_ranking', None)
+        if ranking is None:
+            return super().paginate_queryset(queryset, request, view)
+        # Other filters of the request may have left out some of the matches.
+        matched = set(queryset.order_by().values_list('id', flat=True))
+        ids = super().paginate_queryset([id for id in ranking if id in matched],
+                                        request, view)
+        if not ids:
+            return ids
+        position = Case(*(When(id=id, then=index) for index, id in enumerate(ids)),
+                        output_field=IntegerField())
+        return list(queryset.filter(id__in=ids).order_by(position))
@@ -1,10 +1,16 @@
-from datetime import date
+from datetime import timedelta
+import os
+import re
 from decimal import Decimal
+from django.utils import timezone
 from rest_framework import serializers
 from djoser.serializers import UserCreateSerializer as BaseUserCreateSerializer, UserSerializer as BaseUserSerializer
-from diet.models import Meal, Water
-from gym.models import PerformedWorkout
-from .models import Trainee
+from .images import rendition_urls
+from .ledger import get_day_totals
+from PIL import Image
+from .models import ImageUpload, Trainee
+from .uploads import TARGETS, create_part
+from .validators import MAX_IMAGE_SIZE_MB
 
 
 class UserCreateSerializer(BaseUserCreateSerializer):
@@ -21,6 +27,7 @@ class UserSerializer(BaseUserSerializer):
 
 
 class TraineeSerializer(serializers.ModelSerializer):
+    image_renditions = serializers.SerializerMethodField()
     daily_calories_needs = serializers.IntegerField(read_only=True)
     daily_water_needs = serializers.IntegerField(read_only=True)
     carbs_ratio = serializers.DecimalField(
@@ -40,83 +47,31 @@ class TraineeSerializer(serializers.ModelSerializer):
     fats_needs = serializers.SerializerMethodField(read_only=True)
     protein_needs = serializers.SerializerMethodField(read_only=True)
 
+    def get_today_totals(self, trainee: Trainee):
+        if not hasattr(self, '_today_totals'):
+            self._today_totals = {}
+        if trainee.pk not in self._today_totals:
+            self._today_totals[trainee.pk] = get_day_totals(
+                trainee, timezone.localdate())
+        return self._today_totals[trainee.pk]
+
     def get_calories_intake_today(self, trainee: Trainee):
-        total_calories = 0
-        today = date.today()
-        meals_today = Meal.objects.filter(
-            trainee=trainee, time_eaten__date=today)
-
-        if not meals_today:
-            return total_calories
-        else:
-            for meal in meals_today:
-                total_calories += meal.get_total_calories()
-            return int(total_calories)
+        return self.get_today_totals(trainee)['calories']
 
     def get_carbs_intake_today(self, trainee: Trainee):
-        total_carbs = 0
-        today = date.today()
-        meals_today = Meal.objects.filter(
-            trainee=trainee, time_eaten__date=today)
-
-        if not meals_today:
-            return round(total_carbs, 1)
-        else:
-            for meal in meals_today:
-                total_carbs += meal.get_total_carbs()
-            return round(total_carbs, 1)
+        return self.get_today_totals(trainee)['carbs']
 
     def get_fats_intake_today(self, trainee: Trainee):
-        total_fats = 0
-        today = date.today()
-        meals_today = Meal.objects.filter(
-            trainee=trainee, time_eaten__date=today)
-
-        if not meals_today:
-            return round(total_fats, 1)
-        else:
-            for meal in meals_today:
-                total_fats += meal.get_total_fats()
-            return round(total_fats, 1)
+        return self.get_today_totals(trainee)['fats']
 
     def get_protein_intake_today(self, trainee: Trainee):
-        total_protein = 0
-        today = date.today()
-        meals_today = Meal.objects.filter(
-            trainee=trainee, time_eaten__date=today)
-
-        if not meals_today:
-            return round(total_protein, 1)
-        else:
-            for meal in meals_today:
-                total_protein += meal.get_total_protein()
-            return round(total_protein, 1)
+        return self.get_today_totals(trainee)['protein']
 
     def get_calories_burned_today(self, trainee: Trainee):
-        total_calories = 0
-        today = date.today()
-        performed_workout_today = PerformedWorkout.objects.filter(
-            trainee=trainee, time_performed__date=today)
-
-        if not performed_workout_today:
-            return total_calories
-        else:
-            for performed_workout in performed_workout_today:
-                total_calories += performed_workout.get_total_calories()
-            return int(total_calories)
+        return self.get_today_totals(trainee)['calories_burned']
 
     def get_water_intake_today(self, trainee: Trainee):
-        total_water = 0
-        today = date.today()
-        waters_today = Water.objects.filter(
-            trainee=trainee, drinking_date=today)
-
-        if not waters_today:
-            return total_water
-        else:
-            for water in waters_today:
-                total_water += water.amount
-            return int(total_water)
+        return self.get_today_totals(trainee)['water']
 
     def get_carbs_needs(self, trainee: Trainee):
         return Decimal(round(trainee.daily_calories_needs * trainee.carbs_ratio / 4, 1))
@@ -127,6 +82,9 @@ class TraineeSerializer(serializers.ModelSerializer):
     def get_protein_needs(self, trainee: Trainee):
         return Decimal(round(trainee.daily_calories_needs * trainee.protein_ratio / 4, 1))
 
+    def get_image_renditions(self, trainee: Trainee):
+        return rendition_urls(trainee)
+
     class Meta:
         model = Trainee
         fields = ['birthdate', 'gender', 'height', 'weight', 'daily_calories_needs',
@@ -135,7 +93,40 @@ class TraineeSerializer(serializers.ModelSerializer):
                   'carbs_ratio', 'fats_ratio', 'protein_ratio',
                   'carbs_needs', 'fats_needs', 'protein_needs',
                   'carbs_intake_today', 'fats_intake_today', 'protein_intake_today',
-                  'activity_level', 'goal', 'daily_streak', 'image']
+                  'activity_level', 'goal', 'daily_streak',
+                  'image', 'image_renditions']
+
+
+class TraineeHistoryRangeSerializer(serializers.Serializer):
+    MAX_DAYS = 366
+    DEFAULT_DAYS = 7
+
+    def get_fields(self):
+        return {
+            'from': serializers.DateField(required=False),
+            'to': serializers.DateField(required=False),
+        }
+
+    def validate(self, attrs):
+        end = attrs.get('to') or timezone.localdate()
+        start = attrs.get('from') or end - timedelta(days=self.DEFAULT_DAYS - 1)
+        if start > end:
+            raise serializers.ValidationError(
+                {'from': 'Must not be after to.'})
+        if (end - start).days >= self.MAX_DAYS:
+            raise serializers.ValidationError(
+                {'from': f'History is limited to {self.MAX_DAYS} days.'})
+        return {'from': start, 'to': end}
+
+
+class TraineeHistorySerializer(serializers.Serializer):
+    day = serializers.DateField()
+    calories = serializers.IntegerField()
+    carbs = serializers.DecimalField(max_digits=12, decimal_places=1)
+    fats = serializers.DecimalField(max_digits=12, decimal_places=1)
+    protein = serializers.DecimalField(max_digits=12, decimal_places=1)
+    water = serializers.IntegerField()
+    calories_burned = serializers.IntegerField()
 
 
 class TraineeCreateUpdateSerializer(serializers.ModelSerializer):
@@ -179,3 +170,51 @@ class TraineeUpdateMacronutrientsRatiosSerializer(serializers.ModelSerializer):
             )
 
         return super().validate(attrs)
+
+
+class ImageUploadSerializer(serializers.ModelSerializer):
+    offset = serializers.IntegerField(read_only=True)
+    status = serializers.CharField(read_only=True)
+
+    def validate_filename(self, filename):
+        filename = os.path.basename(filename)
+        extension = os.path.splitext(filename)[1].lower()
+        Image.init()
+        if extension not in Image.EXTENSION:
+            raise serializers.ValidationError(
+                'Upload a valid image.')
+        return filename
+
+    def validate_size(self, size):
+        if size < 1 or size > MAX_IMAGE_SIZE_MB * (2 ** 20):
+            raise serializers.ValidationError(
+                f'Images cannot be larger than {MAX_IMAGE_SIZE_MB}MB!')
+        return size
+
+    def validate_checksum(self, checksum):
+        checksum = checksum.lower()
+        if not re.fullmatch('[0-9a-f]{64}', checksum):
+            raise serializers.ValidationError(
+                'Checksums are hex encoded SHA-256 digests.')
+        return checksum
+
+    class Meta:
+        model = ImageUpload
+        fields = ['id', 'filename', 'size', 'checksum', 'offset', 'status']
+
+    def create(self, validated_data):
+        trainee = self.context['trainee']
+        upload = ImageUpload.objects.create(trainee=trainee, **validated_data)
+        create_part(upload)
+        return upload
+
+
+class ImageUploadCompleteSerializer(serializers.Serializer):
+    target = serializers.ChoiceField(choices=list(TARGETS))
+    id = serializers.IntegerField(required=False)
+
+    def validate(self, attrs):
+        if attrs['target'] != 'trainee' and 'id' not in attrs:
+            raise serializers.ValidationError(
+                {'id': 'This field is required.'})
+        return attrs
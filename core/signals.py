@@ -0,0 +1,295 @@
+from django.db.models import Q, QuerySet
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete, m2m_changed
+from django.dispatch import receiver
+from diet.models import Food, CustomFood, Recipe, Meal, FoodInstance, Water
+from gym.models import Exercise, CustomExercise, Workout, PerformedWorkout, ExerciseInstance
+from . import catalog, images, ledger
+from .models import User, Trainee
+
+# Keeps core.DailyLedger in sync with every write that changes the totals of
+# a trainee's day. Deletions cascading from a parent are handled by the
+# parent's handlers, and everything is skipped when the trainee is deleted.
+
+
+def _cascades_from(origin, *models):
+    model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return issubclass(model, (User, Trainee) + models)
+
+
+def _meal_days(meals):
+    return list(meals.values_list('trainee_id', 'eaten_on'))
+
+
+def _performed_workout_days(performed_workouts):
+    return list(performed_workouts.values_list('trainee_id', 'performed_on'))
+
+
+def _remember_previous(instance, model, field):
+    instance._ledger_previous = None
+    if instance.pk:
+        instance._ledger_previous = model.objects\
+            .filter(pk=instance.pk)\
+            .values('trainee_id', field)\
+            .first()
+
+
+def _remember_parents(instance, model, *fields):
+    instance._ledger_parents = {}
+    if instance.pk:
+        instance._ledger_parents = model.objects\
+            .filter(pk=instance.pk)\
+            .values(*fields)\
+            .first() or {}
+
+
+def _parent_ids(instance, field):
+    # The parent of the instance and, after a save that moved it, its
+    # previous parent.
+    previous = getattr(instance, '_ledger_parents', {})
+    return {getattr(instance, field), previous.get(field)} - {None}
+
+
+def _previous_day(instance, field):
+    previous = getattr(instance, '_ledger_previous', None)
+    if previous is None or previous[field] is None:
+        return []
+    return [(previous['trainee_id'], previous[field])]
+
+
+@receiver(pre_save, sender=FoodInstance)
+def remember_food_instance_parents(sender, instance, **kwargs):
+    _remember_parents(instance, FoodInstance, 'meal_id', 'recipe_id')
+
+
+@receiver(post_save, sender=FoodInstance)
+@receiver(post_delete, sender=FoodInstance)
+def refresh_food_instance_ledger(sender, instance, origin=None, **kwargs):
+    if _cascades_from(origin, Meal, Recipe, CustomFood):
+        return
+    condition = Q()
+    meal_ids = _parent_ids(instance, 'meal_id')
+    if meal_ids:
+        condition |= Q(id__in=meal_ids)
+    recipe_ids = _parent_ids(instance, 'recipe_id')
+    if recipe_ids:
+        condition |= Q(recipes__in=recipe_ids)
+    instance._ledger_parents = {}
+    if condition:
+        ledger.refresh_many(_meal_days(Meal.objects.filter(condition)))
+
+
+@receiver(pre_save, sender=Meal)
+def remember_meal_day(sender, instance, **kwargs):
+    _remember_previous(instance, Meal, 'eaten_on')
+
+
+@receiver(post_save, sender=Meal)
+def refresh_meal_ledger(sender, instance, created, **kwargs):
+    if created:
+        return
+    ledger.refresh_many(_previous_day(instance, 'eaten_on') +
+                        [(instance.trainee_id, instance.eaten_on)])
+
+
+@receiver(post_delete, sender=Meal)
+def refresh_deleted_meal_ledger(sender, instance, origin=None, **kwargs):
+    if _cascades_from(origin):
+        return
+    ledger.refresh(instance.trainee_id,
+                   [instance.eaten_on])
+
+
+@receiver(m2m_changed, sender=Meal.recipes.through)
+def refresh_meal_recipes_ledger(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse and action == 'pre_clear':
+        instance._ledger_days = _meal_days(instance.meals.all())
+        return
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        ledger.refresh(instance.trainee_id,
+                       [instance.eaten_on])
+    elif action == 'post_clear':
+        ledger.refresh_many(getattr(instance, '_ledger_days', []))
+    else:
+        ledger.refresh_many(_meal_days(Meal.objects.filter(id__in=pk_set)))
+
+
+@receiver(pre_delete, sender=Recipe)
+def remember_recipe_days(sender, instance, origin=None, **kwargs):
+    instance._ledger_days = []
+    if not _cascades_from(origin):
+        instance._ledger_days = _meal_days(instance.meals.all())
+
+
+@receiver(post_delete, sender=Recipe)
+def refresh_deleted_recipe_ledger(sender, instance, **kwargs):
+    ledger.refresh_many(getattr(instance, '_ledger_days', []))
+
+
+@receiver(pre_delete, sender=CustomFood)
+def remember_custom_food_days(sender, instance, origin=None, **kwargs):
+    instance._ledger_days = []
+    if not _cascades_from(origin):
+        instance._ledger_days = _meal_days(Meal.objects.filter(
+            Q(food_instances__food=instance) |
+            Q(recipes__food_instances__food=instance)).distinct())
+
+
+# Editing a global food changes the totals of every meal using it, just like
+# editing a custom one.
+@receiver(post_save, sender=Food)
+@receiver(post_save, sender=CustomFood)
+def refresh_food_ledger(sender, instance, created, **kwargs):
+    if created:
+        return
+    remember_custom_food_days(sender, instance)
+    ledger.refresh_many(instance._ledger_days)
+
+
+@receiver(post_delete, sender=CustomFood)
+def refresh_deleted_custom_food_ledger(sender, instance, **kwargs):
+    ledger.refresh_many(getattr(instance, '_ledger_days', []))
+
+
+@receiver(pre_save, sender=Water)
+def remember_water_day(sender, instance, **kwargs):
+    _remember_previous(instance, Water, 'drinking_date')
+
+
+@receiver(post_save, sender=Water)
+def refresh_water_ledger(sender, instance, **kwargs):
+    ledger.refresh_many(_previous_day(instance, 'drinking_date') +
+                        [(instance.trainee_id, instance.drinking_date)])
+
+
+@receiver(post_delete, sender=Water)
+def refresh_deleted_water_ledger(sender, instance, origin=None, **kwargs):
+    if _cascades_from(origin):
+        return
+    ledger.refresh(instance.trainee_id, [instance.drinking_date])
+
+
+@receiver(pre_save, sender=ExerciseInstance)
+def remember_exercise_instance_parents(sender, instance, **kwargs):
+    _remember_parents(instance, ExerciseInstance, 'performed_workout_id', 'workout_id')
+
+
+@receiver(post_save, sender=ExerciseInstance)
+@receiver(post_delete, sender=ExerciseInstance)
+def refresh_exercise_instance_ledger(sender, instance, origin=None, **kwargs):
+    if _cascades_from(origin, PerformedWorkout, Workout, CustomExercise):
+        return
+    condition = Q()
+    performed_workout_ids = _parent_ids(instance, 'performed_workout_id')
+    if performed_workout_ids:
+        condition |= Q(id__in=performed_workout_ids)
+    workout_ids = _parent_ids(instance, 'workout_id')
+    if workout_ids:
+        condition |= Q(workouts__in=workout_ids)
+    instance._ledger_parents = {}
+    if condition:
+        ledger.refresh_many(_performed_workout_days(
+            PerformedWorkout.objects.filter(condition)))
+
+
+@receiver(pre_save, sender=PerformedWorkout)
+def remember_performed_workout_day(sender, instance, **kwargs):
+    _remember_previous(instance, PerformedWorkout, 'performed_on')
+
+
+@receiver(post_save, sender=PerformedWorkout)
+def refresh_performed_workout_ledger(sender, instance, created, **kwargs):
+    if created:
+        return
+    ledger.refresh_many(_previous_day(instance, 'performed_on') +
+                        [(instance.trainee_id, instance.performed_on)])
+
+
+@receiver(post_delete, sender=PerformedWorkout)
+def refresh_deleted_performed_workout_ledger(sender, instance, origin=None, **kwargs):
+    if _cascades_from(origin):
+        return
+    ledger.refresh(instance.trainee_id,
+                   [instance.performed_on])
+
+
+@receiver(m2m_changed, sender=PerformedWorkout.workouts.through)
+def refresh_performed_workout_workouts_ledger(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse and action == 'pre_clear':
+        instance._ledger_days = _performed_workout_days(
+            instance.performed_workouts.all())
+        return
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        ledger.refresh(instance.trainee_id,
+                       [instance.performed_on])
+    elif action == 'post_clear':
+        ledger.refresh_many(getattr(instance, '_ledger_days', []))
+    else:
+        ledger.refresh_many(_performed_workout_days(
+            PerformedWorkout.objects.filter(id__in=pk_set)))
+
+
+@receiver(pre_delete, sender=Workout)
+def remember_workout_days(sender, instance, origin=None, **kwargs):
+    instance._ledger_days = []
+    if not _cascades_from(origin):
+        instance._ledger_days = _performed_workout_days(
+            instance.performed_workouts.all())
+
+
+@receiver(post_delete, sender=Workout)
+def refresh_deleted_workout_ledger(sender, instance, **kwargs):
+    ledger.refresh_many(getattr(instance, '_ledger_days', []))
+
+
+@receiver(pre_delete, sender=CustomExercise)
+def remember_custom_exercise_days(sender, instance, origin=None, **kwargs):
+    instance._ledger_days = []
+    if not _cascades_from(origin):
+        instance._ledger_days = _performed_workout_days(PerformedWorkout.objects.filter(
+            Q(exercise_instances__exercise=instance) |
+            Q(workouts__exercise_instances__exercise=instance)).distinct())
+
+
+@receiver(post_save, sender=Exercise)
+@receiver(post_save, sender=CustomExercise)
+def refresh_exercise_ledger(sender, instance, created, **kwargs):
+    if created:
+        return
+    remember_custom_exercise_days(sender, instance)
+    ledger.refresh_many(instance._ledger_days)
+
+
+@receiver(post_delete, sender=CustomExercise)
+def refresh_deleted_custom_exercise_ledger(sender, instance, **kwargs):
+    ledger.refresh_many(getattr(instance, '_ledger_days', []))
+
+
+# Bumps the catalog versions. Deleting a custom food or exercise also deletes
+# its parent row, which is not part of the catalog.
+@receiver(post_save, sender=Food)
+@receiver(post_save, sender=Exercise)
+def bump_saved_catalog(sender, instance, raw=False, **kwargs):
+    catalog.bump_for(instance)
+
+
+@receiver(post_delete, sender=Food)
+@receiver(post_delete, sender=Exercise)
+def bump_deleted_catalog(sender, instance, origin=None, **kwargs):
+    if not _cascades_from(origin, CustomFood, CustomExercise):
+        catalog.bump_for(instance)
+
+
+# Queues the renditions of new and replaced images. Saving subclasses such as
+# CustomFood sends the signal with the subclass as sender, so they are
+# connected too.
+def enqueue_image_renditions(sender, instance, raw=False, **kwargs):
+    if not raw:
+        images.enqueue(instance)
+
+
+for model in images.image_senders():
+    post_save.connect(enqueue_image_renditions, sender=model)
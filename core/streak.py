@@ -0,0 +1,78 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from django.db import connection, transaction
+from django.db.models import F, Max, Min
+from . import activity
+from .models import Trainee
+
+MAX_STREAK = 32767
+
+
+# By default streaks are derived from the activity bitmaps: every trainee's
+# streak becomes the run of active days ending on the given day. The flag
+# based engine advances streaks with two set-based UPDATEs instead: inactive
+# trainees lose their streak first, then active trainees extend it. Either
+# way the flags are cleared for the new day.
+def _update_range_from_flags(trainees):
+    with transaction.atomic():
+        reset = trainees\
+            .filter(was_active_today=False, daily_streak__gt=0)\
+            .update(daily_streak=0)
+        extended = trainees\
+            .filter(was_active_today=True)\
+            .update(daily_streak=F('daily_streak') + 1, was_active_today=False)
+    return {'extended': extended, 'reset': reset}
+
+
+def _update_range_from_activity(day, trainees):
+    with transaction.atomic():
+        current = dict(trainees.values_list('id', 'daily_streak'))
+        streaks = activity.current_streaks(day, current)
+        changed = []
+        counts = {'extended': 0, 'reset': 0}
+        for trainee_id, daily_streak in current.items():
+            streak = min(streaks.get(trainee_id, 0), MAX_STREAK)
+            if streak != daily_streak:
+                changed.append(Trainee(id=trainee_id, daily_streak=streak))
+                counts['extended' if streak else 'reset'] += 1
+        Trainee.objects.bulk_update(changed, ['daily_streak'], batch_size=1000)
+        trainees.filter(was_active_today=True).update(was_active_today=False)
+    return counts
+
+
+def _in_thread(update_range, trainees):
+    try:
+        return update_range(trainees)
+    finally:
+        connection.close()
+
+
+def _ranges(chunk_size):
+    bounds = Trainee.objects.aggregate(first=Min('id'), last=Max('id'))
+    if bounds['first'] is None:
+        return []
+    if not chunk_size:
+        return [Trainee.objects.all()]
+    return [Trainee.objects.filter(id__gte=start, id__lt=start + chunk_size)
+            for start in range(bounds['first'], bounds['last'] + 1, chunk_size)]
+
+
+def update_streaks(day=None, chunk_size=None, workers=1):
+    if day is None:
+        update_range = _update_range_from_flags
+    else:
+        update_range = partial(_update_range_from_activity, day)
+
+    ranges = _ranges(chunk_size)
+    if workers > 1 and len(ranges) > 1:
+        # Every thread runs its ranges on its own database connection.
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(partial(_in_thread, update_range), ranges))
+    else:
+        results = [update_range(trainees) for trainees in ranges]
+
+    counts = {'extended': 0, 'reset': 0}
+    for result in results:
+        for key, value in result.items():
+            counts[key] += value
+    return counts
@@ -1,9 +1,17 @@
+from django.core.cache import cache
 from model_bakery import baker
 from rest_framework.test import APIClient
 import pytest
+from core.catalog import response_cache
 from core.models import User, Trainee
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    response_cache.clear()
+
+
 @pytest.fixture
 def api_client():
     return APIClient()
@@ -0,0 +1,82 @@
+from datetime import date, timedelta
+from django.utils import timezone
+from model_bakery import baker
+import pytest
+from core import activity
+from core.models import ActivityBitmap, Trainee
+
+
+def record_days(trainee, *days):
+    for day in days:
+        activity.record(trainee.id, day)
+
+
+@pytest.mark.django_db
+class TestActivityBitmap:
+    def test_record_sets_one_bit_per_day(self):
+        trainee = baker.make(Trainee)
+
+        assert activity.record(trainee.id, date(2024, 1, 1)) is True
+        assert activity.record(trainee.id, date(2024, 1, 1)) is False
+        record_days(trainee, date(2024, 1, 10))
+
+        bitmap = ActivityBitmap.objects.get(trainee=trainee, year=2024)
+        assert bytes(bitmap.bits) == (1 | 1 << 9).to_bytes(2, 'little')
+        assert activity.is_active(trainee.id, date(2024, 1, 10))
+        assert not activity.is_active(trainee.id, date(2024, 1, 9))
+
+    def test_active_days_counts_a_window_across_years(self):
+        trainee = baker.make(Trainee)
+        record_days(trainee, date(2023, 12, 30), date(2023, 12, 31),
+                    date(2024, 1, 1), date(2024, 3, 1))
+
+        assert activity.active_days(trainee.id, date(2023, 12, 31), date(2024, 2, 29)) == 2
+        assert activity.active_days(trainee.id, date(2023, 1, 1), date(2024, 12, 31)) == 4
+
+    def test_current_streak_spans_years(self):
+        trainee = baker.make(Trainee)
+        start = date(2023, 12, 20)
+        record_days(trainee, *(start + timedelta(days=offset) for offset in range(20)))
+        record_days(trainee, date(2023, 12, 10))
+
+        assert activity.current_streak(trainee.id, date(2024, 1, 8)) == 20
+        assert activity.current_streak(trainee.id, date(2024, 1, 9)) == 0
+
+    def test_longest_streak(self):
+        trainee = baker.make(Trainee)
+        record_days(trainee, date(2022, 12, 31), date(2023, 1, 1), date(2023, 1, 2),
+                    date(2023, 6, 1), date(2024, 2, 1), date(2024, 2, 2))
+
+        assert activity.longest_streak(trainee.id) == 3
+
+    def test_retention(self):
+        trainees = baker.make(Trainee, _quantity=3)
+        record_days(trainees[0], date(2024, 1, 1), date(2024, 2, 1))
+        record_days(trainees[1], date(2024, 1, 5))
+        record_days(trainees[2], date(2024, 2, 3))
+
+        result = activity.retention(date(2024, 1, 1), date(2024, 1, 7),
+                                    date(2024, 2, 1), date(2024, 2, 7))
+
+        assert result == {'cohort': 2, 'retained': 1}
+
+    def test_mark_active_records_today(self):
+        trainee = baker.make(Trainee, was_active_today=False)
+
+        activity.mark_active(trainee)
+
+        assert activity.current_streak(trainee.id, timezone.localdate()) == 1
+
+    def test_mark_active_records_today_before_the_streak_update(self):
+        trainee = baker.make(Trainee, was_active_today=True)
+
+        activity.mark_active(trainee)
+
+        assert activity.is_active(trainee.id, timezone.localdate())
+
+    def test_mark_active_writes_once_a_day(self, django_assert_num_queries):
+        trainee = baker.make(Trainee, was_active_today=False)
+        activity.mark_active(trainee)
+
+        with django_assert_num_queries(0):
+            activity.mark_active(trainee)
@@ -0,0 +1,123 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+import pytest
+from core.models import Trainee, User
+from diet.models import Meal
+
+
+def user_lookups(queries):
+    return [query for query in queries if 'FROM "core_user"' in query['sql']]
+
+
+def trainee_lookups(queries):
+    return [query for query in queries if 'FROM "core_trainee"' in query['sql']]
+
+
+@pytest.fixture
+def trainee():
+    trainee = baker.make(Trainee)
+    trainee.user.set_password('a-Passw0rd')
+    trainee.user.save()
+    return trainee
+
+
+@pytest.fixture
+def create_tokens(api_client):
+    def do_create_tokens(user):
+        response = api_client.post('/auth/jwt/create/', {
+            'username': user.username, 'password': 'a-Passw0rd'})
+        return response.data
+    return do_create_tokens
+
+
+@pytest.fixture
+def refresh_tokens(api_client):
+    def do_refresh_tokens(refresh):
+        return api_client.post('/auth/jwt/refresh/', {'refresh': refresh})
+    return do_refresh_tokens
+
+
+@pytest.mark.django_db
+class TestTraineeJWTAuthentication:
+    def test_access_token_carries_claims(self, trainee, create_tokens):
+        access = AccessToken(create_tokens(trainee.user)['access'])
+
+        assert access['user_id'] == trainee.user.id
+        assert access['trainee_id'] == trainee.id
+        assert access['is_staff'] is False
+        assert access['is_active'] is True
+
+    def test_safe_requests_do_not_load_the_user(self, api_client, trainee, create_tokens):
+        api_client.credentials(
+            HTTP_AUTHORIZATION='JWT ' + create_tokens(trainee.user)['access'])
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get('/diet/meals/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert user_lookups(context.captured_queries) == []
+
+    def test_safe_requests_do_not_load_the_trainee(self, api_client, trainee, create_tokens):
+        meal = baker.make(Meal, trainee=trainee)
+        baker.make(Meal)
+        api_client.credentials(
+            HTTP_AUTHORIZATION='JWT ' + create_tokens(trainee.user)['access'])
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get('/diet/meals/', {'cursor': ''})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [result['id'] for result in response.data['results']] == [meal.id]
+        assert trainee_lookups(context.captured_queries) == []
+
+    def test_trainee_views_load_the_trainee(self, api_client, trainee, create_tokens):
+        Trainee.objects.filter(pk=trainee.pk).update(daily_water_needs=1234)
+        api_client.credentials(
+            HTTP_AUTHORIZATION='JWT ' + create_tokens(trainee.user)['access'])
+
+        response = api_client.get('/core/trainees/me/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['daily_water_needs'] == 1234
+
+    def test_tokens_without_a_trainee_look_it_up(self, api_client, create_tokens):
+        user = baker.make(User)
+        user.set_password('a-Passw0rd')
+        user.save()
+        access = create_tokens(user)['access']
+        trainee = baker.make(Trainee, user=user)
+        meal = baker.make(Meal, trainee=trainee)
+        api_client.credentials(HTTP_AUTHORIZATION='JWT ' + access)
+
+        response = api_client.get('/diet/meals/')
+
+        assert [result['id'] for result in response.data['results']] == [meal.id]
+
+    def test_write_requests_check_the_user(self, api_client, trainee, create_tokens):
+        api_client.credentials(
+            HTTP_AUTHORIZATION='JWT ' + create_tokens(trainee.user)['access'])
+        User.objects.filter(pk=trainee.user.pk).update(is_active=False)
+
+        assert api_client.get('/diet/meals/').status_code == status.HTTP_200_OK
+        assert api_client.post('/diet/meals/', {}).status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_refresh_updates_claims(self, trainee, create_tokens, refresh_tokens):
+        tokens = create_tokens(trainee.user)
+        User.objects.filter(pk=trainee.user.pk).update(is_staff=True)
+
+        response = refresh_tokens(tokens['refresh'])
+
+        assert response.status_code == status.HTTP_200_OK
+        assert AccessToken(response.data['access'])['is_staff'] is True
+        assert 'refresh' in response.data
+
+    def test_refresh_of_inactive_user_returns_401(self, trainee, create_tokens, refresh_tokens):
+        tokens = create_tokens(trainee.user)
+        User.objects.filter(pk=trainee.user.pk).update(is_active=False)
+
+        response = refresh_tokens(tokens['refresh'])
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,68 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+from core.catalog import ResponseCache
+
+
+def build_once(data, calls):
+    def build():
+        calls.append(data)
+        return data
+    return build
+
+
+class TestResponseCache:
+    def test_least_recently_used_entries_are_evicted(self, settings):
+        settings.CATALOG_CACHE = {'MAX_ENTRIES': 2, 'MAX_BYTES': 1000}
+        cache, calls = ResponseCache(), []
+
+        cache.get_or_build('a', build_once(b'a', calls))
+        cache.get_or_build('b', build_once(b'b', calls))
+        cache.get_or_build('a', build_once(b'a', calls))
+        cache.get_or_build('c', build_once(b'c', calls))
+        cache.get_or_build('a', build_once(b'a', calls))
+        cache.get_or_build('b', build_once(b'b', calls))
+
+        assert calls == [b'a', b'b', b'c', b'b']
+
+    def test_entries_are_bounded_in_bytes(self, settings):
+        settings.CATALOG_CACHE = {'MAX_ENTRIES': 10, 'MAX_BYTES': 20}
+        cache, calls = ResponseCache(), []
+
+        cache.get_or_build('small', build_once(b'x', calls))
+        cache.get_or_build('large', build_once(b'x' * 30, calls))
+        cache.get_or_build('large', build_once(b'x' * 30, calls))
+        cache.get_or_build('small', build_once(b'x', calls))
+
+        assert calls == [b'x', b'x' * 30, b'x' * 30]
+
+    def test_uncacheable_data_is_built_every_time(self, settings):
+        cache, calls = ResponseCache(), []
+
+        def build():
+            calls.append(None)
+
+        cache.get_or_build('a', build)
+        cache.get_or_build('a', build)
+
+        assert len(calls) == 2
+
+    def test_concurrent_misses_build_once(self, settings):
+        settings.CATALOG_CACHE = {'MAX_ENTRIES': 10, 'MAX_BYTES': 1000}
+        cache, calls = ResponseCache(), []
+        started = threading.Event()
+
+        def build():
+            calls.append(None)
+            started.set()
+            time.sleep(0.2)
+            return b'data'
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            first = executor.submit(cache.get_or_build, 'a', build)
+            started.wait()
+            others = [executor.submit(cache.get_or_build, 'a', build) for _ in range(4)]
+            results = [first.result()] + [other.result() for other in others]
+
+        assert len(calls) == 1
+        assert results == [b'data'] * 5
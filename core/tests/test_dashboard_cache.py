@@ -0,0 +1,76 @@
+from model_bakery import baker
+from rest_framework import status
+import pytest
+from core import dashboard_cache
+from core.models import Trainee
+from diet.models import Meal
+
+
+@pytest.fixture
+def trainee(api_client):
+    trainee = baker.make(Trainee)
+    api_client.force_authenticate(user=trainee.user)
+    return trainee
+
+
+@pytest.fixture
+def stats(settings):
+    settings.DASHBOARD_CACHE = {**settings.DASHBOARD_CACHE, 'STATS': True}
+
+
+@pytest.mark.django_db
+class TestDashboardCache:
+    def test_second_retrieve_is_served_from_cache(self, api_client, trainee, stats):
+        first = api_client.get('/core/trainees/me/')
+        second = api_client.get('/core/trainees/me/')
+
+        assert first.status_code == status.HTTP_200_OK
+        assert second.data == first.data
+        assert dashboard_cache.stats()['hits'] == 1
+        assert dashboard_cache.stats()['misses'] == 1
+
+    def test_counters_are_off_by_default(self, api_client, trainee):
+        api_client.get('/core/trainees/me/')
+        api_client.get('/core/trainees/me/')
+
+        assert dashboard_cache.stats()['hits'] == 0
+        assert dashboard_cache.stats()['misses'] == 0
+
+    def test_diet_write_invalidates_dashboard(self, api_client, trainee, stats):
+        api_client.get('/core/trainees/me/')
+        version = dashboard_cache.get_version(trainee.user.id)
+
+        response = api_client.post('/diet/waters/', {'amount': 300})
+        retrieved = api_client.get('/core/trainees/me/')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert dashboard_cache.get_version(trainee.user.id) != version
+        assert retrieved.data['water_intake_today'] == 300
+        assert dashboard_cache.stats()['misses'] == 2
+
+    def test_gym_write_invalidates_dashboard(self, api_client, trainee):
+        version = dashboard_cache.get_version(trainee.user.id)
+
+        api_client.post('/gym/performed_workouts/', {'name': 'a'})
+
+        assert dashboard_cache.get_version(trainee.user.id) != version
+
+    def test_failed_write_keeps_dashboard(self, api_client, trainee):
+        meal = baker.make(Meal)
+        version = dashboard_cache.get_version(trainee.user.id)
+
+        response = api_client.delete(f'/diet/meals/{meal.id}/')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert dashboard_cache.get_version(trainee.user.id) == version
+
+    def test_trainee_updates_invalidate_dashboard(self, api_client, trainee):
+        version = dashboard_cache.get_version(trainee.user.id)
+
+        api_client.patch('/core/trainees/set_daily_water_needs/',
+                         {'daily_water_needs': 3000})
+        patched_version = dashboard_cache.get_version(trainee.user.id)
+        api_client.get('/core/trainees/reset_daily_water_needs/')
+
+        assert patched_version != version
+        assert dashboard_cache.get_version(trainee.user.id) != patched_version
@@ -0,0 +1,184 @@
+from io import BytesIO
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.db import DatabaseError, connection
+from django.utils import timezone
+from model_bakery import baker
+from PIL import Image
+from rest_framework import status
+import pytest
+from core import images
+from core.images import _claim, process_batch
+from core.models import ImageJob
+from diet.models import Food, CustomFood, Meal
+
+ORIENTATION = 0x0112
+MAKE = 0x010F
+
+
+def jpeg(width=800, height=400, orientation=None):
+    exif = Image.Exif()
+    if orientation:
+        exif[ORIENTATION] = orientation
+        exif[MAKE] = 'Camera'
+    buffer = BytesIO()
+    Image.new('RGB', (width, height), 'red').save(buffer, format='JPEG', exif=exif)
+    return ContentFile(buffer.getvalue())
+
+
+def open_image(storage, name):
+    with storage.open(name, 'rb') as file:
+        image = Image.open(file)
+        image.load()
+    return image
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+
+
+@pytest.mark.django_db
+class TestImageRenditions:
+    def test_saving_an_image_queues_one_job(self):
+        food = baker.make(Food)
+
+        food.image.save('apple.jpg', jpeg())
+        food.save()
+
+        job = ImageJob.objects.get()
+        assert job.model == 'diet.Food'
+        assert job.object_id == food.id
+        assert job.name == food.image.name
+
+    def test_saving_a_subclass_image_queues_a_job(self):
+        custom_food = baker.make(CustomFood)
+
+        custom_food.image.save('apple.jpg', jpeg())
+
+        assert ImageJob.objects.get().model == 'diet.CustomFood'
+
+    def test_only_image_models_queue_jobs(self, monkeypatch):
+        saved = []
+        monkeypatch.setattr(images, 'enqueue', saved.append)
+
+        meal = baker.make(Meal)
+        custom_food = baker.make(CustomFood)
+
+        assert meal not in saved
+        assert custom_food in saved
+
+    def test_process_images_renders_every_size_and_format(self, capsys):
+        food = baker.make(Food)
+        food.image.save('apple.jpg', jpeg(orientation=6))
+
+        call_command('process_images')
+
+        food.refresh_from_db()
+        renditions = food.image_renditions
+        storage = food.image.storage
+        assert renditions['source'] == food.image.name
+        assert open_image(storage, renditions['thumb']['webp']).format == 'WEBP'
+        assert open_image(storage, renditions['thumb']['jpeg']).size == (75, 150)
+        medium = open_image(storage, renditions['medium']['jpeg'])
+        assert medium.size == (300, 600)
+        assert not medium.getexif()
+        assert not open_image(storage, food.image.name).getexif()
+        assert ImageJob.objects.get().status == ImageJob.Status.DONE
+        assert '1 images were processed, 0 will be retried and 0 failed.' in capsys.readouterr().out
+
+    def test_stripped_originals_replace_the_image(self):
+        food = baker.make(Food)
+        food.image.save('apple.jpg', jpeg(orientation=6))
+        original = food.image.name
+
+        process_batch()
+
+        food.refresh_from_db()
+        storage = food.image.storage
+        assert food.image_renditions['source'] == food.image.name
+        assert food.image.name != original
+        assert storage.exists(food.image.name)
+        assert not storage.exists(original)
+        assert not open_image(storage, food.image.name).getexif()
+        assert ImageJob.objects.count() == 1
+
+    def test_api_returns_rendition_urls_once_processed(self, api_client, authenticate_with_trainee):
+        authenticate_with_trainee()
+        food = baker.make(Food)
+        food.image.save('apple.jpg', jpeg())
+
+        assert api_client.get(f'/diet/foods/{food.id}/').data['image_renditions'] is None
+
+        process_batch()
+        response = api_client.get(f'/diet/foods/{food.id}/')
+
+        assert response.status_code == status.HTTP_200_OK
+        urls = response.data['image_renditions']
+        assert set(urls) == {'thumb', 'medium'}
+        assert urls['thumb']['webp'].endswith('.thumb.webp')
+        assert urls['medium']['jpeg'].endswith('.medium.jpeg')
+
+    def test_replaced_images_are_never_served_stale_renditions(self):
+        food = baker.make(Food)
+        food.image.save('apple.jpg', jpeg())
+        process_batch()
+        food.refresh_from_db()
+        old_thumb = food.image_renditions['thumb']['webp']
+
+        food.image.save('banana.jpg', jpeg())
+
+        assert food.image_renditions['source'] != food.image.name
+        process_batch()
+        food.refresh_from_db()
+        assert food.image_renditions['source'] == food.image.name
+        assert not food.image.storage.exists(old_thumb)
+
+    def test_failures_are_retried_with_backoff(self):
+        food = baker.make(Food)
+        food.image.save('apple.jpg', ContentFile(b'not an image'))
+
+        assert process_batch(max_attempts=2, backoff=60) == \
+            {'done': 0, 'retried': 1, 'failed': 0}
+        assert process_batch() == {'done': 0, 'retried': 0, 'failed': 0}
+
+        ImageJob.objects.update(next_attempt_at=timezone.now())
+
+        assert process_batch(max_attempts=2) == {'done': 0, 'retried': 0, 'failed': 1}
+        assert ImageJob.objects.get().status == ImageJob.Status.FAILED
+
+    def test_database_errors_only_fail_their_own_job(self, monkeypatch):
+        broken = baker.make(Food)
+        broken.image.save('apple.jpg', jpeg())
+        food = baker.make(Food)
+        food.image.save('banana.jpg', jpeg())
+        render = images.render
+
+        def render_or_fail(storage, name):
+            if name == broken.image.name:
+                with connection.cursor() as cursor:
+                    cursor.execute('SELECT * FROM missing_table')
+            return render(storage, name)
+        monkeypatch.setattr(images, 'render', render_or_fail)
+
+        assert process_batch() == {'done': 1, 'retried': 1, 'failed': 0}
+        food.refresh_from_db()
+        assert food.image_renditions['source'] == food.image.name
+        job = ImageJob.objects.get(object_id=broken.id)
+        assert job.status == ImageJob.Status.PENDING
+        assert 'missing_table' in job.last_error
+
+    def test_jobs_are_leased_while_rendering(self, monkeypatch):
+        food = baker.make(Food)
+        food.image.save('apple.jpg', jpeg())
+        claimed = []
+        render = images.render
+
+        def render_and_claim(storage, name):
+            claimed.append(_claim(20, 600))
+            return render(storage, name)
+        monkeypatch.setattr(images, 'render', render_and_claim)
+
+        assert process_batch(lease=600) == {'done': 1, 'retried': 0, 'failed': 0}
+        assert claimed == [[]]
+        assert ImageJob.objects.get().status == ImageJob.Status.DONE
@@ -0,0 +1,227 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.utils import timezone
+from model_bakery import baker
+import pytest
+from core.dashboard import get_totals_by_day
+from core.models import DailyLedger, Trainee
+from diet.models import CustomFood, Food, FoodInstance, Meal, Recipe, Water
+from gym.models import Exercise, ExerciseInstance, PerformedWorkout, Workout
+
+
+@pytest.fixture
+def trainee():
+    return baker.make(Trainee)
+
+
+def ledger_of(trainee, day=None):
+    day = day or timezone.localdate()
+    return DailyLedger.objects.filter(trainee=trainee, day=day).first()
+
+
+@pytest.mark.django_db
+class TestLedgerSignals:
+    def test_food_instance_changes_update_the_ledger(self, trainee):
+        food = baker.make(Food, calories=100, carbs=Decimal('10.0'))
+        meal = baker.make(Meal, trainee=trainee)
+
+        food_instance = baker.make(FoodInstance, food=food, meal=meal,
+                                   quantity=Decimal('50.0'))
+
+        assert ledger_of(trainee).calories == 50
+        assert ledger_of(trainee).carbs == Decimal('5.0')
+
+        food_instance.quantity = Decimal('200.0')
+        food_instance.save()
+
+        assert ledger_of(trainee).calories == 200
+
+        food_instance.delete()
+
+        assert ledger_of(trainee) is None
+
+    def test_recipe_changes_update_every_meal_day(self, trainee):
+        food = baker.make(Food, calories=100)
+        recipe = baker.make(Recipe, trainee=trainee)
+        meals = baker.make(Meal, trainee=trainee, _quantity=2)
+        yesterday = timezone.now() - timedelta(days=1)
+        meals[1].time_eaten = yesterday
+        meals[1].save()
+        for meal in meals:
+            meal.recipes.add(recipe)
+
+        baker.make(FoodInstance, food=food, recipe=recipe,
+                   quantity=Decimal('100.0'))
+
+        assert ledger_of(trainee).calories == 100
+        assert ledger_of(trainee, timezone.localdate(yesterday)).calories == 100
+
+        meals[0].recipes.remove(recipe)
+
+        assert ledger_of(trainee) is None
+        assert ledger_of(trainee, timezone.localdate(yesterday)).calories == 100
+
+    def test_moving_a_meal_moves_its_totals(self, trainee):
+        food = baker.make(Food, calories=100)
+        meal = baker.make(Meal, trainee=trainee)
+        baker.make(FoodInstance, food=food, meal=meal,
+                   quantity=Decimal('100.0'))
+        yesterday = timezone.now() - timedelta(days=1)
+
+        meal.time_eaten = yesterday
+        meal.save()
+
+        assert ledger_of(trainee) is None
+        assert ledger_of(trainee, timezone.localdate(yesterday)).calories == 100
+
+    def test_moving_a_food_instance_updates_both_days(self, trainee):
+        food = baker.make(Food, calories=100)
+        meal = baker.make(Meal, trainee=trainee)
+        yesterday = timezone.now() - timedelta(days=1)
+        other_meal = baker.make(Meal, trainee=trainee)
+        other_meal.time_eaten = yesterday
+        other_meal.save()
+        food_instance = baker.make(FoodInstance, food=food, meal=meal,
+                                   quantity=Decimal('100.0'))
+
+        food_instance.meal = other_meal
+        food_instance.save()
+
+        assert ledger_of(trainee) is None
+        assert ledger_of(trainee, timezone.localdate(yesterday)).calories == 100
+
+    def test_moving_an_exercise_instance_updates_both_days(self, trainee):
+        exercise = baker.make(Exercise, calories_burned=10, is_repetitive=True)
+        performed_workout = baker.make(PerformedWorkout, trainee=trainee)
+        yesterday = timezone.now() - timedelta(days=1)
+        other_performed_workout = baker.make(PerformedWorkout, trainee=trainee)
+        other_performed_workout.time_performed = yesterday
+        other_performed_workout.save()
+        exercise_instance = baker.make(ExerciseInstance, exercise=exercise,
+                                       performed_workout=performed_workout,
+                                       duration=10, sets=1)
+
+        exercise_instance.performed_workout = other_performed_workout
+        exercise_instance.save()
+
+        assert ledger_of(trainee) is None
+        assert ledger_of(trainee, timezone.localdate(yesterday)).calories_burned == 10
+
+    def test_custom_food_edits_update_the_ledger(self, trainee):
+        custom_food = baker.make(CustomFood, trainee=trainee, calories=100)
+        meal = baker.make(Meal, trainee=trainee)
+        baker.make(FoodInstance, food=custom_food, meal=meal,
+                   quantity=Decimal('100.0'))
+
+        custom_food.calories = 300
+        custom_food.save()
+
+        assert ledger_of(trainee).calories == 300
+
+    def test_global_food_edits_update_the_ledger(self, trainee):
+        food = baker.make(Food, calories=100)
+        meal = baker.make(Meal, trainee=trainee)
+        recipe = baker.make(Recipe, trainee=trainee)
+        baker.make(FoodInstance, food=food, recipe=recipe,
+                   quantity=Decimal('100.0'))
+        meal.recipes.add(recipe)
+
+        food.calories = 300
+        food.save()
+
+        assert ledger_of(trainee).calories == 300
+
+    def test_global_exercise_edits_update_the_ledger(self, trainee):
+        exercise = baker.make(Exercise, calories_burned=10, is_repetitive=True)
+        performed_workout = baker.make(PerformedWorkout, trainee=trainee)
+        baker.make(ExerciseInstance, exercise=exercise,
+                   performed_workout=performed_workout, duration=10, sets=1)
+
+        exercise.calories_burned = 20
+        exercise.save()
+
+        assert ledger_of(trainee).calories_burned == 20
+
+    def test_workouts_and_waters_update_the_ledger(self, trainee):
+        exercise = baker.make(Exercise, calories_burned=10, is_repetitive=True)
+        workout = baker.make(Workout, trainee=trainee)
+        baker.make(ExerciseInstance, exercise=exercise, workout=workout,
+                   duration=10, sets=3)
+        performed_workout = baker.make(PerformedWorkout, trainee=trainee)
+
+        performed_workout.workouts.add(workout)
+        baker.make(ExerciseInstance, exercise=exercise,
+                   performed_workout=performed_workout, duration=10, sets=1)
+        water = baker.make(Water, trainee=trainee, amount=300)
+
+        assert ledger_of(trainee).calories_burned == 40
+        assert ledger_of(trainee).water == 300
+
+        performed_workout.workouts.clear()
+        water.delete()
+
+        assert ledger_of(trainee).calories_burned == 10
+        assert ledger_of(trainee).water == 0
+
+    def test_deleting_a_trainee_deletes_the_ledger(self, trainee):
+        food = baker.make(Food, calories=100)
+        meal = baker.make(Meal, trainee=trainee)
+        baker.make(FoodInstance, food=food, meal=meal,
+                   quantity=Decimal('100.0'))
+        baker.make(Water, trainee=trainee, amount=300)
+
+        trainee.user.delete()
+
+        assert not DailyLedger.objects.exists()
+
+
+@pytest.mark.django_db
+class TestRebuildLedger:
+    def test_rebuild_matches_computed_totals(self, trainee):
+        food = baker.make(Food, calories=100, carbs=Decimal('10.0'))
+        meal = baker.make(Meal, trainee=trainee)
+        baker.make(FoodInstance, food=food, meal=meal,
+                   quantity=Decimal('100.0'))
+        baker.make(Water, trainee=trainee, amount=300)
+        DailyLedger.objects.all().delete()
+        baker.make(DailyLedger, trainee=trainee,
+                   day=date.today() - timedelta(days=3))
+
+        call_command('rebuild_ledger')
+
+        totals = get_totals_by_day([trainee.id])
+        ledgers = DailyLedger.objects.filter(trainee=trainee)
+        assert {(trainee.id, ledger.day) for ledger in ledgers} == set(totals)
+        assert ledger_of(trainee).calories == 100
+        assert ledger_of(trainee).water == 300
+
+    def test_check_does_not_write(self, trainee, capsys):
+        baker.make(Water, trainee=trainee, amount=300)
+        DailyLedger.objects.all().delete()
+
+        call_command('rebuild_ledger', '--check')
+
+        assert not DailyLedger.objects.exists()
+        assert '1 missing' in capsys.readouterr().out
+
+
+@pytest.mark.django_db(transaction=True)
+class TestFillLedgerMigration:
+    def test_existing_data_is_written_to_the_ledger(self, trainee):
+        food = baker.make(Food, calories=100, carbs=Decimal('10.0'))
+        meal = baker.make(Meal, trainee=trainee)
+        baker.make(FoodInstance, food=food, meal=meal,
+                   quantity=Decimal('100.0'))
+        baker.make(Water, trainee=trainee, amount=300)
+        executor = MigrationExecutor(connection)
+        executor.migrate([('core', '0001_initial')])
+
+        executor.loader.build_graph()
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+        assert ledger_of(trainee).calories == 100
+        assert ledger_of(trainee).carbs == Decimal('10.0')
+        assert ledger_of(trainee).water == 300
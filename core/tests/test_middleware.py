@@ -0,0 +1,36 @@
+from decimal import Decimal
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+from rest_framework import status
+import pytest
+from core.models import Trainee
+from diet.models import CustomFood, Meal
+
+
+def trainee_lookups(queries):
+    return [query for query in queries
+            if 'FROM "core_trainee"' in query['sql'] and 'UPDATE' not in query['sql']]
+
+
+@pytest.mark.django_db
+class TestTraineeMiddleware:
+    def test_trainee_is_resolved_once_per_request(self, api_client):
+        trainee = baker.make(Trainee)
+        api_client.force_authenticate(user=trainee.user)
+        meal = baker.make(Meal, trainee=trainee)
+        custom_food = baker.make(CustomFood, trainee=trainee)
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.post(f'/diet/meals/{meal.id}/food_instances/', {
+                'food_id': custom_food.id, 'quantity': Decimal('10.0')})
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert len(trainee_lookups(context.captured_queries)) == 1
+
+    def test_if_user_has_no_trainee_returns_404(self, api_client, authenticate_without_trainee):
+        authenticate_without_trainee()
+
+        response = api_client.get('/diet/meals/')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
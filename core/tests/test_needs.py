@@ -0,0 +1,62 @@
+from datetime import date
+from decimal import Decimal
+from django.core.management import call_command
+from model_bakery import baker
+import pytest
+from core.models import Trainee
+from core.needs import update_needs
+
+
+@pytest.mark.django_db
+class TestUpdateNeeds:
+    def test_needs_match_the_model_helpers(self):
+        trainees = []
+        for index, (activity_level, goal) in enumerate(
+                zip(Trainee.ActivityLevel.values * 2, Trainee.Goal.values * 4)):
+            trainees.append(baker.make(
+                Trainee,
+                birthdate=date(1980 + index, 1 + index % 12, 1 + index % 28),
+                gender=Trainee.Gender.values[index % 2],
+                height=Decimal('150.5') + index, weight=Decimal('55.3') + index,
+                activity_level=activity_level, goal=goal))
+        Trainee.objects.update(daily_calories_needs=1, daily_water_needs=1)
+
+        changed = update_needs(date.today())
+
+        assert changed == len(trainees)
+        for trainee in Trainee.objects.all():
+            assert trainee.daily_calories_needs == trainee.calculate_daily_calories_needs()
+            assert trainee.daily_water_needs == int(trainee.calculate_daily_water_needs())
+
+    def test_only_stale_trainees_are_updated(self):
+        stale, fresh = baker.make(Trainee, _quantity=2)
+        Trainee.objects.filter(pk=stale.pk).update(
+            daily_calories_needs=stale.daily_calories_needs + 5)
+
+        assert update_needs() == 1
+
+        stale.refresh_from_db()
+        assert stale.daily_calories_needs == stale.calculate_daily_calories_needs()
+        assert Trainee.objects.get(pk=fresh.pk).daily_calories_needs == fresh.daily_calories_needs
+
+    def test_custom_needs_are_kept(self):
+        trainee = baker.make(Trainee)
+        Trainee.objects.filter(pk=trainee.pk).update(
+            daily_calories_needs=1234, is_daily_calories_needs_custom=True,
+            daily_water_needs=0, is_daily_water_needs_custom=True)
+
+        update_needs()
+
+        trainee.refresh_from_db()
+        assert trainee.daily_calories_needs == 1234
+        assert trainee.is_daily_water_needs_custom is False
+        assert trainee.daily_water_needs == int(trainee.calculate_daily_water_needs())
+
+    def test_check_does_not_write(self, capsys):
+        trainee = baker.make(Trainee)
+        Trainee.objects.filter(pk=trainee.pk).update(daily_calories_needs=1)
+
+        call_command('update_needs', '--check')
+
+        assert '1 trainees have stale needs' in capsys.readouterr().out
+        assert Trainee.objects.get(pk=trainee.pk).daily_calories_needs == 1
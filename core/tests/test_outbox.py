@@ -0,0 +1,159 @@
+from datetime import timedelta
+import socketserver
+import threading
+from django.core import mail
+from email.mime.text import MIMEText
+from django.core.mail import EmailMultiAlternatives
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+from django.utils import timezone
+import pytest
+from core.mail import _claim, send_batch
+from core.models import OutboxEmail
+
+LOCMEM_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
+SMTP_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+
+
+class SMTPStandIn(socketserver.StreamRequestHandler):
+    # Just enough of SMTP to accept messages, like a local dev mail server.
+    def reply(self, line):
+        self.wfile.write(line.encode() + b'\r\n')
+
+    def handle(self):
+        self.reply('220 localhost')
+        while line := self.rfile.readline():
+            command = line.decode().strip().upper()
+            if command.startswith(('EHLO', 'HELO')):
+                self.reply('250 localhost')
+            elif command == 'DATA':
+                self.reply('354 end with <CR><LF>.<CR><LF>')
+                lines = []
+                while (line := self.rfile.readline()) != b'.\r\n':
+                    lines.append(line)
+                self.server.messages.append(b''.join(lines))
+                self.reply('250 OK')
+            elif command == 'QUIT':
+                self.reply('221 bye')
+                return
+            else:
+                self.reply('250 OK')
+
+
+@pytest.fixture
+def smtp_server(settings):
+    server = socketserver.ThreadingTCPServer(('127.0.0.1', 0), SMTPStandIn)
+    server.messages = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    settings.OUTBOX_EMAIL_BACKEND = SMTP_BACKEND
+    settings.EMAIL_HOST, settings.EMAIL_PORT = server.server_address
+    settings.EMAIL_HOST_USER = settings.EMAIL_HOST_PASSWORD = ''
+    settings.EMAIL_USE_SSL = settings.EMAIL_USE_TLS = False
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def outbox_backend(settings):
+    settings.EMAIL_BACKEND = 'core.mail.OutboxEmailBackend'
+    settings.OUTBOX_EMAIL_BACKEND = LOCMEM_BACKEND
+
+
+def send_email(to='a@example.com'):
+    message = EmailMultiAlternatives('Subject', 'Body', to=[to])
+    message.attach_alternative('<p>Body</p>', 'text/html')
+    message.send()
+
+
+@pytest.mark.django_db
+class TestOutbox:
+    def test_sending_only_enqueues(self, outbox_backend):
+        send_email()
+
+        email = OutboxEmail.objects.get()
+        assert mail.outbox == []
+        assert email.to == ['a@example.com']
+        assert email.alternatives == [['<p>Body</p>', 'text/html']]
+        assert email.status == OutboxEmail.Status.PENDING
+
+    def test_send_outbox_delivers_every_batch(self, outbox_backend, capsys):
+        for index in range(5):
+            send_email(f'{index}@example.com')
+
+        call_command('send_outbox', '--batch-size', '2')
+
+        assert sorted(message.to[0] for message in mail.outbox) == \
+            [f'{index}@example.com' for index in range(5)]
+        assert mail.outbox[0].alternatives == [('<p>Body</p>', 'text/html')]
+        assert not OutboxEmail.objects.exclude(status=OutboxEmail.Status.SENT).exists()
+        assert '5 emails were sent, 0 will be retried and 0 failed.' in capsys.readouterr().out
+
+    def test_failures_are_retried_with_backoff(self, outbox_backend, settings):
+        send_email()
+        settings.OUTBOX_EMAIL_BACKEND = SMTP_BACKEND
+        settings.EMAIL_HOST, settings.EMAIL_PORT = '127.0.0.1', 1
+
+        assert send_batch(max_attempts=2, backoff=60) == \
+            {'sent': 0, 'retried': 1, 'failed': 0}
+        email = OutboxEmail.objects.get()
+        assert email.attempts == 1
+        assert email.next_attempt_at > timezone.now() + timedelta(seconds=50)
+        assert send_batch() == {'sent': 0, 'retried': 0, 'failed': 0}
+
+        OutboxEmail.objects.update(next_attempt_at=timezone.now())
+
+        assert send_batch(max_attempts=2) == {'sent': 0, 'retried': 0, 'failed': 1}
+        assert OutboxEmail.objects.get().status == OutboxEmail.Status.FAILED
+
+    def test_send_outbox_over_smtp(self, outbox_backend, smtp_server):
+        send_email('a@example.com')
+        send_email('b@example.com')
+
+        assert send_batch() == {'sent': 2, 'retried': 0, 'failed': 0}
+        assert len(smtp_server.messages) == 2
+        assert b'To: a@example.com' in smtp_server.messages[0]
+
+    def test_attachments_are_delivered(self, outbox_backend):
+        message = EmailMultiAlternatives('Subject', 'Body', to=['a@example.com'])
+        message.attach('report.csv', 'a,b\n', 'text/csv')
+        message.attach('image.png', b'\x89PNG', 'image/png')
+        message.send()
+
+        send_batch()
+
+        assert mail.outbox[0].attachments == [('report.csv', 'a,b\n', 'text/csv'),
+                                              ('image.png', b'\x89PNG', 'image/png')]
+
+    def test_mime_attachments_are_rejected(self, outbox_backend):
+        message = EmailMultiAlternatives('Subject', 'Body', to=['a@example.com'])
+        message.attach(MIMEText('Body'))
+
+        with pytest.raises(ValueError):
+            message.send()
+
+        assert not OutboxEmail.objects.exists()
+
+    def test_emails_are_leased_while_sending(self, outbox_backend, monkeypatch):
+        send_email()
+        claimed = []
+
+        def send_messages(backend, messages):
+            claimed.append(_claim(100, 600))
+            return len(messages)
+        monkeypatch.setattr(EmailBackend, 'send_messages', send_messages)
+
+        assert send_batch(lease=600) == {'sent': 1, 'retried': 0, 'failed': 0}
+        assert claimed == [[]]
+        assert OutboxEmail.objects.get().status == OutboxEmail.Status.SENT
+
+    def test_unfinished_batches_are_sent_again_after_the_lease(self, outbox_backend):
+        send_email()
+        _claim(100, 600)
+
+        assert send_batch() == {'sent': 0, 'retried': 0, 'failed': 0}
+
+        OutboxEmail.objects.update(next_attempt_at=timezone.now())
+
+        assert send_batch() == {'sent': 1, 'retried': 0, 'failed': 0}
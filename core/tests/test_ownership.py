@@ -0,0 +1,57 @@
+from model_bakery import baker
+import pytest
+from core.models import Trainee
+from diet.models import Food, CustomFood
+from diet.serializers import foods, FoodInstanceCreateSerializer
+from gym.models import Exercise, CustomExercise
+from gym.serializers import exercises
+
+
+@pytest.mark.django_db
+class TestResolver:
+    def test_catalog_and_own_custom_foods_are_resolved_in_one_query(self, django_assert_num_queries):
+        trainee = baker.make(Trainee)
+        food = baker.make(Food)
+        custom_food = baker.make(CustomFood, trainee=trainee)
+        other_custom_food = baker.make(CustomFood)
+
+        with django_assert_num_queries(1):
+            resolved = foods.resolve([food.id, custom_food.id, other_custom_food.id, 0],
+                                     trainee)
+
+        assert set(resolved) == {food.id, custom_food.id}
+        assert resolved[custom_food.id].pk == custom_food.pk
+
+    def test_exercises_are_resolved(self):
+        trainee = baker.make(Trainee)
+        exercise = baker.make(Exercise)
+        custom_exercise = baker.make(CustomExercise, trainee=trainee)
+        other_custom_exercise = baker.make(CustomExercise)
+
+        resolved = exercises.resolve(
+            [exercise.id, custom_exercise.id, other_custom_exercise.id], trainee)
+
+        assert set(resolved) == {exercise.id, custom_exercise.id}
+
+
+@pytest.mark.django_db
+class TestResolvedIdField:
+    def test_id_validates_to_the_object(self, django_assert_num_queries):
+        trainee = baker.make(Trainee)
+        food = baker.make(Food)
+        serializer = FoodInstanceCreateSerializer(
+            data={'food_id': food.id, 'quantity': '10.0'}, context={'trainee': trainee})
+
+        with django_assert_num_queries(1):
+            assert serializer.is_valid()
+
+        assert serializer.validated_data['food'] == food
+
+    def test_if_food_is_not_usable_is_invalid(self):
+        trainee = baker.make(Trainee)
+        custom_food = baker.make(CustomFood)
+        serializer = FoodInstanceCreateSerializer(
+            data={'food_id': custom_food.id, 'quantity': '10.0'}, context={'trainee': trainee})
+
+        assert not serializer.is_valid()
+        assert serializer.errors['food_id'] == ['No food with the given id was found.']
@@ -0,0 +1,88 @@
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from io import BytesIO
+import uuid
+from django.core.management import call_command
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+import pytest
+from core.parsers import ORJSONParser
+from core.renderers import ORJSONRenderer
+
+DATA = {
+    'id': 1,
+    'name': 'Oats with "honey" \\ é中\n\u2028\u2029',
+    'time_eaten': datetime(2026, 10, 18, 7, 30, 15, 120, tzinfo=timezone.utc),
+    'performed_on': date(2026, 10, 18),
+    'at': time(7, 30),
+    'ratio': 0.25,
+    'duration': timedelta(minutes=90),
+    'upload': uuid.UUID('9f0a4c39-7d44-4bb1-9d4e-0c1a7b1d2f33'),
+    'food_instances': [
+        {'quantity': Decimal('150.5'), 'total_carbs': Decimal('20.7'),
+         'total_fats': Decimal('0'), 'total_protein': Decimal('99.9')},
+    ],
+    'recipes': (),
+    'image': None,
+    'is_repetitive': True,
+    2: 'two',
+}
+
+
+class TestORJSONRenderer:
+    @pytest.mark.parametrize('data', [
+        DATA,
+        [DATA, DATA],
+        {'small': 0.00001234, 'large': 1.5e17},
+        {'big': 2 ** 70},
+        {'empty': {}},
+        None,
+    ])
+    def test_renders_like_json_renderer(self, data):
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_indented_responses_render_like_json_renderer(self):
+        content = ORJSONRenderer().render(DATA, 'application/json; indent=4')
+
+        assert content == JSONRenderer().render(DATA, 'application/json; indent=4')
+
+    def test_unknown_types_raise_like_json_renderer(self):
+        with pytest.raises(TypeError):
+            ORJSONRenderer().render({'value': object()})
+
+
+class TestORJSONParser:
+    @pytest.mark.parametrize('body', [
+        b'{"name": "Oats \\u00e9", "quantity": 150.5, "food_id": 3, "items": [1, null, true]}',
+        '{"name": "é中"}'.encode(),
+        b'{"big": 123456789012345678901234567890}',
+        b'[]',
+    ])
+    def test_parses_like_json_parser(self, body):
+        assert ORJSONParser().parse(BytesIO(body)) == JSONParser().parse(BytesIO(body))
+
+    def test_other_encodings_are_parsed_like_json_parser(self):
+        body = '{"name": "é"}'.encode('latin-1')
+        context = {'encoding': 'latin-1'}
+
+        assert ORJSONParser().parse(BytesIO(body), parser_context=context) == {'name': 'é'}
+
+    @pytest.mark.parametrize('body', [b'{"name": ', b'{"ratio": NaN}', b''])
+    def test_invalid_json_raises_like_json_parser(self, body):
+        with pytest.raises(ParseError) as orjson_error:
+            ORJSONParser().parse(BytesIO(body))
+        with pytest.raises(ParseError) as json_error:
+            JSONParser().parse(BytesIO(body))
+
+        assert orjson_error.value.detail == json_error.value.detail
+
+
+class TestBenchmarkJSON:
+    def test_output_is_identical(self, capsys):
+        call_command('benchmark_json', meals=5, iterations=1)
+
+        out = capsys.readouterr().out
+        assert 'render' in out
+        assert 'parse' in out
+        assert 'DIFFERENT' not in out
@@ -0,0 +1,54 @@
+from core.search import SearchIndex, tokenize
+
+NAMES = [
+    (1, 'Chicken Breast'),
+    (2, 'Chicken Breast, Grilled with Skin'),
+    (3, 'Chickpeas'),
+    (4, 'Peanut Butter'),
+    (5, 'Push-ups'),
+    (6, 'Butter'),
+]
+
+
+def ids(results):
+    return [id for id, _ in results]
+
+
+class TestTokenize:
+    def test_names_are_split_into_lowercase_words(self):
+        assert tokenize('Push-ups, Wide_Grip ÉCLAIR') == ['push', 'ups', 'wide', 'grip', 'éclair']
+
+
+class TestSearchIndex:
+    def test_every_word_of_the_query_must_match(self):
+        index = SearchIndex(NAMES)
+
+        assert sorted(ids(index.search('chicken breast'))) == [1, 2]
+        assert ids(index.search('chicken butter')) == []
+
+    def test_words_match_as_prefixes(self):
+        index = SearchIndex(NAMES)
+
+        assert sorted(ids(index.search('chick'))) == [1, 2, 3]
+        assert ids(index.search('push up')) == [5]
+
+    def test_shorter_names_rank_first(self):
+        index = SearchIndex(NAMES)
+
+        assert ids(index.search('chicken breast')) == [1, 2]
+
+    def test_exact_words_rank_before_prefixes(self):
+        index = SearchIndex([(1, 'Buttermilk'), (2, 'Butter')])
+
+        assert ids(index.search('butter')) == [2, 1]
+
+    def test_equal_scores_rank_by_name(self):
+        index = SearchIndex([(1, 'Oats B'), (2, 'oats a'), (3, 'Oats C')])
+
+        assert ids(index.search('oats')) == [2, 1, 3]
+
+    def test_queries_without_words_match_nothing(self):
+        index = SearchIndex(NAMES)
+
+        assert index.search(' , ') == []
+        assert SearchIndex([]).search('butter') == []
@@ -0,0 +1,59 @@
+from datetime import date, timedelta
+from django.core.management import call_command
+from model_bakery import baker
+import pytest
+from core import activity
+from core.models import Trainee
+from core.streak import update_streaks
+
+
+@pytest.mark.django_db
+class TestUpdateStreak:
+    def test_active_trainees_extend_and_inactive_reset(self):
+        active = baker.make(Trainee, was_active_today=True, daily_streak=4)
+        inactive = baker.make(Trainee, was_active_today=False, daily_streak=7)
+
+        counts = update_streaks()
+
+        active.refresh_from_db()
+        inactive.refresh_from_db()
+        assert counts == {'extended': 1, 'reset': 1}
+        assert (active.daily_streak, active.was_active_today) == (5, False)
+        assert (inactive.daily_streak, inactive.was_active_today) == (0, False)
+
+    def test_chunks_cover_every_trainee(self):
+        baker.make(Trainee, was_active_today=True, daily_streak=1, _quantity=5)
+
+        counts = update_streaks(chunk_size=2)
+
+        assert counts == {'extended': 5, 'reset': 0}
+        assert set(Trainee.objects.values_list('daily_streak', flat=True)) == {2}
+
+    def test_does_not_recalculate_needs(self):
+        trainee = baker.make(Trainee, was_active_today=True)
+        Trainee.objects.filter(pk=trainee.pk).update(daily_calories_needs=1)
+
+        update_streaks()
+
+        trainee.refresh_from_db()
+        assert trainee.daily_calories_needs == 1
+
+    def test_command_reports_rows_and_time(self, capsys):
+        baker.make(Trainee, was_active_today=True)
+
+        call_command('update_streak', '--from-flags', '--chunk-size', '100')
+
+        assert '1 streaks were extended and 0 reset in' in capsys.readouterr().out
+
+    def test_streaks_are_derived_from_activity(self):
+        trainees = baker.make(Trainee, was_active_today=True, daily_streak=9,
+                              _quantity=2)
+        for offset in range(3):
+            activity.record(trainees[0].id, date(2024, 1, 2) - timedelta(days=offset))
+
+        counts = update_streaks(date(2024, 1, 2), chunk_size=1)
+
+        streaks = dict(Trainee.objects.values_list('id', 'daily_streak'))
+        assert counts == {'extended': 1, 'reset': 1}
+        assert streaks == {trainees[0].id: 3, trainees[1].id: 0}
+        assert not Trainee.objects.filter(was_active_today=True).exists()
@@ -1,8 +1,12 @@
+from datetime import timedelta
 from decimal import Decimal
+from django.utils import timezone
 from model_bakery import baker
 from rest_framework import status
 import pytest
 from core.models import Trainee
+from diet.models import Food, FoodInstance, Meal, Recipe, Water
+from gym.models import Exercise, ExerciseInstance, PerformedWorkout, Workout
 
 
 @pytest.fixture
@@ -72,6 +76,22 @@ class TestRetrieveTrainee:
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
+    def test_if_trainee_retrieves_marks_active_once(self, api_client, retrieve_trainee, django_assert_num_queries):
+        trainee = baker.make(Trainee, was_active_today=False,
+                             is_daily_calories_needs_custom=True,
+                             daily_calories_needs=1234)
+        api_client.force_authenticate(user=trainee.user)
+
+        retrieve_trainee()
+        Trainee.objects.filter(pk=trainee.pk).update(daily_calories_needs=4321)
+        with django_assert_num_queries(1):
+            response = retrieve_trainee()
+
+        trainee.refresh_from_db()
+        assert response.status_code == status.HTTP_200_OK
+        assert trainee.was_active_today is True
+        assert trainee.daily_calories_needs == 4321
+
 
 @pytest.mark.django_db
 class TestUpdateTrainee:
@@ -155,3 +175,116 @@ class TestUpdateTrainee:
         })
 
         assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+class TestTraineeTodayTotals:
+    def test_totals_match_logged_meals_workouts_and_waters(self, api_client, retrieve_trainee):
+        trainee = baker.make(Trainee)
+        api_client.force_authenticate(user=trainee.user)
+        food = baker.make(Food, category=Food.Category.FOOD, calories=52,
+                          carbs=Decimal('14.0'), fats=Decimal('0.2'), protein=Decimal('0.3'))
+        seasoning = baker.make(Food, category=Food.Category.SEASONING, calories=5,
+                               carbs=Decimal('1.1'), fats=Decimal('0.1'), protein=Decimal('0.2'))
+        recipe = baker.make(Recipe, trainee=trainee)
+        baker.make(FoodInstance, food=food, recipe=recipe,
+                   quantity=Decimal('150.0'))
+        meals = baker.make(Meal, trainee=trainee, _quantity=2)
+        for meal in meals:
+            meal.recipes.add(recipe)
+            baker.make(FoodInstance, food=food, meal=meal,
+                       quantity=Decimal('65.0'))
+            baker.make(FoodInstance, food=seasoning, meal=meal,
+                       quantity=Decimal('2.0'))
+        exercise = baker.make(Exercise, calories_burned=7, is_repetitive=True)
+        workout = baker.make(Workout, trainee=trainee)
+        baker.make(ExerciseInstance, exercise=exercise,
+                   workout=workout, duration=12, sets=3)
+        performed_workout = baker.make(PerformedWorkout, trainee=trainee)
+        performed_workout.workouts.add(workout)
+        baker.make(ExerciseInstance, exercise=exercise,
+                   performed_workout=performed_workout, duration=10, sets=2)
+        baker.make(Water, trainee=trainee, amount=250)
+        baker.make(Water, trainee=trainee, amount=500)
+
+        response = retrieve_trainee()
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['calories_intake_today'] == sum(
+            meal.get_total_calories() for meal in meals)
+        assert response.data['carbs_intake_today'] == sum(
+            meal.get_total_carbs() for meal in meals)
+        assert response.data['fats_intake_today'] == sum(
+            meal.get_total_fats() for meal in meals)
+        assert response.data['protein_intake_today'] == sum(
+            meal.get_total_protein() for meal in meals)
+        assert response.data['calories_burned_today'] == performed_workout.get_total_calories()
+        assert response.data['water_intake_today'] == 750
+
+    def test_query_count_does_not_grow_with_meals(self, api_client, retrieve_trainee, django_assert_max_num_queries):
+        trainee = baker.make(Trainee)
+        api_client.force_authenticate(user=trainee.user)
+        food = baker.make(Food)
+        for meal in baker.make(Meal, trainee=trainee, _quantity=20):
+            baker.make(FoodInstance, food=food, meal=meal,
+                       quantity=Decimal('100.0'))
+
+        with django_assert_max_num_queries(10):
+            response = retrieve_trainee()
+
+        assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+class TestTraineeHistory:
+    def test_if_user_is_anonymous_returns_401(self, api_client):
+        response = api_client.get('/core/trainees/me/history/')
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_if_range_is_valid_returns_every_day(self, api_client, django_assert_max_num_queries):
+        trainee = baker.make(Trainee)
+        api_client.force_authenticate(user=trainee.user)
+        food = baker.make(Food, calories=100, carbs=Decimal('10.0'),
+                          fats=Decimal('0.0'), protein=Decimal('0.0'))
+        meals = baker.make(Meal, trainee=trainee, _quantity=2)
+        meals[1].time_eaten = timezone.now() - timedelta(days=2)
+        meals[1].save()
+        for meal in meals:
+            baker.make(FoodInstance, food=food, meal=meal,
+                       quantity=Decimal('100.0'))
+        baker.make(Water, trainee=trainee, amount=250)
+        today = timezone.localdate()
+
+        with django_assert_max_num_queries(2):
+            response = api_client.get('/core/trainees/me/history/', {
+                'from': today - timedelta(days=3), 'to': today})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [day['calories'] for day in response.data] == [0, 100, 0, 100]
+        assert [day['water'] for day in response.data] == [0, 0, 0, 250]
+        assert response.data[1] == {
+            'day': str(today - timedelta(days=2)),
+            'calories': 100,
+            'carbs': Decimal('10.0'),
+            'fats': Decimal('0.0'),
+            'protein': Decimal('0.0'),
+            'water': 0,
+            'calories_burned': 0,
+        }
+
+    def test_if_range_is_too_long_returns_400(self, api_client, authenticate_with_trainee):
+        authenticate_with_trainee()
+
+        response = api_client.get('/core/trainees/me/history/', {
+            'from': '2023-01-01', 'to': '2024-01-02'})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_if_from_is_after_to_returns_400(self, api_client, authenticate_with_trainee):
+        authenticate_with_trainee()
+
+        response = api_client.get('/core/trainees/me/history/', {
+            'from': '2024-01-02', 'to': '2024-01-01'})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,266 @@
+from datetime import timedelta
+import hashlib
+from io import BytesIO
+import os
+from django.core.management import call_command
+from django.utils import timezone
+from model_bakery import baker
+from PIL import Image
+from rest_framework import status
+import pytest
+from core import dashboard_cache
+from core.models import ImageJob, ImageUpload, Trainee
+from core.uploads import part_path
+from diet.models import Recipe
+
+
+def png(width=16, height=16):
+    buffer = BytesIO()
+    Image.frombytes('RGB', (width, height), os.urandom(width * height * 3))\
+        .save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+@pytest.fixture(autouse=True)
+def upload_dirs(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path / 'media')
+    settings.CHUNKED_UPLOADS = {'DIR': str(tmp_path / 'uploads'),
+                                'MAX_CHUNK_SIZE': 100, 'EXPIRE_AFTER': 24}
+
+
+@pytest.fixture
+def initiate_upload(api_client):
+    def do_initiate_upload(data, filename='photo.png'):
+        return api_client.post('/core/uploads/', {
+            'filename': filename,
+            'size': len(data),
+            'checksum': hashlib.sha256(data).hexdigest(),
+        })
+    return do_initiate_upload
+
+
+@pytest.fixture
+def upload_chunk(api_client):
+    def do_upload_chunk(id, data, start, total):
+        end = start + len(data) - 1
+        return api_client.put(f'/core/uploads/{id}/chunk/', data,
+                              content_type='application/octet-stream',
+                              HTTP_CONTENT_RANGE=f'bytes {start}-{end}/{total}')
+    return do_upload_chunk
+
+
+@pytest.fixture
+def upload_all(upload_chunk):
+    def do_upload_all(id, data, chunk_size=100):
+        for start in range(0, len(data), chunk_size):
+            response = upload_chunk(id, data[start:start + chunk_size],
+                                    start, len(data))
+            assert response.status_code == status.HTTP_200_OK
+    return do_upload_all
+
+
+@pytest.fixture
+def complete_upload(api_client):
+    def do_complete_upload(id, target):
+        return api_client.post(f'/core/uploads/{id}/complete/', target)
+    return do_complete_upload
+
+
+@pytest.mark.django_db
+class TestInitiateUpload:
+    def test_if_user_is_anonymous_returns_401(self, initiate_upload):
+        response = initiate_upload(png())
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_if_data_is_valid_returns_201(self, authenticate_with_trainee, initiate_upload):
+        authenticate_with_trainee()
+        data = png()
+
+        response = initiate_upload(data)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data['offset'] == 0
+        upload = ImageUpload.objects.get()
+        assert os.path.getsize(part_path(upload)) == 0
+
+    def test_if_image_is_too_large_returns_400(self, authenticate_with_trainee, api_client):
+        authenticate_with_trainee()
+
+        response = api_client.post('/core/uploads/', {
+            'filename': 'photo.png', 'size': 51 * 2 ** 20, 'checksum': '0' * 64})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['size'] is not None
+
+    def test_if_file_is_not_an_image_returns_400(self, authenticate_with_trainee, initiate_upload):
+        authenticate_with_trainee()
+
+        response = initiate_upload(png(), filename='photo.exe')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['filename'] is not None
+
+
+@pytest.mark.django_db
+class TestUploadChunk:
+    def test_chunks_are_appended_in_order(self, authenticate_with_trainee, initiate_upload, upload_chunk):
+        authenticate_with_trainee()
+        data = png()
+        id = initiate_upload(data).data['id']
+
+        response = upload_chunk(id, data[:100], 0, len(data))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['offset'] == 100
+        with open(part_path(ImageUpload.objects.get()), 'rb') as part:
+            assert part.read() == data[:100]
+
+    def test_chunks_keep_the_dashboard(self, authenticate_with_trainee, initiate_upload, upload_chunk):
+        authenticate_with_trainee()
+        trainee = Trainee.objects.get()
+        version = dashboard_cache.get_version(trainee.user_id)
+        data = png()
+        id = initiate_upload(data).data['id']
+
+        upload_chunk(id, data[:100], 0, len(data))
+
+        assert dashboard_cache.get_version(trainee.user_id) == version
+
+    def test_if_chunk_skips_ahead_returns_409_with_offset(self, authenticate_with_trainee, initiate_upload, upload_chunk):
+        authenticate_with_trainee()
+        data = png()
+        id = initiate_upload(data).data['id']
+        upload_chunk(id, data[:100], 0, len(data))
+
+        response = upload_chunk(id, data[200:300], 200, len(data))
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert response.data['offset'] == 100
+
+    def test_if_chunk_is_too_large_returns_413(self, authenticate_with_trainee, initiate_upload, upload_chunk):
+        authenticate_with_trainee()
+        data = png()
+        id = initiate_upload(data).data['id']
+
+        response = upload_chunk(id, data[:101], 0, len(data))
+
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+    def test_if_content_range_is_missing_returns_400(self, authenticate_with_trainee, initiate_upload, api_client):
+        authenticate_with_trainee()
+        id = initiate_upload(png()).data['id']
+
+        response = api_client.put(f'/core/uploads/{id}/chunk/', b'data',
+                                  content_type='application/octet-stream')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    @pytest.mark.parametrize('content_length', ['abc', '-5'])
+    def test_if_content_length_is_invalid_returns_400(self, authenticate_with_trainee, initiate_upload, api_client, content_length):
+        authenticate_with_trainee()
+        data = png()
+        id = initiate_upload(data).data['id']
+
+        response = api_client.put(f'/core/uploads/{id}/chunk/', data[:100],
+                                  content_type='application/octet-stream',
+                                  HTTP_CONTENT_RANGE=f'bytes 0-99/{len(data)}',
+                                  CONTENT_LENGTH=content_length)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_if_upload_belongs_to_another_trainee_returns_404(self, authenticate_with_trainee, upload_chunk):
+        authenticate_with_trainee()
+        upload = baker.make(ImageUpload, size=10)
+
+        response = upload_chunk(upload.id, b'0123456789', 0, 10)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestCompleteUpload:
+    def test_completed_upload_is_attached_to_the_target(self, authenticate_with_trainee, initiate_upload, upload_all, complete_upload):
+        authenticate_with_trainee()
+        recipe = baker.make(Recipe, trainee=Trainee.objects.get())
+        data = png()
+        id = initiate_upload(data).data['id']
+        upload_all(id, data)
+
+        response = complete_upload(id, {'target': 'recipe', 'id': recipe.id})
+
+        assert response.status_code == status.HTTP_200_OK
+        recipe.refresh_from_db()
+        assert recipe.image.read() == data
+        assert response.data['image'] == recipe.image.url
+        upload = ImageUpload.objects.get()
+        assert upload.status == ImageUpload.Status.COMPLETE
+        assert not os.path.exists(part_path(upload))
+        assert ImageJob.objects.get().name == recipe.image.name
+
+    def test_trainee_image_needs_no_id(self, authenticate_with_trainee, initiate_upload, upload_all, complete_upload):
+        authenticate_with_trainee()
+        trainee = Trainee.objects.get()
+        data = png()
+        id = initiate_upload(data).data['id']
+        upload_all(id, data)
+        version = dashboard_cache.get_version(trainee.user_id)
+
+        response = complete_upload(id, {'target': 'trainee'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert Trainee.objects.get().image.read() == data
+        assert dashboard_cache.get_version(trainee.user_id) != version
+
+    def test_if_upload_is_not_finished_returns_409(self, authenticate_with_trainee, initiate_upload, upload_chunk, complete_upload):
+        authenticate_with_trainee()
+        data = png()
+        id = initiate_upload(data).data['id']
+        upload_chunk(id, data[:100], 0, len(data))
+
+        response = complete_upload(id, {'target': 'trainee'})
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert response.data['offset'] == 100
+
+    def test_if_checksum_does_not_match_returns_400_and_restarts(self, authenticate_with_trainee, initiate_upload, upload_all, complete_upload):
+        authenticate_with_trainee()
+        data = png()
+        id = initiate_upload(data).data['id']
+        upload_all(id, data[::-1])
+
+        response = complete_upload(id, {'target': 'trainee'})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        upload = ImageUpload.objects.get()
+        assert upload.offset == 0
+        assert os.path.getsize(part_path(upload)) == 0
+        assert not Trainee.objects.get().image
+
+    def test_if_target_belongs_to_another_trainee_returns_404(self, authenticate_with_trainee, initiate_upload, upload_all, complete_upload):
+        authenticate_with_trainee()
+        recipe = baker.make(Recipe)
+        data = png()
+        id = initiate_upload(data).data['id']
+        upload_all(id, data)
+
+        response = complete_upload(id, {'target': 'recipe', 'id': recipe.id})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestClearUploads:
+    def test_completed_and_expired_uploads_are_cleared(self, capsys):
+        trainee = baker.make(Trainee)
+        baker.make(ImageUpload, trainee=trainee, size=10)
+        baker.make(ImageUpload, trainee=trainee, size=10,
+                   status=ImageUpload.Status.COMPLETE)
+        expired = baker.make(ImageUpload, trainee=trainee, size=10)
+        ImageUpload.objects.filter(pk=expired.pk)\
+            .update(updated_at=timezone.now() - timedelta(days=2))
+
+        call_command('clear_uploads')
+
+        assert ImageUpload.objects.count() == 1
+        assert '2 uploads were cleared.' in capsys.readouterr().out
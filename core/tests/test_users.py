@@ -1,3 +1,6 @@
+from django.contrib.auth.tokens import default_token_generator
+from djoser.utils import encode_uid
+from model_bakery import baker
 from rest_framework import status
 import pytest
 from core.models import User
@@ -125,3 +128,64 @@ class TestUpdateUser:
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data['first_name'] == 'a'
+
+
+@pytest.mark.django_db
+class TestActivateUser:
+    def test_if_token_is_valid_activates_user(self, api_client, mailoutbox):
+        user = baker.make(User, is_active=False)
+
+        response = api_client.get(
+            f'/core/activate/{encode_uid(user.pk)}/{default_token_generator.make_token(user)}/')
+
+        user.refresh_from_db()
+        assert response.status_code == status.HTTP_200_OK
+        assert user.is_active is True
+        assert [mail.to for mail in mailoutbox] == [[user.email]]
+
+    def test_if_token_is_invalid_returns_400(self, api_client):
+        user = baker.make(User, is_active=False)
+
+        response = api_client.get(f'/core/activate/{encode_uid(user.pk)}/invalid/')
+
+        user.refresh_from_db()
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'Account Activation Failed' in response.content.decode()
+        assert user.is_active is False
+
+    def test_if_user_is_already_active_returns_403(self, api_client):
+        user = baker.make(User, is_active=True)
+
+        response = api_client.get(
+            f'/core/activate/{encode_uid(user.pk)}/{default_token_generator.make_token(user)}/')
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert 'Account Activation Failed' in response.content.decode()
+
+
+@pytest.mark.django_db
+class TestResetPasswordConfirm:
+    def test_if_token_is_valid_changes_password(self, api_client, mailoutbox):
+        user = baker.make(User)
+
+        response = api_client.post(
+            f'/core/password/reset/confirm/{encode_uid(user.pk)}/{default_token_generator.make_token(user)}/',
+            {'password': 'a-new-Passw0rd'})
+
+        user.refresh_from_db()
+        assert response.status_code == status.HTTP_200_OK
+        assert user.check_password('a-new-Passw0rd')
+        assert [mail.to for mail in mailoutbox] == [[user.email]]
+
+    def test_if_password_is_invalid_returns_400(self, api_client):
+        user = baker.make(User)
+
+        response = api_client.post(
+            f'/core/password/reset/confirm/{encode_uid(user.pk)}/{default_token_generator.make_token(user)}/',
+            {'password': '123'})
+
+        user.refresh_from_db()
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'Password Change Failed' in response.content.decode()
+        assert 'Try again' in response.content.decode()
+        assert not user.check_password('123')
@@ -0,0 +1,122 @@
+import hashlib
+import os
+import re
+from datetime import timedelta
+from django.apps import apps
+from django.conf import settings
+from django.core.files import File
+from django.utils import timezone
+from PIL import Image
+from .models import ImageUpload
+
+# Images can be uploaded in chunks that are streamed to a part file on disk
+# as they are read, so memory use is bounded by READ_SIZE whatever the size of
+# the image. Each chunk is a short request, and an interrupted upload resumes
+# from the offset of the last chunk written.
+READ_SIZE = 64 * 1024
+CONTENT_RANGE = re.compile(r'^bytes (\d+)-(\d+)/(\d+)$')
+
+# The objects of each target are looked up among the objects of the trainee.
+TARGETS = {
+    'trainee': ('core.Trainee', 'id'),
+    'custom_food': ('diet.CustomFood', 'trainee'),
+    'recipe': ('diet.Recipe', 'trainee'),
+    'custom_exercise': ('gym.CustomExercise', 'trainee'),
+    'workout': ('gym.Workout', 'trainee'),
+}
+
+
+def part_path(upload):
+    return os.path.join(settings.CHUNKED_UPLOADS['DIR'], f'{upload.id}.part')
+
+
+def create_part(upload):
+    os.makedirs(settings.CHUNKED_UPLOADS['DIR'], exist_ok=True)
+    open(part_path(upload), 'wb').close()
+
+
+def delete_part(upload):
+    try:
+        os.remove(part_path(upload))
+    except FileNotFoundError:
+        pass
+
+
+def parse_content_range(header):
+    match = CONTENT_RANGE.match(header or '')
+    if match is None:
+        return None
+    start, end, total = (int(group) for group in match.groups())
+    if end < start:
+        return None
+    return start, end, total
+
+
+def write_chunk(upload, stream, start, length):
+    # Returns the new offset of the upload, or None when the stream ended
+    # before length bytes were read. Chunks are written in place, so a chunk
+    # sent twice rewrites the same bytes, and the offset only moves forward
+    # from the start of the chunk.
+    with open(part_path(upload), 'r+b') as part:
+        part.seek(start)
+        remaining = length
+        while remaining:
+            data = stream.read(min(READ_SIZE, remaining))
+            if not data:
+                return None
+            part.write(data)
+            remaining -= len(data)
+    updated = ImageUpload.objects.filter(pk=upload.pk, offset=start)\
+        .update(offset=start + length, updated_at=timezone.now())
+    if not updated:
+        return None
+    return start + length
+
+
+def checksum(upload):
+    sha256 = hashlib.sha256()
+    with open(part_path(upload), 'rb') as part:
+        while data := part.read(READ_SIZE):
+            sha256.update(data)
+    return sha256.hexdigest()
+
+
+def is_image(upload):
+    try:
+        with Image.open(part_path(upload)) as image:
+            image.verify()
+    except Exception:
+        return False
+    return True
+
+
+def get_target(trainee, target, object_id=None):
+    label, owner = TARGETS[target]
+    model = apps.get_model(label)
+    if owner == 'id':
+        return model.objects.filter(id=trainee.id).first()
+    return model.objects.filter(id=object_id, trainee=trainee).first()
+
+
+def attach(upload, instance):
+    # The storage copies the part file chunk by chunk, and saving the object
+    # queues the renditions of its new image.
+    with open(part_path(upload), 'rb') as part:
+        instance.image.save(upload.filename, File(part), save=True)
+    delete_part(upload)
+    upload.status = ImageUpload.Status.COMPLETE
+    upload.save(update_fields=['status', 'updated_at'])
+
+
+def clear_expired(now=None):
+    # Deletes the uploads that were completed, or left unfinished for longer
+    # than settings.CHUNKED_UPLOADS['EXPIRE_AFTER'] hours.
+    now = now or timezone.now()
+    expired = ImageUpload.objects.filter(
+        updated_at__lt=now - timedelta(hours=settings.CHUNKED_UPLOADS['EXPIRE_AFTER']))
+    uploads = list(expired) + \
+        list(ImageUpload.objects.filter(status=ImageUpload.Status.COMPLETE))
+    for upload in uploads:
+        delete_part(upload)
+    return ImageUpload.objects.filter(pk__in=[upload.pk for upload in uploads])\
+        .delete()[0]
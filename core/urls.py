@@ -4,6 +4,7 @@ from . import views
 
 router = routers.DefaultRouter()
 router.register('trainees', views.TraineeViewSet, basename='trainees')
+router.register('uploads', views.ImageUploadViewSet, basename='uploads')
 
 urlpatterns = [
     path('', include(router.urls)),
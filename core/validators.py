@@ -1,8 +1,10 @@
 from django.core.exceptions import ValidationError
 
+MAX_IMAGE_SIZE_MB = 50
+
 
 def validate_image_size(image):
-    max_size_mb = 50
+    max_size_mb = MAX_IMAGE_SIZE_MB
 
     if image.size > max_size_mb * (2 ** 20):
         raise ValidationError(f'Images cannot be larger than {max_size_mb}MB!')
@@ -1,20 +1,26 @@
 from django.conf import settings
-from django.shortcuts import get_object_or_404, render
-from django.http import HttpResponse
-from requests import post
-from requests.exceptions import Timeout
+from django.shortcuts import render
+from django.utils.timezone import now
+from djoser import signals
+from djoser.compat import get_user_email
+from djoser.conf import settings as djoser_settings
+from djoser.views import UserViewSet
 from rest_framework.decorators import action
-from rest_framework.mixins import CreateModelMixin
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework.mixins import CreateModelMixin, DestroyModelMixin, RetrieveModelMixin
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 from rest_framework import status
-from .models import Trainee
+from . import activity, dashboard_cache, ledger, uploads
+from .dashboard_cache import DashboardInvalidationMixin
+from .middleware import load_trainee
+from .models import ImageUpload, Trainee
 from .permissions import IsAuthenticatedAndNotTraineeAndNotAdmin
-from .serializers import TraineeSerializer, TraineeCreateUpdateSerializer, TraineeUpdateCaloriesSerializer, TraineeUpdateWaterSerializer, TraineeUpdateMacronutrientsRatiosSerializer
+from .serializers import ImageUploadSerializer, ImageUploadCompleteSerializer, TraineeSerializer, TraineeCreateUpdateSerializer, TraineeHistoryRangeSerializer, TraineeHistorySerializer, TraineeUpdateCaloriesSerializer, TraineeUpdateWaterSerializer, TraineeUpdateMacronutrientsRatiosSerializer
 
 
-class TraineeViewSet(CreateModelMixin, GenericViewSet):
+class TraineeViewSet(DashboardInvalidationMixin, CreateModelMixin, GenericViewSet):
     def get_queryset(self):
         return Trainee.objects.filter(user_id=self.request.user.id)
 
@@ -43,12 +49,12 @@ class TraineeViewSet(CreateModelMixin, GenericViewSet):
 
     @action(detail=False, methods=['GET', 'PATCH', 'DELETE'])
     def me(self, request):
-        trainee = get_object_or_404(Trainee, user_id=request.user.id)
+        trainee = load_trainee(request)
         if request.method == 'GET':
-            trainee.was_active_today = True
-            trainee.save()
-            serializer = TraineeSerializer(trainee)
-            return Response(serializer.data)
+            activity.mark_active(trainee)
+            data = dashboard_cache.get_or_build(
+                request.user.id, lambda: TraineeSerializer(trainee).data)
+            return Response(data)
         elif request.method == 'PATCH':
             serializer = TraineeSerializer(trainee,
                                            data=request.data,
@@ -60,17 +66,30 @@ class TraineeViewSet(CreateModelMixin, GenericViewSet):
             trainee.delete()
             return Response(status=status.HTTP_204_NO_CONTENT)
 
+    @action(detail=False, methods=['GET'], url_path='me/history')
+    def history(self, request):
+        trainee = request.trainee
+        range_serializer = TraineeHistoryRangeSerializer(
+            data=request.query_params)
+        range_serializer.is_valid(raise_exception=True)
+        days = ledger.get_history(trainee,
+                                  range_serializer.validated_data['from'],
+                                  range_serializer.validated_data['to'])
+        serializer = TraineeHistorySerializer(days, many=True)
+        return Response(serializer.data)
+
     @action(detail=False, methods=['GET'])
     def reset_daily_calories_needs(self, request):
-        trainee = get_object_or_404(Trainee, user_id=request.user.id)
+        trainee = load_trainee(request)
         trainee.is_daily_calories_needs_custom = False
         serializer = TraineeUpdateCaloriesSerializer(trainee)
         trainee.save()
+        dashboard_cache.bump(request.user.id)
         return Response(serializer.data)
 
     @action(detail=False, methods=['GET', 'PATCH'])
     def set_daily_calories_needs(self, request):
-        trainee = get_object_or_404(Trainee, user_id=request.user.id)
+        trainee = load_trainee(request)
         if request.method == 'GET':
             serializer = TraineeUpdateCaloriesSerializer(trainee)
             return Response(serializer.data)
@@ -85,15 +104,16 @@ class TraineeViewSet(CreateModelMixin, GenericViewSet):
 
     @action(detail=False, methods=['GET'])
     def reset_daily_water_needs(self, request):
-        trainee = get_object_or_404(Trainee, user_id=request.user.id)
+        trainee = load_trainee(request)
         trainee.is_daily_water_needs_custom = False
         serializer = TraineeUpdateWaterSerializer(trainee)
         trainee.save()
+        dashboard_cache.bump(request.user.id)
         return Response(serializer.data)
 
     @action(detail=False, methods=['GET', 'PATCH'])
     def set_daily_water_needs(self, request):
-        trainee = get_object_or_404(Trainee, user_id=request.user.id)
+        trainee = load_trainee(request)
         if request.method == 'GET':
             serializer = TraineeUpdateWaterSerializer(trainee)
             return Response(serializer.data)
@@ -108,15 +128,16 @@ class TraineeViewSet(CreateModelMixin, GenericViewSet):
 
     @action(detail=False, methods=['GET'])
     def reset_macronutrients_ratios(self, request):
-        trainee = get_object_or_404(Trainee, user_id=request.user.id)
+        trainee = load_trainee(request)
         trainee.is_macronutrients_ratios_custom = False
         serializer = TraineeUpdateMacronutrientsRatiosSerializer(trainee)
         trainee.save()
+        dashboard_cache.bump(request.user.id)
         return Response(serializer.data)
 
     @action(detail=False, methods=['GET', 'PATCH'])
     def set_macronutrients_ratios(self, request):
-        trainee = get_object_or_404(Trainee, user_id=request.user.id)
+        trainee = load_trainee(request)
         if request.method == 'GET':
             serializer = TraineeUpdateMacronutrientsRatiosSerializer(trainee)
             return Response(serializer.data)
@@ -130,22 +151,122 @@ class TraineeViewSet(CreateModelMixin, GenericViewSet):
             return Response(serializer.data)
 
 
-def activate_user(request, uid, token):
-    if settings.DEBUG:
-        url = 'http://127.0.0.1:8000/auth/users/activation/'
-    else:
-        url = 'https://exerdiet.pythonanywhere.com/auth/users/activation/'
+class ImageUploadViewSet(CreateModelMixin, RetrieveModelMixin, DestroyModelMixin, GenericViewSet):
+    serializer_class = ImageUploadSerializer
+
+    def get_queryset(self):
+        return ImageUpload.objects.filter(trainee=self.request.trainee,
+                                          status=ImageUpload.Status.UPLOADING)
+
+    def get_serializer_context(self):
+        return {'trainee': self.request.trainee}
+
+    def perform_destroy(self, instance):
+        uploads.delete_part(instance)
+        instance.delete()
+
+    @action(detail=True, methods=['PUT'])
+    def chunk(self, request, pk):
+        upload = self.get_object()
+        content_range = uploads.parse_content_range(
+            request.headers.get('Content-Range'))
+        try:
+            length = int(request.headers.get('Content-Length') or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            raise ValidationError(
+                {'error': 'Chunks need a valid Content-Length header.'})
+        if content_range is None or content_range[2] != upload.size or \
+                content_range[1] >= upload.size or \
+                content_range[1] - content_range[0] + 1 != length:
+            return Response({'error': 'Chunks need a Content-Range header within the upload size.'},
+                            status=status.HTTP_400_BAD_REQUEST)
+        if length > settings.CHUNKED_UPLOADS['MAX_CHUNK_SIZE']:
+            return Response({'error': 'Chunk is too large.'},
+                            status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        if content_range[0] != upload.offset:
+            return Response({'error': 'Chunk does not start at the upload offset.',
+                             'offset': upload.offset},
+                            status=status.HTTP_409_CONFLICT)
+
+        offset = uploads.write_chunk(upload, request.stream, content_range[0], length)
+        if offset is None:
+            upload.refresh_from_db()
+            return Response({'error': 'Chunk was not written.',
+                             'offset': upload.offset},
+                            status=status.HTTP_409_CONFLICT)
+        upload.offset = offset
+        return Response(ImageUploadSerializer(upload).data)
+
+    @action(detail=True, methods=['POST'])
+    def complete(self, request, pk):
+        upload = self.get_object()
+        serializer = ImageUploadCompleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        instance = uploads.get_target(request.trainee,
+                                      serializer.validated_data['target'],
+                                      serializer.validated_data.get('id'))
+        if instance is None:
+            return Response({'error': 'No object with the given id was found.'},
+                            status=status.HTTP_404_NOT_FOUND)
+        if upload.offset != upload.size:
+            return Response({'error': 'Upload is not finished.',
+                             'offset': upload.offset},
+                            status=status.HTTP_409_CONFLICT)
+        if uploads.checksum(upload) != upload.checksum or not uploads.is_image(upload):
+            # The received bytes are dropped and the upload starts over.
+            uploads.create_part(upload)
+            ImageUpload.objects.filter(pk=upload.pk).update(offset=0)
+            return Response({'error': 'Upload does not match its checksum or is not a valid image.'},
+                            status=status.HTTP_400_BAD_REQUEST)
 
-    data = {
-        'uid': uid,
-        'token': token
-    }
+        uploads.attach(upload, instance)
+        # Uploading chunks leaves the dashboard alone, but it shows the
+        # trainee's image.
+        if isinstance(instance, Trainee):
+            dashboard_cache.bump(request.user.id)
+        return Response({'image': instance.image.url})
 
+
+def _djoser_context(request):
+    # djoser's serializers check the token with the generator of their view.
+    return {'request': request, 'view': UserViewSet(request=request)}
+
+
+def _render_failure(request, title, errors, status, retry_url=None):
+    return render(request, 'link_failed.html',
+                  {'title': title, 'errors': errors, 'retry_url': retry_url},
+                  status=status)
+
+
+def _error_messages(serializer):
+    return [str(error) for errors in serializer.errors.values() for error in errors]
+
+
+def activate_user(request, uid, token):
+    serializer = djoser_settings.SERIALIZERS.activation(
+        data={'uid': uid, 'token': token}, context=_djoser_context(request))
     try:
-        post(url, data=data, timeout=1)
-        return render(request, 'activated.html')
-    except Timeout:
-        return render(request, 'activated.html')
+        is_valid = serializer.is_valid()
+    except PermissionDenied as error:
+        # The account was already activated with this link.
+        return _render_failure(request, 'Account Activation Failed',
+                               [str(error.detail)], status.HTTP_403_FORBIDDEN)
+    if not is_valid:
+        return _render_failure(request, 'Account Activation Failed',
+                               _error_messages(serializer), status.HTTP_400_BAD_REQUEST)
+
+    user = serializer.user
+    user.is_active = True
+    user.save()
+    signals.user_activated.send(sender=UserViewSet, user=user, request=request)
+
+    if djoser_settings.SEND_CONFIRMATION_EMAIL:
+        context = {'user': user}
+        to = [get_user_email(user)]
+        djoser_settings.EMAIL.confirmation(request, context).send(to)
+    return render(request, 'activated.html')
 
 
 def reset_password(request, uid, token):
@@ -155,19 +276,23 @@ def reset_password(request, uid, token):
 
 
 def process_reset_password(request, password, uid, token):
-    if settings.DEBUG:
-        url = 'http://127.0.0.1:8000/auth/users/reset_password_confirm/'
-    else:
-        url = 'https://exerdiet.pythonanywhere.com/auth/users/reset_password_confirm/'
+    serializer = djoser_settings.SERIALIZERS.password_reset_confirm(
+        data={'uid': uid, 'token': token, 'new_password': password},
+        context=_djoser_context(request))
+    if not serializer.is_valid():
+        # Only passwords that fail validation can be retried with this link.
+        retry_url = request.path if set(serializer.errors) == {'new_password'} else None
+        return _render_failure(request, 'Password Change Failed',
+                               _error_messages(serializer), status.HTTP_400_BAD_REQUEST,
+                               retry_url)
 
-    data = {
-        'uid': uid,
-        'token': token,
-        'new_password': password
-    }
+    user = serializer.user
+    user.set_password(serializer.data['new_password'])
+    user.last_login = now()
+    user.save()
 
-    try:
-        post(url, data=data, timeout=1)
-        return render(request, 'password_changed.html')
-    except Timeout:
-        return render(request, 'password_changed.html')
+    if djoser_settings.PASSWORD_CHANGED_EMAIL_CONFIRMATION:
+        context = {'user': user}
+        to = [get_user_email(user)]
+        djoser_settings.EMAIL.password_changed_confirmation(request, context).send(to)
+    return render(request, 'password_changed.html')
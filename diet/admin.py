@@ -4,6 +4,7 @@ from django.db.models import Count
 from django.http.request import HttpRequest
 from django.utils.html import format_html
 from django.urls import reverse
+from core.images import thumbnail_url
 from . import models
 
 
@@ -139,9 +140,9 @@ class CustomFoodFilter(admin.SimpleListFilter):
 
     def queryset(self, request, queryset):
         if self.value() == self.FILTER_CUSTOM:
-            return queryset.filter(customfood__isnull=False)
+            return queryset.filter(is_custom=True)
         if self.value() == self.FILTER_NOT_CUSTOM:
-            return queryset.exclude(customfood__isnull=False)
+            return queryset.filter(is_custom=False)
 
 
 @admin.register(models.Food)
@@ -163,7 +164,7 @@ class FoodAdmin(admin.ModelAdmin):
 
     def thumbnail(self, food: models.Food):
         if food.image.name != '':
-            return format_html(f'<img src="{food.image.url}" class="thumbnail"/>')
+            return format_html(f'<img src="{thumbnail_url(food)}" class="thumbnail"/>')
         return ''
 
     @admin.display(ordering='calories')
@@ -207,7 +208,7 @@ class CustomFoodAdmin(admin.ModelAdmin):
 
     def thumbnail(self, custom_food: models.CustomFood):
         if custom_food.image.name != '':
-            return format_html(f'<img src="{custom_food.image.url}" class="thumbnail"/>')
+            return format_html(f'<img src="{thumbnail_url(custom_food)}" class="thumbnail"/>')
         return ''
 
     @admin.display(ordering='trainee__user__username')
@@ -309,7 +310,7 @@ class RecipeAdmin(admin.ModelAdmin):
 
     def thumbnail(self, recipe: models.Recipe):
         if recipe.image.name != '':
-            return format_html(f'<img src="{recipe.image.url}" class="thumbnail"/>')
+            return format_html(f'<img src="{thumbnail_url(recipe)}" class="thumbnail"/>')
         return ''
 
     @admin.display(ordering='trainee__user__username')
@@ -355,7 +356,7 @@ class MealAdmin(admin.ModelAdmin):
     autocomplete_fields = ['trainee']
     exclude = ['recipes']
     list_display = ['name', 'trainee_username', 'time_eaten']
-    list_filter = ['time_eaten']
+    list_filter = ['eaten_on']
     list_per_page = 100
     list_select_related = ['trainee__user']
     inlines = [RecipeMealInline, FoodInstanceMealInline]
@@ -19,6 +19,7 @@ class MealFilter(filters.FilterSet):
         model = Meal
         fields = {
             'time_eaten': ['gte', 'lte'],
+            'eaten_on': ['exact', 'gte', 'lte'],
         }
 
 
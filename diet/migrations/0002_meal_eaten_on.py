@@ -0,0 +1,35 @@
+# Generated by Django 4.2.2 on 2026-10-18 06:46
+
+from django.db import migrations, models
+from django.db.models.functions import TruncDate
+
+
+def populate_eaten_on(apps, schema_editor):
+    Meal = apps.get_model('diet', 'Meal')
+    Meal.objects.update(eaten_on=TruncDate('time_eaten'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('diet', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='meal',
+            name='eaten_on',
+            field=models.DateField(editable=False, null=True),
+        ),
+        migrations.RunPython(populate_eaten_on, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='meal',
+            name='eaten_on',
+            field=models.DateField(editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='meal',
+            index=models.Index(fields=['trainee', 'eaten_on'], name='diet_meal_trainee_a7685b_idx'),
+        ),
+    ]
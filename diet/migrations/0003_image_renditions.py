@@ -0,0 +1,23 @@
+# Generated by Django 4.2.2 on 2026-10-18 07:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('diet', '0002_meal_eaten_on'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='food',
+            name='image_renditions',
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='recipe',
+            name='image_renditions',
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.2 on 2026-10-18 08:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('diet', '0003_image_renditions'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='meal',
+            index=models.Index(fields=['trainee', 'time_eaten', 'id'], name='diet_meal_trainee_36004b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='water',
+            index=models.Index(fields=['trainee', 'drinking_date', 'id'], name='diet_water_trainee_b2224a_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.2 on 2026-10-18 07:22
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_food_owners(apps, schema_editor):
+    Food = apps.get_model('diet', 'Food')
+    CustomFood = apps.get_model('diet', 'CustomFood')
+    ids_by_trainee = {}
+    for id, trainee_id in CustomFood.objects.values_list('food_ptr_id', 'trainee_id'):
+        ids_by_trainee.setdefault(trainee_id, []).append(id)
+    for trainee_id, ids in ids_by_trainee.items():
+        Food.objects.filter(id__in=ids)\
+            .update(is_custom=True, owner_trainee_id=trainee_id)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_catalog_version'),
+        ('diet', '0004_timeline_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='food',
+            name='is_custom',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name='food',
+            name='owner_trainee',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.trainee'),
+        ),
+        migrations.RunPython(populate_food_owners, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='food',
+            index=models.Index(fields=['is_custom', 'name'], name='diet_food_is_cust_483c18_idx'),
+        ),
+    ]
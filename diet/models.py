@@ -1,5 +1,6 @@
 from django.core.validators import MinValueValidator
 from django.db import models
+from django.utils import timezone
 from datetime import datetime, date
 from core.models import Trainee
 from core.validators import validate_image_size
@@ -24,6 +25,17 @@ class Food(models.Model):
         max_digits=4, decimal_places=1, validators=[MinValueValidator(0)])
     image = models.ImageField(
         upload_to='diet/images/foods', null=True, blank=True, validators=[validate_image_size])
+    image_renditions = models.JSONField(null=True, blank=True, editable=False)
+    # Copied from CustomFood, so the catalog is queried without joining it.
+    is_custom = models.BooleanField(default=False, editable=False)
+    owner_trainee = models.ForeignKey(
+        Trainee, on_delete=models.CASCADE, null=True, blank=True, editable=False, related_name='+'
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['is_custom', 'name']),
+        ]
 
     def __str__(self) -> str:
         food_str = self.name + ' (' + str(self.calories) + ' cals/'
@@ -46,6 +58,14 @@ class CustomFood(Food):
         verbose_name = "Custom Food"
         verbose_name_plural = "Custom Foods"
 
+    def save(self, *args, **kwargs):
+        self.is_custom = True
+        self.owner_trainee_id = self.trainee_id
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'trainee' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'is_custom', 'owner_trainee'}
+        super().save(*args, **kwargs)
+
     def __str__(self) -> str:
         custom_food_str = self.name + ' (' + str(self.calories) + ' cals/'
         if self.category == self.Category.FOOD:
@@ -63,6 +83,7 @@ class Recipe(models.Model):
     instructions = models.TextField(null=True, blank=True)
     image = models.ImageField(
         upload_to='diet/images/recipes', null=True, blank=True, validators=[validate_image_size])
+    image_renditions = models.JSONField(null=True, blank=True, editable=False)
     trainee = models.ForeignKey(
         Trainee, on_delete=models.CASCADE, related_name='recipes'
     )
@@ -98,11 +119,18 @@ class Recipe(models.Model):
 class Meal(models.Model):
     name = models.CharField(max_length=150)
     time_eaten = models.DateTimeField(auto_now_add=True)
+    eaten_on = models.DateField(editable=False)
     trainee = models.ForeignKey(
         Trainee, on_delete=models.CASCADE, related_name='meals'
     )
     recipes = models.ManyToManyField(Recipe, related_name='meals', blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['trainee', 'eaten_on']),
+            models.Index(fields=['trainee', 'time_eaten', 'id']),
+        ]
+
     def __str__(self) -> str:
         return self.name + ' (' + str(self.get_total_calories()) + 'cals)' + ' / ' + str(self.trainee) + ' / ' + str(self.time_eaten)
 
@@ -141,8 +169,18 @@ class Meal(models.Model):
     def save(self, *args, **kwargs):
         if not self.name:
             self.name = 'Meal @ ' + str(datetime.today())
+        self.eaten_on = timezone.localdate(self.time_eaten or timezone.now())
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'time_eaten' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'eaten_on'}
         super().save(*args, **kwargs)
 
+        # auto_now_add stamps time_eaten while saving, possibly past midnight.
+        eaten_on = timezone.localdate(self.time_eaten)
+        if self.eaten_on != eaten_on:
+            self.eaten_on = eaten_on
+            Meal.objects.filter(pk=self.pk).update(eaten_on=eaten_on)
+
 
 class FoodInstance(models.Model):
     quantity = models.DecimalField(
@@ -206,6 +244,11 @@ class Water(models.Model):
         Trainee, on_delete=models.CASCADE, related_name='waters'
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['trainee', 'drinking_date', 'id']),
+        ]
+
     def save(self, *args, **kwargs):
         if not self.drinking_date:
             self.drinking_date = date.today()
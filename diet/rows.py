@@ -0,0 +1,51 @@
+from core.images import rendition_urls_from
+from core.rows import RowReader, decimal_field
+from .models import Food, FoodInstance
+
+FOOD_COLUMNS = ['id', 'name', 'category', 'calories',
+                'carbs', 'fats', 'protein', 'image', 'image_renditions']
+
+_storage = Food._meta.get_field('image').storage
+_carbs = decimal_field(Food, 'carbs')
+_fats = decimal_field(Food, 'fats')
+_protein = decimal_field(Food, 'protein')
+_quantity = decimal_field(FoodInstance, 'quantity')
+
+
+def food_to_dict(id, name, category, calories, carbs, fats, protein, image, image_renditions):
+    # FoodSerializer and SimpleFoodSerializer
+    return {
+        'id': id,
+        'name': name,
+        'category': category,
+        'calories': calories,
+        'carbs': _carbs(carbs),
+        'fats': _fats(fats),
+        'protein': _protein(protein),
+        'image': _storage.url(image) if image else None,
+        'image_renditions': rendition_urls_from(_storage, image, image_renditions),
+    }
+
+
+def food_instance_to_dict(id, quantity, *food):
+    # FoodInstanceSerializer, with the totals of FoodInstance
+    category, calories, carbs, fats, protein = food[2:7]
+    total_calories = 0
+    if category == Food.Category.SEASONING:
+        total_calories += calories * quantity
+    total_calories += calories * quantity / 100
+    return {
+        'id': id,
+        'food': food_to_dict(*food),
+        'quantity': _quantity(quantity),
+        'total_calories': int(total_calories),
+        'total_carbs': round(carbs * quantity / 100, 1),
+        'total_fats': round(fats * quantity / 100, 1),
+        'total_protein': round(protein * quantity / 100, 1),
+    }
+
+
+food_reader = RowReader(FOOD_COLUMNS, food_to_dict)
+food_instance_reader = RowReader(
+    ['id', 'quantity'] + [f'food__{column}' for column in FOOD_COLUMNS],
+    food_instance_to_dict)
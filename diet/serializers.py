@@ -1,21 +1,30 @@
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 from rest_framework import serializers
-from core.models import Trainee
+from core import ledger
+from core.images import rendition_urls
+from core.ownership import Resolver, ResolvedIdField
 from .models import Food, CustomFood, Recipe, Meal, FoodInstance, Water
 
+foods = Resolver(Food, 'No food with the given id was found.')
+
 
 class FoodSerializer(serializers.ModelSerializer):
     image = serializers.SerializerMethodField()
+    image_renditions = serializers.SerializerMethodField()
 
     def get_image(self, food: Food):
         if food.image:
             return food.image.url
         return None
 
+    def get_image_renditions(self, food: Food):
+        return rendition_urls(food)
+
     class Meta:
         model = Food
         fields = ['id', 'name', 'category', 'calories',
-                  'carbs', 'fats', 'protein', 'image']
+                  'carbs', 'fats', 'protein', 'image', 'image_renditions']
 
 
 class CustomFoodCreateSerializer(serializers.ModelSerializer):
@@ -27,8 +36,7 @@ class CustomFoodCreateSerializer(serializers.ModelSerializer):
                   'carbs', 'fats', 'protein', 'image']
 
     def create(self, validated_data):
-        user_id = self.context['user_id']
-        trainee = Trainee.objects.get(user_id=user_id)
+        trainee = self.context['trainee']
         custom_food = CustomFood(**validated_data)
         custom_food.trainee = trainee
         custom_food.save()
@@ -43,10 +51,15 @@ class CustomFoodUpdateSerializer(serializers.ModelSerializer):
 
 
 class SimpleFoodSerializer(serializers.ModelSerializer):
+    image_renditions = serializers.SerializerMethodField()
+
+    def get_image_renditions(self, food: Food):
+        return rendition_urls(food)
+
     class Meta:
         model = Food
         fields = ['id', 'name', 'category', 'calories',
-                  'carbs', 'fats', 'protein', 'image']
+                  'carbs', 'fats', 'protein', 'image', 'image_renditions']
 
 
 class FoodInstanceSerializer(serializers.ModelSerializer):
@@ -76,30 +89,14 @@ class FoodInstanceSerializer(serializers.ModelSerializer):
 
 class FoodInstanceCreateSerializer(serializers.ModelSerializer):
     id = serializers.IntegerField(read_only=True)
-    food_id = serializers.IntegerField()
-
-    def validate_food_id(self, value):
-        user_id = self.context['user_id']
-        trainee = Trainee.objects.get(user_id=user_id)
-
-        if not Food.objects.filter(id=value).exists():
-            raise serializers.ValidationError(
-                'No food with the given id was found.'
-            )
-        if Food.objects.filter(id=value, customfood__isnull=False).exists():
-            if not CustomFood.objects.filter(food_ptr_id=value, trainee=trainee).exists():
-                raise serializers.ValidationError(
-                    'No food with the given id was found.'
-                )
-        return value
+    food_id = ResolvedIdField(foods, source='food')
 
     class Meta:
         model = FoodInstance
         fields = ['id', 'food_id', 'quantity']
 
     def create(self, validated_data):
-        user_id = self.context['user_id']
-        trainee = get_object_or_404(Trainee, user_id=user_id)
+        trainee = self.context['trainee']
         recipe_id = self.context.get('recipe_id')
         meal_id = self.context.get('meal_id')
         if recipe_id:
@@ -121,6 +118,7 @@ class FoodInstanceUpdateSerializer(serializers.ModelSerializer):
 
 
 class RecipeSerializer(serializers.ModelSerializer):
+    image_renditions = serializers.SerializerMethodField()
     food_instances = FoodInstanceSerializer(many=True, read_only=True)
     total_calories = serializers.SerializerMethodField(read_only=True)
     total_carbs = serializers.SerializerMethodField(read_only=True)
@@ -139,14 +137,16 @@ class RecipeSerializer(serializers.ModelSerializer):
     def get_total_protein(self, recipe: Recipe):
         return recipe.get_total_protein()
 
+    def get_image_renditions(self, recipe: Recipe):
+        return rendition_urls(recipe)
+
     class Meta:
         model = Recipe
-        fields = ['id', 'name', 'instructions', 'image', 'food_instances',
-                  'total_calories', 'total_carbs', 'total_fats', 'total_protein']
+        fields = ['id', 'name', 'instructions', 'image', 'image_renditions',
+                  'food_instances', 'total_calories', 'total_carbs', 'total_fats', 'total_protein']
 
     def create(self, validated_data):
-        user_id = self.context['user_id']
-        trainee = Trainee.objects.get(user_id=user_id)
+        trainee = self.context['trainee']
         recipe = Recipe(**validated_data)
         recipe.trainee = trainee
         recipe.save()
@@ -160,6 +160,7 @@ class RecipeUpdateSerializer(serializers.ModelSerializer):
 
 
 class SimpleRecipeSerializer(serializers.ModelSerializer):
+    image_renditions = serializers.SerializerMethodField()
     food_instances = FoodInstanceSerializer(many=True, read_only=True)
     total_calories = serializers.SerializerMethodField(read_only=True)
     total_carbs = serializers.SerializerMethodField(read_only=True)
@@ -178,10 +179,13 @@ class SimpleRecipeSerializer(serializers.ModelSerializer):
     def get_total_protein(self, recipe: Recipe):
         return recipe.get_total_protein()
 
+    def get_image_renditions(self, recipe: Recipe):
+        return rendition_urls(recipe)
+
     class Meta:
         model = Recipe
-        fields = ['id', 'name', 'instructions', 'image', 'food_instances',
-                  'total_calories', 'total_carbs', 'total_fats', 'total_protein']
+        fields = ['id', 'name', 'instructions', 'image', 'image_renditions',
+                  'food_instances', 'total_calories', 'total_carbs', 'total_fats', 'total_protein']
 
 
 class MealSerializer(serializers.ModelSerializer):
@@ -211,14 +215,73 @@ class MealSerializer(serializers.ModelSerializer):
                   'total_calories', 'total_carbs', 'total_fats', 'total_protein']
 
     def create(self, validated_data):
-        user_id = self.context['user_id']
-        trainee = Trainee.objects.get(user_id=user_id)
+        trainee = self.context['trainee']
         meal = Meal(**validated_data)
         meal.trainee = trainee
         meal.save()
         return meal
 
 
+class MealFoodInstanceLogSerializer(serializers.ModelSerializer):
+    food_id = serializers.IntegerField()
+
+    class Meta:
+        model = FoodInstance
+        fields = ['food_id', 'quantity']
+
+
+class MealLogSerializer(serializers.ModelSerializer):
+    # Creates a meal with its food instances and recipes at once. The foods
+    # and recipes are checked with one query each, and the meal's rows are
+    # inserted in bulk, so the ledger is refreshed here instead of by signals.
+    name = serializers.CharField(max_length=150, required=False)
+    food_instances = MealFoodInstanceLogSerializer(many=True, required=False)
+    recipe_ids = serializers.ListField(
+        child=serializers.IntegerField(), required=False)
+
+    def validate_food_instances(self, food_instances):
+        found = foods.resolve([food_instance['food_id'] for food_instance in food_instances],
+                              self.context['trainee'])
+        errors = [{} if food_instance['food_id'] in found else
+                  {'food_id': [foods.message]}
+                  for food_instance in food_instances]
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        return [{'food': found[food_instance['food_id']], 'quantity': food_instance['quantity']}
+                for food_instance in food_instances]
+
+    def validate_recipe_ids(self, recipe_ids):
+        trainee = self.context['trainee']
+        found = set(Recipe.objects
+                    .filter(id__in=recipe_ids, trainee=trainee)
+                    .values_list('id', flat=True))
+        errors = {index: ['No recipe with the given id was found.']
+                  for index, recipe_id in enumerate(recipe_ids) if recipe_id not in found}
+        if errors:
+            raise serializers.ValidationError(errors)
+        return list(dict.fromkeys(recipe_ids))
+
+    class Meta:
+        model = Meal
+        fields = ['name', 'food_instances', 'recipe_ids']
+
+    def create(self, validated_data):
+        trainee = self.context['trainee']
+        food_instances = validated_data.pop('food_instances', [])
+        recipe_ids = validated_data.pop('recipe_ids', [])
+        with transaction.atomic():
+            meal = Meal(**validated_data)
+            meal.trainee = trainee
+            meal.save()
+            FoodInstance.objects.bulk_create(
+                [FoodInstance(meal=meal, **food_instance) for food_instance in food_instances])
+            Meal.recipes.through.objects.bulk_create(
+                [Meal.recipes.through(meal=meal, recipe_id=recipe_id) for recipe_id in recipe_ids])
+            if food_instances or recipe_ids:
+                ledger.refresh(trainee.id, [meal.eaten_on])
+        return meal
+
+
 class MealUpdateSerializer(serializers.ModelSerializer):
     time_eaten = serializers.DateTimeField()
 
@@ -231,8 +294,7 @@ class MealAddRecipeSerializer(serializers.ModelSerializer):
     id = serializers.IntegerField()
 
     def validate_id(self, recipe_id):
-        user_id = self.context['user_id']
-        trainee = Trainee.objects.get(user_id=user_id)
+        trainee = self.context['trainee']
 
         if not Recipe.objects.filter(id=recipe_id, trainee=trainee).exists():
             raise serializers.ValidationError(
@@ -245,8 +307,7 @@ class MealAddRecipeSerializer(serializers.ModelSerializer):
         fields = ['id']
 
     def create(self, validated_data):
-        user_id = self.context['user_id']
-        trainee = get_object_or_404(Trainee, user_id=user_id)
+        trainee = self.context['trainee']
         recipe_id = validated_data['id']
         meal_id = self.context['meal_id']
         meal = get_object_or_404(Meal, id=meal_id, trainee=trainee)
@@ -263,8 +324,7 @@ class WaterSerializer(serializers.ModelSerializer):
         fields = ['id', 'amount', 'drinking_date']
 
     def create(self, validated_data):
-        user_id = self.context['user_id']
-        trainee = Trainee.objects.get(user_id=user_id)
+        trainee = self.context['trainee']
         water = Water(**validated_data)
         water.trainee = trainee
         water.save()
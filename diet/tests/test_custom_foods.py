@@ -2,7 +2,7 @@ from model_bakery import baker
 from rest_framework import status
 import pytest
 from core.models import Trainee
-from diet.models import CustomFood
+from diet.models import Food, CustomFood
 
 
 @pytest.fixture
@@ -75,6 +75,21 @@ class TestCreateCustomFood:
         assert response.status_code == status.HTTP_201_CREATED
         assert response.data['id'] > 0
 
+    def test_custom_food_is_marked_with_its_owner(self, authenticate_with_trainee, create_custom_food):
+        authenticate_with_trainee()
+
+        response = create_custom_food({
+            "name": "a",
+            "calories": 0,
+            "carbs": 0,
+            "fats": 0,
+            "protein": 0
+        })
+
+        food = Food.objects.get(id=response.data['id'])
+        assert food.is_custom
+        assert food.owner_trainee == Trainee.objects.get()
+
 
 @pytest.mark.django_db
 class TestRetrieveCustomFood:
@@ -106,7 +121,8 @@ class TestRetrieveCustomFood:
             "carbs": custom_food.carbs,
             "fats": custom_food.fats,
             "protein": custom_food.protein,
-            "image": custom_food.image
+            "image": custom_food.image,
+            "image_renditions": None
         }
 
     def test_if_custom_food_exists_with_other_trainee_returns_404(self, api_client, retrieve_custom_food):
@@ -142,7 +158,8 @@ class TestListCustomFood:
             "carbs": custom_food.carbs,
             "fats": custom_food.fats,
             "protein": custom_food.protein,
-            "image": custom_food.image
+            "image": custom_food.image,
+            "image_renditions": None
         }
 
 
@@ -0,0 +1,111 @@
+from decimal import Decimal
+from django.core.management import call_command
+from model_bakery import baker
+from rest_framework.renderers import JSONRenderer
+import pytest
+from core.models import Trainee
+from diet.models import Food, CustomFood, FoodInstance, Recipe, Meal
+from diet.rows import food_reader, food_instance_reader
+from diet.serializers import FoodSerializer, FoodInstanceSerializer
+
+IMAGE = 'diet/images/foods/apple.jpg'
+RENDITIONS = {
+    'source': IMAGE,
+    'thumb': {'webp': 'renditions/apple-thumb.webp', 'jpeg': 'renditions/apple-thumb.jpg'},
+}
+
+
+def render(data):
+    return JSONRenderer().render(data)
+
+
+def make_foods(model=Food, **kwargs):
+    return [
+        baker.make(model, category=Food.Category.FOOD, calories=52,
+                   carbs=Decimal('13.8'), fats=Decimal('0.2'), protein=Decimal('0.3'),
+                   image=IMAGE, image_renditions=RENDITIONS, **kwargs),
+        baker.make(model, category=Food.Category.SEASONING, calories=7,
+                   carbs=Decimal('1.5'), fats=Decimal('0'), protein=Decimal('99.9'),
+                   image=IMAGE, image_renditions={**RENDITIONS, 'source': 'old.jpg'}, **kwargs),
+        baker.make(model, category=Food.Category.BEVERAGE, calories=0,
+                   carbs=Decimal('0.1'), fats=Decimal('0.0'), protein=Decimal('0'), **kwargs),
+    ]
+
+
+@pytest.mark.django_db
+class TestFoodRows:
+    def test_rows_render_like_the_serializer(self):
+        make_foods()
+        queryset = Food.objects.order_by('id')
+
+        rows = food_reader.read(food_reader.values(queryset))
+
+        assert render(rows) == render(FoodSerializer(queryset, many=True).data)
+
+    def test_food_list_renders_like_the_serializer(self, authenticate_with_trainee, api_client):
+        authenticate_with_trainee()
+        make_foods()
+
+        response = api_client.get('/diet/foods/')
+
+        assert response.content == api_client.get('/diet/foods/?fields=').content
+
+    def test_custom_food_list_renders_like_the_serializer(self, authenticate_with_trainee, api_client):
+        authenticate_with_trainee()
+        make_foods(CustomFood, trainee=Trainee.objects.get())
+
+        response = api_client.get('/diet/custom_foods/?ordering=-calories')
+
+        assert response.content == \
+            api_client.get('/diet/custom_foods/?ordering=-calories&fields=').content
+
+
+@pytest.mark.django_db
+class TestFoodInstanceRows:
+    def test_rows_render_like_the_serializer(self):
+        for food in make_foods():
+            for quantity in ['1', '33.3', '150.5', '9999.9']:
+                baker.make(FoodInstance, food=food, quantity=Decimal(quantity))
+        queryset = FoodInstance.objects.order_by('id')
+
+        rows = food_instance_reader.read(food_instance_reader.values(queryset))
+
+        assert render(rows) == \
+            render(FoodInstanceSerializer(queryset.select_related('food'), many=True).data)
+
+    def test_recipe_food_instances_render_like_the_serializer(self, authenticate_with_trainee, api_client):
+        authenticate_with_trainee()
+        recipe = baker.make(Recipe, trainee=Trainee.objects.get())
+        for food in make_foods():
+            baker.make(FoodInstance, food=food, recipe=recipe, quantity=Decimal('12.5'))
+        url = f'/diet/recipes/{recipe.id}/food_instances/'
+
+        response = api_client.get(url)
+
+        assert response.content == api_client.get(url + '?fields=').content
+
+    def test_meal_food_instances_render_like_the_serializer(self, authenticate_with_trainee, api_client):
+        authenticate_with_trainee()
+        meal = baker.make(Meal, trainee=Trainee.objects.get())
+        for food in make_foods():
+            baker.make(FoodInstance, food=food, meal=meal, quantity=Decimal('250'))
+        url = f'/diet/meals/{meal.id}/food_instances/'
+
+        response = api_client.get(url)
+
+        assert response.content == api_client.get(url + '?fields=').content
+
+
+@pytest.mark.django_db
+class TestBenchmarkReads:
+    def test_endpoints_render_identical_output(self, capsys):
+        for food in make_foods():
+            baker.make(FoodInstance, food=food, quantity=Decimal('42.5'))
+
+        call_command('benchmark_reads', iterations=1)
+
+        out = capsys.readouterr().out
+        assert 'foods (3 rows)' in out
+        assert 'food_instances (3 rows)' in out
+        assert 'DIFFERENT' not in out
+        assert 'exercises: no rows, skipped' in out
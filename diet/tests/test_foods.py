@@ -1,7 +1,10 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from model_bakery import baker
 from rest_framework import status
 import pytest
-from diet.models import Food
+from core import catalog
+from diet.models import Food, CustomFood
 
 
 @pytest.fixture
@@ -69,7 +72,8 @@ class TestRetrieveFood:
             "carbs": food.carbs,
             "fats": food.fats,
             "protein": food.protein,
-            "image": food.image
+            "image": food.image,
+            "image_renditions": None
         }
 
 
@@ -95,5 +99,175 @@ class TestListFood:
             "carbs": food.carbs,
             "fats": food.fats,
             "protein": food.protein,
-            "image": food.image
+            "image": food.image,
+            "image_renditions": None
         }
+
+    def test_custom_foods_are_left_out_without_joining_them(self, authenticate_with_trainee, list_food):
+        authenticate_with_trainee()
+        food = baker.make(Food)
+        baker.make(CustomFood)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = list_food()
+
+        assert [result['id'] for result in response.data['results']] == [food.id]
+        assert not any('diet_custom_food' in query['sql'] for query in queries)
+
+
+@pytest.mark.django_db
+class TestConditionalFood:
+    def test_if_etag_matches_returns_304_without_querying_foods(self, api_client, authenticate_with_trainee, django_assert_num_queries):
+        authenticate_with_trainee()
+        baker.make(Food)
+        etag = api_client.get('/diet/foods/')['ETag']
+
+        with django_assert_num_queries(1):
+            response = api_client.get('/diet/foods/', HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response['ETag'] == etag
+        assert response.content == b''
+
+    def test_etag_depends_on_query_parameters(self, api_client, authenticate_with_trainee):
+        authenticate_with_trainee()
+        food = baker.make(Food)
+
+        list_etag = api_client.get('/diet/foods/')['ETag']
+        search_etag = api_client.get('/diet/foods/', {'search': 'a'})['ETag']
+        detail_response = api_client.get(f'/diet/foods/{food.id}/', HTTP_IF_NONE_MATCH=list_etag)
+
+        assert search_etag != list_etag
+        assert detail_response.status_code == status.HTTP_200_OK
+
+    def test_saving_a_food_changes_the_etag(self, api_client, authenticate_with_trainee):
+        authenticate_with_trainee()
+        food = baker.make(Food)
+        etag = api_client.get(f'/diet/foods/{food.id}/')['ETag']
+
+        food.calories += 1
+        food.save()
+        response = api_client.get(f'/diet/foods/{food.id}/', HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['calories'] == food.calories
+        assert response['ETag'] != etag
+
+    def test_custom_foods_do_not_change_the_etag(self, api_client, authenticate_with_trainee):
+        authenticate_with_trainee()
+        etag = api_client.get('/diet/foods/')['ETag']
+
+        baker.make(CustomFood).delete()
+        response = api_client.get('/diet/foods/', HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_seeding_foods_changes_the_etag(self, api_client, authenticate_with_trainee):
+        authenticate_with_trainee()
+        etag = api_client.get('/diet/foods/')['ETag']
+
+        catalog.bump(catalog.FOODS)
+        response = api_client.get('/diet/foods/', HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_missing_food_has_no_etag(self, api_client, authenticate_with_trainee):
+        authenticate_with_trainee()
+
+        response = api_client.get('/diet/foods/1/')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert not response.has_header('ETag')
+
+    def test_repeated_list_queries_are_served_from_the_cache(self, api_client, authenticate_with_trainee, django_assert_num_queries):
+        authenticate_with_trainee()
+        baker.make(Food, _quantity=3)
+        first_response = api_client.get('/diet/foods/', {'ordering': 'calories', 'search': ''})
+
+        with django_assert_num_queries(1):
+            response = api_client.get('/diet/foods/', {'search': '', 'ordering': 'calories'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == first_response.data
+
+    def test_cached_lists_are_served_as_rendered(self, api_client, authenticate_with_trainee):
+        authenticate_with_trainee()
+        baker.make(Food, _quantity=3)
+        first_response = api_client.get('/diet/foods/')
+
+        response = api_client.get('/diet/foods/')
+
+        assert response.content == first_response.content
+        assert response['Content-Type'] == first_response['Content-Type']
+        assert catalog.response_cache.hits == 1
+
+    def test_cached_links_keep_the_request_scheme(self, api_client, authenticate_with_trainee):
+        authenticate_with_trainee()
+        baker.make(Food, _quantity=101)
+        http_response = api_client.get('/diet/foods/')
+
+        https_response = api_client.get('/diet/foods/', secure=True)
+
+        assert http_response.data['next'].startswith('http://')
+        assert https_response.data['next'].startswith('https://')
+        assert https_response['ETag'] != http_response['ETag']
+
+    def test_browsable_api_lists_are_not_cached(self, api_client, authenticate_with_trainee):
+        authenticate_with_trainee()
+
+        response = api_client.get('/diet/foods/', HTTP_ACCEPT='text/html')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert catalog.response_cache.misses == 0
+
+
+@pytest.mark.django_db
+class TestSearchFood:
+    def test_results_are_ranked_by_relevance(self, api_client, authenticate_with_trainee):
+        authenticate_with_trainee()
+        grilled = baker.make(Food, name='Chicken Breast, Grilled with Skin')
+        breast = baker.make(Food, name='Chicken Breast')
+        baker.make(Food, name='Chickpeas')
+        baker.make(CustomFood, name='Chicken Breast')
+
+        response = api_client.get('/diet/foods/?search=chick brea')
+
+        assert [result['id'] for result in response.data['results']] == [breast.id, grilled.id]
+
+    def test_ordering_overrides_the_ranking(self, api_client, authenticate_with_trainee):
+        authenticate_with_trainee()
+        light = baker.make(Food, name='Chicken Breast, Grilled', calories=100)
+        heavy = baker.make(Food, name='Chicken Breast', calories=200)
+
+        response = api_client.get('/diet/foods/?search=chicken&ordering=calories')
+
+        assert [result['id'] for result in response.data['results']] == [light.id, heavy.id]
+
+    def test_ranked_results_are_paginated(self, api_client, authenticate_with_trainee):
+        authenticate_with_trainee()
+        foods = [baker.make(Food, name=f'Oats {number:03}') for number in range(150)]
+        baker.make(Food, name='Rice')
+
+        response = api_client.get('/diet/foods/?search=oats&page=2')
+
+        assert response.data['count'] == 150
+        assert [result['id'] for result in response.data['results']] == [food.id for food in foods[100:]]
+
+    def test_search_is_combined_with_the_filters(self, api_client, authenticate_with_trainee):
+        authenticate_with_trainee()
+        baker.make(Food, name='Oats', calories=400)
+        light = baker.make(Food, name='Oats, Light', calories=100)
+
+        response = api_client.get('/diet/foods/?search=oats&calories__lte=200')
+
+        assert response.data['count'] == 1
+        assert [result['id'] for result in response.data['results']] == [light.id]
+
+    def test_index_is_refreshed_when_the_catalog_changes(self, api_client, authenticate_with_trainee):
+        authenticate_with_trainee()
+        api_client.get('/diet/foods/?search=oats')
+
+        food = baker.make(Food, name='Rolled Oats')
+        response = api_client.get('/diet/foods/?search=oats')
+
+        assert [result['id'] for result in response.data['results']] == [food.id]
@@ -1,7 +1,10 @@
+from datetime import timedelta
+from decimal import Decimal
+from django.utils import timezone
 from model_bakery import baker
 from rest_framework import status
 import pytest
-from core.models import Trainee
+from core.models import DailyLedger, Trainee
 from diet.models import Meal, Food, CustomFood, FoodInstance, Recipe
 
 
@@ -103,6 +106,13 @@ def delete_recipe(api_client):
     return do_delete_recipe
 
 
+@pytest.fixture
+def log_meal(api_client):
+    def do_log_meal(meal):
+        return api_client.post('/diet/meals/log/', meal, format='json')
+    return do_log_meal
+
+
 @pytest.mark.django_db
 class TestCreateMeal:
     def test_if_user_is_anonymous_returns_401(self, create_meal):
@@ -121,6 +131,90 @@ class TestCreateMeal:
         assert response.data['id'] > 0
 
 
+@pytest.mark.django_db
+class TestLogMeal:
+    def test_if_user_is_anonymous_returns_401(self, log_meal):
+        response = log_meal({})
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_if_data_is_valid_returns_201_with_the_meal(self, authenticate_with_trainee, log_meal):
+        authenticate_with_trainee()
+        trainee = Trainee.objects.get()
+        food = baker.make(Food, calories=100, carbs=Decimal('10.0'))
+        custom_food = baker.make(CustomFood, trainee=trainee, calories=50)
+        recipe = baker.make(Recipe, trainee=trainee)
+
+        response = log_meal({
+            'name': 'Breakfast',
+            'food_instances': [{'food_id': food.id, 'quantity': '150.0'},
+                               {'food_id': custom_food.id, 'quantity': '20.0'}],
+            'recipe_ids': [recipe.id, recipe.id],
+        })
+
+        assert response.status_code == status.HTTP_201_CREATED
+        meal = Meal.objects.get()
+        assert response.data['id'] == meal.id
+        assert response.data['name'] == 'Breakfast'
+        assert [food_instance['food']['id'] for food_instance in response.data['food_instances']] == \
+            [food.id, custom_food.id]
+        assert [recipe['id'] for recipe in response.data['recipes']] == [recipe.id]
+        assert response.data['total_calories'] == 160
+        assert DailyLedger.objects.get(trainee=trainee, day=meal.eaten_on).calories == 160
+
+    def test_references_are_checked_with_one_query_per_model(self, authenticate_with_trainee, log_meal, django_assert_max_num_queries):
+        authenticate_with_trainee()
+        trainee = Trainee.objects.get()
+        foods = baker.make(Food, calories=100, _quantity=10)
+        recipes = baker.make(Recipe, trainee=trainee, _quantity=5)
+        meal = {
+            'food_instances': [{'food_id': food.id, 'quantity': '10.0'} for food in foods],
+            'recipe_ids': [recipe.id for recipe in recipes],
+        }
+
+        with django_assert_max_num_queries(22):
+            response = log_meal(meal)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert FoodInstance.objects.filter(meal_id=response.data['id']).count() == 10
+
+    def test_if_food_belongs_to_another_trainee_returns_400(self, authenticate_with_trainee, log_meal):
+        authenticate_with_trainee()
+        food = baker.make(Food)
+        custom_food = baker.make(CustomFood)
+
+        response = log_meal({
+            'food_instances': [{'food_id': food.id, 'quantity': '10.0'},
+                               {'food_id': custom_food.id, 'quantity': '10.0'}],
+        })
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['food_instances'][0] == {}
+        assert response.data['food_instances'][1]['food_id'] is not None
+        assert not Meal.objects.exists()
+
+    def test_if_recipe_belongs_to_another_trainee_returns_400(self, authenticate_with_trainee, log_meal):
+        authenticate_with_trainee()
+        recipe = baker.make(Recipe)
+
+        response = log_meal({'recipe_ids': [recipe.id]})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['recipe_ids'][0] is not None
+        assert not Meal.objects.exists()
+
+    def test_if_quantity_is_invalid_returns_400(self, authenticate_with_trainee, log_meal):
+        authenticate_with_trainee()
+        food = baker.make(Food)
+
+        response = log_meal({
+            'food_instances': [{'food_id': food.id, 'quantity': '0'}],
+        })
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not Meal.objects.exists()
+
+
 @pytest.mark.django_db
 class TestRetrieveMeal:
     def test_if_user_is_anonymous_returns_401(self, retrieve_meal):
@@ -193,6 +287,91 @@ class TestListMeal:
         }
 
 
+    def test_if_filtered_by_day_returns_only_that_day(self, api_client):
+        trainee = baker.make(Trainee)
+        api_client.force_authenticate(user=trainee.user)
+        meals = baker.make(Meal, trainee=trainee, _quantity=2)
+        yesterday = timezone.now() - timedelta(days=1)
+        meals[1].time_eaten = yesterday
+        meals[1].save()
+
+        response = api_client.get(
+            '/diet/meals/', {'eaten_on': timezone.localdate(yesterday)})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert meals[1].eaten_on == timezone.localdate(yesterday)
+        assert [result['id'] for result in response.data['results']] == [meals[1].id]
+
+    def test_cursor_pages_follow_the_requested_ordering(self, api_client):
+        trainee = baker.make(Trainee)
+        api_client.force_authenticate(user=trainee.user)
+        meals = baker.make(Meal, trainee=trainee, _quantity=120)
+        Meal.objects.filter(id__in=[meal.id for meal in meals[::2]])\
+            .update(time_eaten=timezone.now() - timedelta(days=1))
+
+        first_page = api_client.get('/diet/meals/', {'cursor': '', 'ordering': 'time_eaten'})
+        second_page = api_client.get(first_page.data['next'])
+
+        ids = [meal['id'] for meal in first_page.data['results'] + second_page.data['results']]
+        assert ids == list(Meal.objects.order_by('time_eaten', 'id').values_list('id', flat=True))
+        assert len(first_page.data['results']) == 100
+
+
+@pytest.mark.django_db
+class TestMealFieldsets:
+    def test_fields_selects_the_rendered_fields(self, api_client):
+        trainee = baker.make(Trainee)
+        api_client.force_authenticate(user=trainee.user)
+        meal = baker.make(Meal, trainee=trainee)
+        baker.make(FoodInstance, meal=meal, food__calories=100, quantity=200)
+
+        response = api_client.get('/diet/meals/', {'fields': 'id,name,total_calories'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['results'] == [
+            {"id": meal.id, "name": meal.name, "total_calories": 200}]
+
+    def test_nested_fields_are_selected_with_dotted_paths(self, api_client):
+        trainee = baker.make(Trainee)
+        api_client.force_authenticate(user=trainee.user)
+        meal = baker.make(Meal, trainee=trainee)
+        food_instance = baker.make(FoodInstance, meal=meal)
+
+        response = api_client.get(f'/diet/meals/{meal.id}/',
+                                  {'fields': 'id,food_instances.food.name'})
+
+        assert response.data == {"id": meal.id, "food_instances": [
+            {"food": {"name": food_instance.food.name}}]}
+
+    def test_objects_that_are_not_expanded_are_rendered_as_ids(self, api_client):
+        trainee = baker.make(Trainee)
+        api_client.force_authenticate(user=trainee.user)
+        meal = baker.make(Meal, trainee=trainee)
+        recipe = baker.make(Recipe, trainee=trainee)
+        meal.recipes.add(recipe)
+        food_instance = baker.make(FoodInstance, meal=meal)
+
+        response = api_client.get(f'/diet/meals/{meal.id}/', {'expand': 'food_instances'})
+
+        assert response.data['recipes'] == [recipe.id]
+        assert response.data['food_instances'][0]['id'] == food_instance.id
+        assert response.data['food_instances'][0]['food'] == food_instance.food.id
+
+    def test_prefetches_shrink_to_the_selected_fields(self, api_client, django_assert_num_queries):
+        trainee = baker.make(Trainee)
+        api_client.force_authenticate(user=trainee.user)
+        meals = baker.make(Meal, trainee=trainee, _quantity=3)
+        for meal in meals:
+            baker.make(FoodInstance, meal=meal)
+            meal.recipes.add(baker.make(Recipe, trainee=trainee))
+
+        # The trainee, the meals and their recipe ids.
+        with django_assert_num_queries(3):
+            response = api_client.get('/diet/meals/', {'cursor': '', 'fields': 'id,name,recipes',
+                                                       'expand': ''})
+
+        assert [len(meal['recipes']) for meal in response.data['results']] == [1, 1, 1]
+
 @pytest.mark.django_db
 class TestDeleteMeal:
     def test_if_user_is_anonymous_returns_401(self, delete_meal):
@@ -648,6 +827,7 @@ class TestRetrieveRecipe:
             "name": recipe.name,
             "instructions": recipe.instructions,
             "image": recipe.image,
+            "image_renditions": None,
             "food_instances": [],
             "total_calories": 0,
             "total_carbs": 0,
@@ -688,6 +868,7 @@ class TestListRecipe:
             "name": recipe.name,
             "instructions": recipe.instructions,
             "image": recipe.image,
+            "image_renditions": None,
             "food_instances": [],
             "total_calories": 0,
             "total_carbs": 0,
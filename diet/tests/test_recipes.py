@@ -132,6 +132,7 @@ class TestRetrieveRecipe:
             "name": recipe.name,
             "instructions": recipe.instructions,
             "image": recipe.image,
+            "image_renditions": None,
             "food_instances": [],
             "total_calories": 0,
             "total_carbs": 0,
@@ -169,6 +170,7 @@ class TestListRecipe:
             "name": recipe.name,
             "instructions": recipe.instructions,
             "image": recipe.image,
+            "image_renditions": None,
             "food_instances": [],
             "total_calories": 0,
             "total_carbs": 0,
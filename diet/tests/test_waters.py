@@ -123,6 +123,22 @@ class TestListWater:
             "drinking_date": response.data['results'][0]['drinking_date']
         }
 
+    def test_cursor_pages_walk_every_water_once(self, api_client):
+        trainee = baker.make(Trainee)
+        api_client.force_authenticate(user=trainee.user)
+        waters = baker.make(Water, trainee=trainee, _quantity=150)
+
+        first_page = api_client.get('/diet/waters/', {'cursor': ''})
+        second_page = api_client.get(first_page.data['next'])
+        previous_page = api_client.get(second_page.data['previous'])
+
+        assert first_page.status_code == status.HTTP_200_OK
+        assert 'count' not in first_page.data
+        ids = [water['id'] for water in first_page.data['results'] + second_page.data['results']]
+        assert ids == sorted((water.id for water in waters), reverse=True)
+        assert second_page.data['next'] is None
+        assert previous_page.data['results'] == first_page.data['results']
+
 
 @pytest.mark.django_db
 class TestDeleteWater:
@@ -1,29 +1,43 @@
 from django.shortcuts import get_object_or_404
 from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework.decorators import action
 from rest_framework.viewsets import ModelViewSet, ReadOnlyModelViewSet
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework.response import Response
 from rest_framework import status
-from core.models import Trainee
-from core.pagination import DefaultPagination
+from core.catalog import FOODS, CatalogConditionalMixin
+from core.dashboard_cache import DashboardInvalidationMixin
+from core.fieldsets import SparseFieldsetMixin
+from core.rows import FastListMixin
+from core.search import CatalogSearchFilter, CatalogSearchPagination
+from core.pagination import DefaultPagination, TimelinePagination
 from .filters import FoodFilter, MealFilter, WaterFilter
 from .models import Food, CustomFood, FoodInstance, Recipe, Meal, Water
-from . import serializers
+from . import rows, serializers
 
+TOTALS = ['total_calories', 'total_carbs', 'total_fats', 'total_protein']
+RECIPE_PREFETCHES = {
+    'food_instances': ['food_instances__food'],
+    **{total: ['food_instances__food'] for total in TOTALS},
+}
 
-class FoodViewSet(ReadOnlyModelViewSet):
+
+class FoodViewSet(CatalogConditionalMixin, SparseFieldsetMixin, FastListMixin, ReadOnlyModelViewSet):
+    catalog = FOODS
+    row_reader = rows.food_reader
     queryset = Food.objects.\
-        filter(customfood__isnull=True).order_by('name')
+        filter(is_custom=False).order_by('name')
     serializer_class = serializers.FoodSerializer
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, CatalogSearchFilter, OrderingFilter]
     filterset_class = FoodFilter
-    pagination_class = DefaultPagination
+    pagination_class = CatalogSearchPagination
     search_fields = ['name']
     ordering_fields = ['calories', 'carbs', 'fats', 'protein']
 
 
-class CustomFoodViewSet(ModelViewSet):
+class CustomFoodViewSet(DashboardInvalidationMixin, SparseFieldsetMixin, FastListMixin, ModelViewSet):
     http_method_names = ['get', 'post', 'patch', 'delete', 'head', 'options']
+    row_reader = rows.food_reader
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_class = FoodFilter
     pagination_class = DefaultPagination
@@ -31,8 +45,7 @@ class CustomFoodViewSet(ModelViewSet):
     ordering_fields = ['calories', 'carbs', 'fats', 'protein']
 
     def get_queryset(self):
-        user_id = self.request.user.id
-        trainee = get_object_or_404(Trainee, user_id=user_id)
+        trainee = self.request.trainee
         return CustomFood.objects.filter(trainee=trainee).order_by('name')
 
     def get_serializer_class(self):
@@ -43,7 +56,7 @@ class CustomFoodViewSet(ModelViewSet):
         return serializers.FoodSerializer
 
     def get_serializer_context(self):
-        return {'user_id': self.request.user.id}
+        return {'trainee': self.request.trainee}
 
     def destroy(self, request, *args, **kwargs):
         custom_food = self.get_object()
@@ -54,19 +67,17 @@ class CustomFoodViewSet(ModelViewSet):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-class RecipeViewSet(ModelViewSet):
+class RecipeViewSet(DashboardInvalidationMixin, SparseFieldsetMixin, ModelViewSet):
     http_method_names = ['get', 'post', 'patch', 'delete', 'head', 'options']
     filter_backends = [SearchFilter]
     pagination_class = DefaultPagination
     search_fields = ['name', 'instructions']
+    prefetches = RECIPE_PREFETCHES
 
     def get_queryset(self):
-        user_id = self.request.user.id
-        trainee = get_object_or_404(Trainee, user_id=user_id)
-        return Recipe.objects.\
-            filter(trainee=trainee).\
-            prefetch_related('food_instances__food').\
-            order_by('name')
+        trainee = self.request.trainee
+        return self.prefetch(Recipe.objects.filter(trainee=trainee))\
+            .order_by('name')
 
     def get_serializer_class(self):
         if self.request.method == 'PATCH':
@@ -74,7 +85,7 @@ class RecipeViewSet(ModelViewSet):
         return serializers.RecipeSerializer
 
     def get_serializer_context(self):
-        return {'user_id': self.request.user.id}
+        return {'trainee': self.request.trainee}
 
     def destroy(self, request, *args, **kwargs):
         recipe = self.get_object()
@@ -85,12 +96,12 @@ class RecipeViewSet(ModelViewSet):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-class RecipeFoodInstanceViewSet(ModelViewSet):
+class RecipeFoodInstanceViewSet(DashboardInvalidationMixin, SparseFieldsetMixin, FastListMixin, ModelViewSet):
     http_method_names = ['get', 'post', 'patch', 'delete', 'head', 'options']
+    row_reader = rows.food_instance_reader
 
     def get_queryset(self):
-        user_id = self.request.user.id
-        trainee = get_object_or_404(Trainee, user_id=user_id)
+        trainee = self.request.trainee
         recipe_id = self.kwargs['recipe_pk']
         recipe = get_object_or_404(Recipe, id=recipe_id, trainee=trainee)
         return recipe.food_instances\
@@ -106,25 +117,28 @@ class RecipeFoodInstanceViewSet(ModelViewSet):
 
     def get_serializer_context(self):
         return {'recipe_id': self.kwargs['recipe_pk'],
-                'user_id': self.request.user.id}
+                'trainee': self.request.trainee}
 
 
-class MealViewSet(ModelViewSet):
+class MealViewSet(DashboardInvalidationMixin, SparseFieldsetMixin, ModelViewSet):
     http_method_names = ['get', 'post', 'patch', 'delete', 'head', 'options']
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_class = MealFilter
-    pagination_class = DefaultPagination
+    pagination_class = TimelinePagination
     search_fields = ['name']
     ordering_fields = ['time_eaten']
+    ordering = ['-time_eaten', '-id']
+    prefetches = {
+        'recipes': ['recipes__food_instances__food'],
+        'food_instances': ['food_instances__food'],
+        **{total: ['recipes__food_instances__food', 'food_instances__food']
+           for total in TOTALS},
+    }
 
     def get_queryset(self):
-        user_id = self.request.user.id
-        trainee = get_object_or_404(Trainee, user_id=user_id)
-        return Meal.objects.\
-            filter(trainee=trainee).\
-            prefetch_related('recipes__food_instances__food').\
-            prefetch_related('food_instances__food').\
-            order_by('-time_eaten')
+        trainee = self.request.trainee
+        return self.prefetch(Meal.objects.filter(trainee=trainee))\
+            .order_by('-time_eaten', '-id')
 
     def get_serializer_class(self):
         if self.request.method == 'PATCH':
@@ -132,19 +146,27 @@ class MealViewSet(ModelViewSet):
         return serializers.MealSerializer
 
     def get_serializer_context(self):
-        return {'user_id': self.request.user.id}
+        return {'trainee': self.request.trainee}
+
+    @action(detail=False, methods=['POST'])
+    def log(self, request):
+        serializer = serializers.MealLogSerializer(
+            data=request.data, context=self.get_serializer_context())
+        serializer.is_valid(raise_exception=True)
+        meal = self.get_queryset().get(id=serializer.save().id)
+        return Response(serializers.MealSerializer(meal).data,
+                        status=status.HTTP_201_CREATED)
 
 
-class MealRecipeViewSet(ModelViewSet):
+class MealRecipeViewSet(DashboardInvalidationMixin, SparseFieldsetMixin, ModelViewSet):
     http_method_names = ['get', 'post', 'delete', 'head', 'options']
+    prefetches = RECIPE_PREFETCHES
 
     def get_queryset(self):
-        user_id = self.request.user.id
-        trainee = get_object_or_404(Trainee, user_id=user_id)
+        trainee = self.request.trainee
         meal_id = self.kwargs['meal_pk']
         meal = get_object_or_404(Meal, id=meal_id, trainee=trainee)
-        return meal.recipes\
-            .prefetch_related('food_instances__food')\
+        return self.prefetch(meal.recipes.all())\
             .order_by('name')
 
     def get_serializer_class(self):
@@ -154,7 +176,7 @@ class MealRecipeViewSet(ModelViewSet):
 
     def get_serializer_context(self):
         return {'meal_id': self.kwargs['meal_pk'],
-                'user_id': self.request.user.id}
+                'trainee': self.request.trainee}
 
     def destroy(self, request, *args, **kwargs):
         recipe = self.get_object()
@@ -165,12 +187,12 @@ class MealRecipeViewSet(ModelViewSet):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-class MealFoodInstanceViewSet(ModelViewSet):
+class MealFoodInstanceViewSet(DashboardInvalidationMixin, SparseFieldsetMixin, FastListMixin, ModelViewSet):
     http_method_names = ['get', 'post', 'patch', 'delete', 'head', 'options']
+    row_reader = rows.food_instance_reader
 
     def get_queryset(self):
-        user_id = self.request.user.id
-        trainee = get_object_or_404(Trainee, user_id=user_id)
+        trainee = self.request.trainee
         meal_id = self.kwargs['meal_pk']
         meal = get_object_or_404(Meal, id=meal_id, trainee=trainee)
         return meal.food_instances\
@@ -186,19 +208,19 @@ class MealFoodInstanceViewSet(ModelViewSet):
 
     def get_serializer_context(self):
         return {'meal_id': self.kwargs['meal_pk'],
-                'user_id': self.request.user.id}
+                'trainee': self.request.trainee}
 
 
-class WaterViewSet(ModelViewSet):
+class WaterViewSet(DashboardInvalidationMixin, SparseFieldsetMixin, ModelViewSet):
     http_method_names = ['get', 'post', 'patch', 'delete', 'head', 'options']
     filter_backends = [DjangoFilterBackend]
     filterset_class = WaterFilter
-    pagination_class = DefaultPagination
+    pagination_class = TimelinePagination
+    ordering = ['-drinking_date', '-id']
 
     def get_queryset(self):
-        user_id = self.request.user.id
-        trainee = get_object_or_404(Trainee, user_id=user_id)
-        return Water.objects.filter(trainee=trainee).order_by('-drinking_date')
+        trainee = self.request.trainee
+        return Water.objects.filter(trainee=trainee).order_by('-drinking_date', '-id')
 
     def get_serializer_class(self):
         if self.request.method == 'PATCH':
@@ -206,4 +228,4 @@ class WaterViewSet(ModelViewSet):
         return serializers.WaterSerializer
 
     def get_serializer_context(self):
-        return {'user_id': self.request.user.id}
+        return {'trainee': self.request.trainee}
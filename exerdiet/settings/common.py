@@ -45,6 +45,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.middleware.TraineeMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -116,8 +117,17 @@ AUTH_USER_MODEL = 'core.User'
 
 REST_FRAMEWORK = {
     'COERCE_DECIMAL_TO_STRING': False,
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'core.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'core.authentication.TraineeJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated'
@@ -125,6 +135,42 @@ REST_FRAMEWORK = {
 }
 
 
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+JWT_DB_CHECK = {
+    'UNSAFE_METHODS': True,
+    'STAFF': True,
+    'PATH_PREFIXES': ['/admin/', '/auth/'],
+}
+
+IMAGE_RENDITIONS = {
+    'thumb': (150, 150),
+    'medium': (600, 600),
+}
+IMAGE_STRIP_ORIGINAL_EXIF = True
+
+CHUNKED_UPLOADS = {
+    'DIR': os.path.join(BASE_DIR, 'uploads'),
+    'MAX_CHUNK_SIZE': 5 * (2 ** 20),
+    'EXPIRE_AFTER': 24,
+}
+
+CATALOG_CACHE = {
+    'MAX_ENTRIES': 500,
+    'MAX_BYTES': 50 * (2 ** 20),
+}
+
+DASHBOARD_CACHE = {
+    'ALIAS': 'default',
+    'TIMEOUT': 300,
+    'STATS': False,
+}
+
+
 DJOSER = {
     'SERIALIZERS': {
         'user_create': 'core.serializers.UserCreateSerializer',
@@ -139,3 +185,6 @@ DJOSER = {
 }
 
 DEFAULT_FROM_EMAIL = 'exercise.diet.exerdiet@gmail.com'
+
+EMAIL_BACKEND = 'core.mail.OutboxEmailBackend'
+OUTBOX_EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
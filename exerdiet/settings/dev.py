@@ -19,7 +19,10 @@ SIMPLE_JWT = {
     'AUTH_HEADER_TYPES': ('JWT',),
     'ACCESS_TOKEN_LIFETIME': timedelta(days=1),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=30),
-    'ROTATE_REFRESH_TOKENS': True
+    'ROTATE_REFRESH_TOKENS': True,
+    'TOKEN_OBTAIN_SERIALIZER': 'core.authentication.TokenObtainPairSerializer',
+    'TOKEN_REFRESH_SERIALIZER': 'core.authentication.TokenRefreshSerializer',
+    'TOKEN_USER_CLASS': 'core.authentication.TraineeTokenUser',
 }
 
 EMAIL_HOST = 'localhost'
@@ -21,11 +21,21 @@ DATABASES = {
     }
 }
 
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'exerdiet_cache',
+    }
+}
+
 SIMPLE_JWT = {
     'AUTH_HEADER_TYPES': ('JWT',),
     'ACCESS_TOKEN_LIFETIME': timedelta(days=1),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=30),
-    'ROTATE_REFRESH_TOKENS': True
+    'ROTATE_REFRESH_TOKENS': True,
+    'TOKEN_OBTAIN_SERIALIZER': 'core.authentication.TokenObtainPairSerializer',
+    'TOKEN_REFRESH_SERIALIZER': 'core.authentication.TokenRefreshSerializer',
+    'TOKEN_USER_CLASS': 'core.authentication.TraineeTokenUser',
 }
 
 EMAIL_HOST = os.environ['EMAIL_HOST']
@@ -4,6 +4,7 @@ from django.db.models import Count
 from django.http import HttpRequest
 from django.utils.html import format_html
 from django.urls import reverse
+from core.images import thumbnail_url
 from . import models
 
 
@@ -52,9 +53,9 @@ class CustomExerciseFilter(admin.SimpleListFilter):
 
     def queryset(self, request, queryset):
         if self.value() == self.FILTER_CUSTOM:
-            return queryset.filter(customexercise__isnull=False)
+            return queryset.filter(is_custom=True)
         if self.value() == self.FILTER_NOT_CUSTOM:
-            return queryset.exclude(customexercise__isnull=False)
+            return queryset.filter(is_custom=False)
 
 
 @admin.register(models.Exercise)
@@ -76,7 +77,7 @@ class ExerciseAdmin(admin.ModelAdmin):
 
     def thumbnail(self, exercise: models.Exercise):
         if exercise.image.name != '':
-            return format_html(f'<img src="{exercise.image.url}" class="thumbnail"/>')
+            return format_html(f'<img src="{thumbnail_url(exercise)}" class="thumbnail"/>')
         return ''
 
     @admin.display(ordering='calories_burned')
@@ -116,7 +117,7 @@ class CustomExerciseAdmin(admin.ModelAdmin):
 
     def thumbnail(self, custom_exercise: models.CustomExercise):
         if custom_exercise.image.name != '':
-            return format_html(f'<img src="{custom_exercise.image.url}" class="thumbnail"/>')
+            return format_html(f'<img src="{thumbnail_url(custom_exercise)}" class="thumbnail"/>')
         return ''
 
     @admin.display(ordering='trainee__user__username')
@@ -177,7 +178,7 @@ class WorkoutAdmin(admin.ModelAdmin):
 
     def thumbnail(self, workout: models.Workout):
         if workout.image.name != '':
-            return format_html(f'<img src="{workout.image.url}" class="thumbnail"/>')
+            return format_html(f'<img src="{thumbnail_url(workout)}" class="thumbnail"/>')
         return ''
 
     @admin.display(ordering='trainee__user__username')
@@ -223,7 +224,7 @@ class PerformedWorkoutAdmin(admin.ModelAdmin):
     autocomplete_fields = ['trainee']
     exclude = ['workouts']
     list_display = ['name', 'trainee_username', 'time_performed']
-    list_filter = ['time_performed']
+    list_filter = ['performed_on']
     list_per_page = 100
     list_select_related = ['trainee__user']
     inlines = [WorkoutPerformedWorkoutInline,
@@ -17,4 +17,5 @@ class PerformedWorkoutFilter(filters.FilterSet):
         model = PerformedWorkout
         fields = {
             'time_performed': ['gte', 'lte'],
+            'performed_on': ['exact', 'gte', 'lte'],
         }
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.2 on 2026-10-18 06:46
+
+from django.db import migrations, models
+from django.db.models.functions import TruncDate
+
+
+def populate_performed_on(apps, schema_editor):
+    PerformedWorkout = apps.get_model('gym', 'PerformedWorkout')
+    PerformedWorkout.objects.update(performed_on=TruncDate('time_performed'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('gym', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='performedworkout',
+            name='performed_on',
+            field=models.DateField(editable=False, null=True),
+        ),
+        migrations.RunPython(populate_performed_on, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='performedworkout',
+            name='performed_on',
+            field=models.DateField(editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='performedworkout',
+            index=models.Index(fields=['trainee', 'performed_on'], name='gym_perform_trainee_e24a2c_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.2 on 2026-10-18 07:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gym', '0002_performedworkout_performed_on'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exercise',
+            name='image_renditions',
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='workout',
+            name='image_renditions',
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.2 on 2026-10-18 08:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gym', '0003_image_renditions'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='performedworkout',
+            index=models.Index(fields=['trainee', 'time_performed', 'id'], name='gym_perform_trainee_9e0df2_idx'),
+        ),
+    ]
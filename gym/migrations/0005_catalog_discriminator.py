@@ -0,0 +1,41 @@
+# Generated by Django 4.2.2 on 2026-10-18 07:22
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_exercise_owners(apps, schema_editor):
+    Exercise = apps.get_model('gym', 'Exercise')
+    CustomExercise = apps.get_model('gym', 'CustomExercise')
+    ids_by_trainee = {}
+    for id, trainee_id in CustomExercise.objects.values_list('exercise_ptr_id', 'trainee_id'):
+        ids_by_trainee.setdefault(trainee_id, []).append(id)
+    for trainee_id, ids in ids_by_trainee.items():
+        Exercise.objects.filter(id__in=ids)\
+            .update(is_custom=True, owner_trainee_id=trainee_id)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_catalog_version'),
+        ('gym', '0004_timeline_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exercise',
+            name='is_custom',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name='exercise',
+            name='owner_trainee',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.trainee'),
+        ),
+        migrations.RunPython(populate_exercise_owners, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='exercise',
+            index=models.Index(fields=['is_custom', 'name'], name='gym_exercis_is_cust_9f22b2_idx'),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.core.validators import MinValueValidator
 from django.db import models
+from django.utils import timezone
 from datetime import datetime
 from core.models import Trainee
 from core.validators import validate_image_size
@@ -23,6 +24,17 @@ class Exercise(models.Model):
 
     image = models.ImageField(
         upload_to='gym/images/exercises', null=True, blank=True, validators=[validate_image_size])
+    image_renditions = models.JSONField(null=True, blank=True, editable=False)
+    # Copied from CustomExercise, so the catalog is queried without joining it.
+    is_custom = models.BooleanField(default=False, editable=False)
+    owner_trainee = models.ForeignKey(
+        Trainee, on_delete=models.CASCADE, null=True, blank=True, editable=False, related_name='+'
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['is_custom', 'name']),
+        ]
 
     def __str__(self) -> str:
         temp = '10rep' if self.is_repetitive else '60sec'
@@ -39,6 +51,14 @@ class CustomExercise(Exercise):
         verbose_name = "Custom Exercise"
         verbose_name_plural = "Custom Exercises"
 
+    def save(self, *args, **kwargs):
+        self.is_custom = True
+        self.owner_trainee_id = self.trainee_id
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'trainee' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'is_custom', 'owner_trainee'}
+        super().save(*args, **kwargs)
+
     def __str__(self) -> str:
         temp = '10rep' if self.is_repetitive else '60sec'
         return self.name + ' (' + str(self.calories_burned) + 'cals/' + temp + ')' + ' / ' + str(self.trainee)
@@ -49,6 +69,7 @@ class Workout(models.Model):
     instructions = models.TextField(null=True, blank=True)
     image = models.ImageField(
         upload_to='gym/images/workouts', null=True, blank=True, validators=[validate_image_size])
+    image_renditions = models.JSONField(null=True, blank=True, editable=False)
     trainee = models.ForeignKey(
         Trainee, on_delete=models.CASCADE, related_name='workouts'
     )
@@ -66,6 +87,7 @@ class Workout(models.Model):
 class PerformedWorkout(models.Model):
     name = models.CharField(max_length=150)
     time_performed = models.DateTimeField(auto_now_add=True)
+    performed_on = models.DateField(editable=False)
     trainee = models.ForeignKey(
         Trainee, on_delete=models.CASCADE, related_name='performed_workouts'
     )
@@ -73,6 +95,12 @@ class PerformedWorkout(models.Model):
         Workout, related_name='performed_workouts'
     )
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['trainee', 'performed_on']),
+            models.Index(fields=['trainee', 'time_performed', 'id']),
+        ]
+
     def __str__(self) -> str:
         return self.name + ' (' + str(self.get_total_calories()) + 'cals)' + ' / ' + str(self.trainee) + ' / ' + str(self.time_performed)
 
@@ -87,8 +115,20 @@ class PerformedWorkout(models.Model):
     def save(self, *args, **kwargs):
         if not self.name:
             self.name = 'Workout @ ' + str(datetime.today())
+        self.performed_on = timezone.localdate(
+            self.time_performed or timezone.now())
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'time_performed' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'performed_on'}
         super().save(*args, **kwargs)
 
+        # auto_now_add stamps time_performed while saving, possibly past midnight.
+        performed_on = timezone.localdate(self.time_performed)
+        if self.performed_on != performed_on:
+            self.performed_on = performed_on
+            PerformedWorkout.objects.filter(
+                pk=self.pk).update(performed_on=performed_on)
+
 
 class ExerciseInstance(models.Model):
     duration = models.PositiveIntegerField(validators=[MinValueValidator(1)])
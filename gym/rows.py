@@ -0,0 +1,43 @@
+from core.images import rendition_urls_from
+from core.rows import RowReader
+from .models import Exercise
+
+EXERCISE_COLUMNS = ['id', 'name', 'body_part', 'calories_burned',
+                    'is_repetitive', 'image', 'image_renditions']
+
+_storage = Exercise._meta.get_field('image').storage
+
+
+def exercise_to_dict(id, name, body_part, calories_burned, is_repetitive, image, image_renditions):
+    # ExerciseSerializer and SimpleExerciseSerializer
+    return {
+        'id': id,
+        'name': name,
+        'body_part': body_part,
+        'calories_burned': calories_burned,
+        'is_repetitive': is_repetitive,
+        'image': _storage.url(image) if image else None,
+        'image_renditions': rendition_urls_from(_storage, image, image_renditions),
+    }
+
+
+def exercise_instance_to_dict(id, duration, sets, *exercise):
+    # ExerciseInstanceSerializer, with the total of ExerciseInstance
+    calories_burned, is_repetitive = exercise[3:5]
+    if is_repetitive:
+        total_calories = calories_burned * duration * sets / 10
+    else:
+        total_calories = calories_burned * duration * sets / 60
+    return {
+        'id': id,
+        'exercise': exercise_to_dict(*exercise),
+        'duration': duration,
+        'sets': sets,
+        'total_calories': int(total_calories),
+    }
+
+
+exercise_reader = RowReader(EXERCISE_COLUMNS, exercise_to_dict)
+exercise_instance_reader = RowReader(
+    ['id', 'duration', 'sets'] + [f'exercise__{column}' for column in EXERCISE_COLUMNS],
+    exercise_instance_to_dict)
@@ -1,21 +1,28 @@
 from django.shortcuts import get_object_or_404
 from rest_framework import serializers
-from core.models import Trainee
+from core.images import rendition_urls
+from core.ownership import Resolver, ResolvedIdField
 from .models import Exercise, CustomExercise, Workout, PerformedWorkout, ExerciseInstance
 
+exercises = Resolver(Exercise, 'No exercise with the given id was found.')
+
 
 class ExerciseSerializer(serializers.ModelSerializer):
     image = serializers.SerializerMethodField()
+    image_renditions = serializers.SerializerMethodField()
 
     def get_image(self, exercise: Exercise):
         if exercise.image:
             return exercise.image.url
         return None
 
+    def get_image_renditions(self, exercise: Exercise):
+        return rendition_urls(exercise)
+
     class Meta:
         model = Exercise
         fields = ['id', 'name', 'body_part', 'calories_burned',
-                  'is_repetitive', 'image']
+                  'is_repetitive', 'image', 'image_renditions']
 
 
 class CustomExerciseCreateSerializer(serializers.ModelSerializer):
@@ -27,8 +34,7 @@ class CustomExerciseCreateSerializer(serializers.ModelSerializer):
                   'calories_burned', 'is_repetitive', 'image']
 
     def create(self, validated_data):
-        user_id = self.context['user_id']
-        trainee = Trainee.objects.get(user_id=user_id)
+        trainee = self.context['trainee']
         custom_exercise = CustomExercise(**validated_data)
         custom_exercise.trainee = trainee
         custom_exercise.save()
@@ -43,10 +49,15 @@ class CustomExerciseUpdateSerializer(serializers.ModelSerializer):
 
 
 class SimpleExerciseSerializer(serializers.ModelSerializer):
+    image_renditions = serializers.SerializerMethodField()
+
+    def get_image_renditions(self, exercise: Exercise):
+        return rendition_urls(exercise)
+
     class Meta:
         model = Exercise
         fields = ['id', 'name', 'body_part', 'calories_burned',
-                  'is_repetitive', 'image']
+                  'is_repetitive', 'image', 'image_renditions']
 
 
 class ExerciseInstanceSerializer(serializers.ModelSerializer):
@@ -63,30 +74,14 @@ class ExerciseInstanceSerializer(serializers.ModelSerializer):
 
 class ExerciseInstanceCreateSerializer(serializers.ModelSerializer):
     id = serializers.IntegerField(read_only=True)
-    exercise_id = serializers.IntegerField()
-
-    def validate_exercise_id(self, value):
-        user_id = self.context['user_id']
-        trainee = Trainee.objects.get(user_id=user_id)
-
-        if not Exercise.objects.filter(id=value).exists():
-            raise serializers.ValidationError(
-                'No exercise with the given id was found.'
-            )
-        if Exercise.objects.filter(id=value, customexercise__isnull=False).exists():
-            if not CustomExercise.objects.filter(exercise_ptr_id=value, trainee=trainee).exists():
-                raise serializers.ValidationError(
-                    'No exercise with the given id was found.'
-                )
-        return value
+    exercise_id = ResolvedIdField(exercises, source='exercise')
 
     class Meta:
         model = ExerciseInstance
         fields = ['id', 'exercise_id', 'duration', 'sets']
 
     def create(self, validated_data):
-        user_id = self.context['user_id']
-        trainee = get_object_or_404(Trainee, user_id=user_id)
+        trainee = self.context['trainee']
         workout_id = self.context.get('workout_id')
         performed_workout_id = self.context.get('performed_workout_id')
         if workout_id:
@@ -110,20 +105,23 @@ class ExerciseInstanceUpdateSerializer(serializers.ModelSerializer):
 
 
 class WorkoutSerializer(serializers.ModelSerializer):
+    image_renditions = serializers.SerializerMethodField()
     exercise_instances = ExerciseInstanceSerializer(many=True, read_only=True)
     total_calories = serializers.SerializerMethodField(read_only=True)
 
     def get_total_calories(self, workout: Workout):
         return workout.get_total_calories()
 
+    def get_image_renditions(self, workout: Workout):
+        return rendition_urls(workout)
+
     class Meta:
         model = Workout
-        fields = ['id', 'name', 'instructions', 'image',
+        fields = ['id', 'name', 'instructions', 'image', 'image_renditions',
                   'exercise_instances', 'total_calories']
 
     def create(self, validated_data):
-        user_id = self.context['user_id']
-        trainee = Trainee.objects.get(user_id=user_id)
+        trainee = self.context['trainee']
         workout = Workout(**validated_data)
         workout.trainee = trainee
         workout.save()
@@ -137,15 +135,19 @@ class WorkoutUpdateSerializer(serializers.ModelSerializer):
 
 
 class SimpleWorkoutSerializer(serializers.ModelSerializer):
+    image_renditions = serializers.SerializerMethodField()
     exercise_instances = ExerciseInstanceSerializer(many=True, read_only=True)
     total_calories = serializers.SerializerMethodField(read_only=True)
 
     def get_total_calories(self, workout: Workout):
         return workout.get_total_calories()
 
+    def get_image_renditions(self, workout: Workout):
+        return rendition_urls(workout)
+
     class Meta:
         model = Workout
-        fields = ['id', 'name', 'instructions', 'image',
+        fields = ['id', 'name', 'instructions', 'image', 'image_renditions',
                   'exercise_instances', 'total_calories']
 
 
@@ -164,8 +166,7 @@ class PerformedWorkoutSerializer(serializers.ModelSerializer):
                   'workouts', 'exercise_instances', 'total_calories']
 
     def create(self, validated_data):
-        user_id = self.context['user_id']
-        trainee = Trainee.objects.get(user_id=user_id)
+        trainee = self.context['trainee']
         performed_workout = PerformedWorkout(**validated_data)
         performed_workout.trainee = trainee
         performed_workout.save()
@@ -184,8 +185,7 @@ class PerformedWorkoutAddWorkoutSerializer(serializers.ModelSerializer):
     id = serializers.IntegerField()
 
     def validate_id(self, workout_id):
-        user_id = self.context['user_id']
-        trainee = Trainee.objects.get(user_id=user_id)
+        trainee = self.context['trainee']
 
         if not Workout.objects.filter(id=workout_id, trainee=trainee).exists():
             raise serializers.ValidationError(
@@ -198,8 +198,7 @@ class PerformedWorkoutAddWorkoutSerializer(serializers.ModelSerializer):
         fields = ['id']
 
     def create(self, validated_data):
-        user_id = self.context['user_id']
-        trainee = get_object_or_404(Trainee, user_id=user_id)
+        trainee = self.context['trainee']
         workout_id = validated_data['id']
         performed_workout_id = self.context['performed_workout_id']
         performed_workout = get_object_or_404(PerformedWorkout,
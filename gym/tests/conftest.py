@@ -1,9 +1,17 @@
 from model_bakery import baker
 from rest_framework.test import APIClient
 import pytest
+from core import search
+from core.catalog import response_cache
 from core.models import User, Trainee
 
 
+@pytest.fixture(autouse=True)
+def clear_catalog_cache():
+    response_cache.clear()
+    search.clear()
+
+
 @pytest.fixture
 def api_client():
     return APIClient()
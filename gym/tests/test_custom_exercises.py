@@ -2,7 +2,7 @@ from model_bakery import baker
 from rest_framework import status
 import pytest
 from core.models import Trainee
-from gym.models import CustomExercise
+from gym.models import Exercise, CustomExercise
 
 
 @pytest.fixture
@@ -73,6 +73,20 @@ class TestCreateCustomExercise:
         assert response.status_code == status.HTTP_201_CREATED
         assert response.data['id'] > 0
 
+    def test_custom_exercise_is_marked_with_its_owner(self, authenticate_with_trainee, create_custom_exercise):
+        authenticate_with_trainee()
+
+        response = create_custom_exercise({
+            "name": "a",
+            "body_part": "CR",
+            "calories_burned": 0,
+            "is_repetitive": False,
+        })
+
+        exercise = Exercise.objects.get(id=response.data['id'])
+        assert exercise.is_custom
+        assert exercise.owner_trainee == Trainee.objects.get()
+
 
 @pytest.mark.django_db
 class TestRetrieveCustomExercise:
@@ -102,7 +116,8 @@ class TestRetrieveCustomExercise:
             "body_part": custom_exercise.body_part,
             "calories_burned": custom_exercise.calories_burned,
             "is_repetitive": custom_exercise.is_repetitive,
-            "image": custom_exercise.image
+            "image": custom_exercise.image,
+            "image_renditions": None
         }
 
     def test_if_custom_exercise_exists_with_other_trainee_returns_404(self, api_client, retrieve_custom_exercise):
@@ -136,7 +151,8 @@ class TestListCustomExercise:
             "body_part": custom_exercise.body_part,
             "calories_burned": custom_exercise.calories_burned,
             "is_repetitive": custom_exercise.is_repetitive,
-            "image": custom_exercise.image
+            "image": custom_exercise.image,
+            "image_renditions": None
         }
 
 
@@ -0,0 +1,91 @@
+from model_bakery import baker
+from rest_framework.renderers import JSONRenderer
+import pytest
+from core.models import Trainee
+from gym.models import Exercise, CustomExercise, ExerciseInstance, Workout, PerformedWorkout
+from gym.rows import exercise_reader, exercise_instance_reader
+from gym.serializers import ExerciseSerializer, ExerciseInstanceSerializer
+
+IMAGE = 'gym/images/exercises/squat.jpg'
+RENDITIONS = {
+    'source': IMAGE,
+    'thumb': {'webp': 'renditions/squat-thumb.webp', 'jpeg': 'renditions/squat-thumb.jpg'},
+}
+
+
+def render(data):
+    return JSONRenderer().render(data)
+
+
+def make_exercises(model=Exercise, **kwargs):
+    return [
+        baker.make(model, calories_burned=7, is_repetitive=True,
+                   image=IMAGE, image_renditions=RENDITIONS, **kwargs),
+        baker.make(model, calories_burned=11, is_repetitive=False,
+                   image=IMAGE, image_renditions={**RENDITIONS, 'source': 'old.jpg'}, **kwargs),
+        baker.make(model, calories_burned=0, is_repetitive=False, **kwargs),
+    ]
+
+
+@pytest.mark.django_db
+class TestExerciseRows:
+    def test_rows_render_like_the_serializer(self):
+        make_exercises()
+        queryset = Exercise.objects.order_by('id')
+
+        rows = exercise_reader.read(exercise_reader.values(queryset))
+
+        assert render(rows) == render(ExerciseSerializer(queryset, many=True).data)
+
+    def test_exercise_list_renders_like_the_serializer(self, authenticate_with_trainee, api_client):
+        authenticate_with_trainee()
+        make_exercises()
+
+        response = api_client.get('/gym/exercises/')
+
+        assert response.content == api_client.get('/gym/exercises/?fields=').content
+
+    def test_custom_exercise_list_renders_like_the_serializer(self, authenticate_with_trainee, api_client):
+        authenticate_with_trainee()
+        make_exercises(CustomExercise, trainee=Trainee.objects.get())
+
+        response = api_client.get('/gym/custom_exercises/')
+
+        assert response.content == api_client.get('/gym/custom_exercises/?fields=').content
+
+
+@pytest.mark.django_db
+class TestExerciseInstanceRows:
+    def test_rows_render_like_the_serializer(self):
+        for exercise in make_exercises():
+            for duration, sets in [(1, 1), (7, 3), (45, 4), (3599, 13)]:
+                baker.make(ExerciseInstance, exercise=exercise, duration=duration, sets=sets)
+        queryset = ExerciseInstance.objects.order_by('id')
+
+        rows = exercise_instance_reader.read(exercise_instance_reader.values(queryset))
+
+        assert render(rows) == \
+            render(ExerciseInstanceSerializer(queryset.select_related('exercise'), many=True).data)
+
+    def test_workout_exercise_instances_render_like_the_serializer(self, authenticate_with_trainee, api_client):
+        authenticate_with_trainee()
+        workout = baker.make(Workout, trainee=Trainee.objects.get())
+        for exercise in make_exercises():
+            baker.make(ExerciseInstance, exercise=exercise, workout=workout, duration=30, sets=3)
+        url = f'/gym/workouts/{workout.id}/exercise_instances/'
+
+        response = api_client.get(url)
+
+        assert response.content == api_client.get(url + '?fields=').content
+
+    def test_performed_workout_exercise_instances_render_like_the_serializer(self, authenticate_with_trainee, api_client):
+        authenticate_with_trainee()
+        performed_workout = baker.make(PerformedWorkout, trainee=Trainee.objects.get())
+        for exercise in make_exercises():
+            baker.make(ExerciseInstance, exercise=exercise,
+                       performed_workout=performed_workout, duration=20, sets=2)
+        url = f'/gym/performed_workouts/{performed_workout.id}/exercise_instances/'
+
+        response = api_client.get(url)
+
+        assert response.content == api_client.get(url + '?fields=').content
@@ -1,7 +1,9 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from model_bakery import baker
 from rest_framework import status
 import pytest
-from gym.models import Exercise
+from gym.models import Exercise, CustomExercise
 
 
 @pytest.fixture
@@ -67,7 +69,8 @@ class TestRetrieveExercise:
             "body_part": exercise.body_part,
             "calories_burned": exercise.calories_burned,
             "is_repetitive": exercise.is_repetitive,
-            "image": exercise.image
+            "image": exercise.image,
+            "image_renditions": None
         }
 
 
@@ -91,5 +94,53 @@ class TestListExercise:
             "body_part": exercise.body_part,
             "calories_burned": exercise.calories_burned,
             "is_repetitive": exercise.is_repetitive,
-            "image": exercise.image
+            "image": exercise.image,
+            "image_renditions": None
         }
+
+    def test_custom_exercises_are_left_out_without_joining_them(self, authenticate_with_trainee, list_exercise):
+        authenticate_with_trainee()
+        exercise = baker.make(Exercise)
+        baker.make(CustomExercise)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = list_exercise()
+
+        assert [result['id'] for result in response.data['results']] == [exercise.id]
+        assert not any('gym_custom_exercise' in query['sql'] for query in queries)
+
+
+@pytest.mark.django_db
+class TestConditionalExercise:
+    def test_if_etag_matches_returns_304(self, api_client, authenticate_with_trainee):
+        authenticate_with_trainee()
+        exercise = baker.make(Exercise)
+        response = api_client.get(f'/gym/exercises/{exercise.id}/')
+
+        response = api_client.get(f'/gym/exercises/{exercise.id}/',
+                                  HTTP_IF_NONE_MATCH=response['ETag'])
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_deleting_an_exercise_changes_the_etag(self, api_client, authenticate_with_trainee):
+        authenticate_with_trainee()
+        exercises = baker.make(Exercise, _quantity=2)
+        etag = api_client.get('/gym/exercises/')['ETag']
+
+        exercises[0].delete()
+        response = api_client.get('/gym/exercises/', HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [exercise['id'] for exercise in response.data['results']] == [exercises[1].id]
+
+
+@pytest.mark.django_db
+class TestSearchExercise:
+    def test_every_word_must_match_a_prefix(self, api_client, authenticate_with_trainee):
+        authenticate_with_trainee()
+        exercise = baker.make(Exercise, name='Push-ups')
+        baker.make(Exercise, name='Pull-ups')
+
+        response = api_client.get('/gym/exercises/?search=push up')
+
+        assert [result['id'] for result in response.data['results']] == [exercise.id]
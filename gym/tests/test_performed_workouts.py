@@ -1,3 +1,5 @@
+from datetime import timedelta
+from django.utils import timezone
 from model_bakery import baker
 from rest_framework import status
 import pytest
@@ -187,6 +189,63 @@ class TestListPerformedWorkout:
         }
 
 
+    def test_if_filtered_by_day_returns_only_that_day(self, api_client):
+        trainee = baker.make(Trainee)
+        api_client.force_authenticate(user=trainee.user)
+        performed_workouts = baker.make(PerformedWorkout, trainee=trainee, _quantity=2)
+        yesterday = timezone.now() - timedelta(days=1)
+        performed_workouts[1].time_performed = yesterday
+        performed_workouts[1].save()
+
+        response = api_client.get(
+            '/gym/performed_workouts/', {'performed_on': timezone.localdate(yesterday)})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert performed_workouts[1].performed_on == timezone.localdate(yesterday)
+        assert [result['id'] for result in response.data['results']] == [performed_workouts[1].id]
+
+    def test_cursor_pages_filter_on_time_and_id(self, api_client):
+        trainee = baker.make(Trainee)
+        api_client.force_authenticate(user=trainee.user)
+        baker.make(PerformedWorkout, trainee=trainee, _quantity=101)
+        PerformedWorkout.objects.update(time_performed=timezone.now())
+
+        first_page = api_client.get('/gym/performed_workouts/', {'cursor': ''})
+        second_page = api_client.get(first_page.data['next'])
+        previous_page = api_client.get(second_page.data['previous'])
+
+        assert len(first_page.data['results']) == 100
+        assert [result['id'] for result in second_page.data['results']] == \
+            [PerformedWorkout.objects.order_by('id').first().id]
+        assert previous_page.data['results'] == first_page.data['results']
+        assert previous_page.data['previous'] is None
+
+    def test_if_cursor_is_invalid_returns_404(self, api_client):
+        trainee = baker.make(Trainee)
+        api_client.force_authenticate(user=trainee.user)
+
+        response = api_client.get('/gym/performed_workouts/', {'cursor': 'invalid'})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_fields_and_expand_prune_the_payload(self, api_client):
+        trainee = baker.make(Trainee)
+        api_client.force_authenticate(user=trainee.user)
+        performed_workout = baker.make(PerformedWorkout, trainee=trainee)
+        workout = baker.make(Workout, trainee=trainee)
+        performed_workout.workouts.add(workout)
+        exercise_instance = baker.make(ExerciseInstance, performed_workout=performed_workout)
+
+        response = api_client.get('/gym/performed_workouts/', {
+            'fields': 'id,workouts,exercise_instances.exercise.name',
+            'expand': 'exercise_instances.exercise'})
+
+        assert response.data['results'] == [{
+            "id": performed_workout.id,
+            "workouts": [workout.id],
+            "exercise_instances": [{"exercise": {"name": exercise_instance.exercise.name}}],
+        }]
+
 @pytest.mark.django_db
 class TestDeletePerformedWorkout:
     def test_if_user_is_anonymous_returns_401(self, delete_performed_workout):
@@ -660,6 +719,7 @@ class TestRetrieveWorkout:
             "name": workout.name,
             "instructions": workout.instructions,
             "image": workout.image,
+            "image_renditions": None,
             "exercise_instances": [],
             "total_calories": 0
         }
@@ -697,6 +757,7 @@ class TestListWorkout:
             "name": workout.name,
             "instructions": workout.instructions,
             "image": workout.image,
+            "image_renditions": None,
             "exercise_instances": [],
             "total_calories": 0
         }
@@ -132,6 +132,7 @@ class TestRetrieveWorkout:
             "name": workout.name,
             "instructions": workout.instructions,
             "image": workout.image,
+            "image_renditions": None,
             "exercise_instances": [],
             "total_calories": 0
         }
@@ -166,6 +167,7 @@ class TestListWorkout:
             "name": workout.name,
             "instructions": workout.instructions,
             "image": workout.image,
+            "image_renditions": None,
             "exercise_instances": [],
             "total_calories": 0
         }
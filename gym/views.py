@@ -4,26 +4,38 @@ from rest_framework.viewsets import ModelViewSet, ReadOnlyModelViewSet
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework.response import Response
 from rest_framework import status
-from core.models import Trainee
-from core.pagination import DefaultPagination
+from core.catalog import EXERCISES, CatalogConditionalMixin
+from core.dashboard_cache import DashboardInvalidationMixin
+from core.fieldsets import SparseFieldsetMixin
+from core.rows import FastListMixin
+from core.search import CatalogSearchFilter, CatalogSearchPagination
+from core.pagination import DefaultPagination, TimelinePagination
 from .filters import ExerciseFilter, PerformedWorkoutFilter
 from .models import Exercise, CustomExercise, ExerciseInstance, Workout, PerformedWorkout
-from . import serializers
+from . import rows, serializers
 
+WORKOUT_PREFETCHES = {
+    'exercise_instances': ['exercise_instances__exercise'],
+    'total_calories': ['exercise_instances__exercise'],
+}
 
-class ExerciseViewSet(ReadOnlyModelViewSet):
+
+class ExerciseViewSet(CatalogConditionalMixin, SparseFieldsetMixin, FastListMixin, ReadOnlyModelViewSet):
+    catalog = EXERCISES
+    row_reader = rows.exercise_reader
     queryset = Exercise.objects.\
-        filter(customexercise__isnull=True).order_by('name')
+        filter(is_custom=False).order_by('name')
     serializer_class = serializers.ExerciseSerializer
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, CatalogSearchFilter, OrderingFilter]
     filterset_class = ExerciseFilter
-    pagination_class = DefaultPagination
+    pagination_class = CatalogSearchPagination
     search_fields = ['name']
     ordering_fields = ['calories_burned']
 
 
-class CustomExerciseViewSet(ModelViewSet):
+class CustomExerciseViewSet(DashboardInvalidationMixin, SparseFieldsetMixin, FastListMixin, ModelViewSet):
     http_method_names = ['get', 'post', 'patch', 'delete', 'head', 'options']
+    row_reader = rows.exercise_reader
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_class = ExerciseFilter
     pagination_class = DefaultPagination
@@ -31,8 +43,7 @@ class CustomExerciseViewSet(ModelViewSet):
     ordering_fields = ['calories_burned']
 
     def get_queryset(self):
-        user_id = self.request.user.id
-        trainee = get_object_or_404(Trainee, user_id=user_id)
+        trainee = self.request.trainee
         return CustomExercise.objects.filter(trainee=trainee).order_by('name')
 
     def get_serializer_class(self):
@@ -43,7 +54,7 @@ class CustomExerciseViewSet(ModelViewSet):
         return serializers.ExerciseSerializer
 
     def get_serializer_context(self):
-        return {'user_id': self.request.user.id}
+        return {'trainee': self.request.trainee}
 
     def destroy(self, request, *args, **kwargs):
         custom_exercise = self.get_object()
@@ -53,19 +64,17 @@ class CustomExerciseViewSet(ModelViewSet):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-class WorkoutViewSet(ModelViewSet):
+class WorkoutViewSet(DashboardInvalidationMixin, SparseFieldsetMixin, ModelViewSet):
     http_method_names = ['get', 'post', 'patch', 'delete', 'head', 'options']
     filter_backends = [SearchFilter]
     pagination_class = DefaultPagination
     search_fields = ['name', 'instructions']
+    prefetches = WORKOUT_PREFETCHES
 
     def get_queryset(self):
-        user_id = self.request.user.id
-        trainee = get_object_or_404(Trainee, user_id=user_id)
-        return Workout.objects.\
-            filter(trainee=trainee).\
-            prefetch_related('exercise_instances__exercise').\
-            order_by('name')
+        trainee = self.request.trainee
+        return self.prefetch(Workout.objects.filter(trainee=trainee))\
+            .order_by('name')
 
     def get_serializer_class(self):
         if self.request.method == 'PATCH':
@@ -73,7 +82,7 @@ class WorkoutViewSet(ModelViewSet):
         return serializers.WorkoutSerializer
 
     def get_serializer_context(self):
-        return {'user_id': self.request.user.id}
+        return {'trainee': self.request.trainee}
 
     def destroy(self, request, *args, **kwargs):
         workout = self.get_object()
@@ -83,12 +92,12 @@ class WorkoutViewSet(ModelViewSet):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-class WorkoutExerciseInstanceViewSet(ModelViewSet):
+class WorkoutExerciseInstanceViewSet(DashboardInvalidationMixin, SparseFieldsetMixin, FastListMixin, ModelViewSet):
     http_method_names = ['get', 'post', 'patch', 'delete', 'head', 'options']
+    row_reader = rows.exercise_instance_reader
 
     def get_queryset(self):
-        user_id = self.request.user.id
-        trainee = get_object_or_404(Trainee, user_id=user_id)
+        trainee = self.request.trainee
         workout_id = self.kwargs['workout_pk']
         workout = get_object_or_404(Workout, id=workout_id, trainee=trainee)
         return workout.exercise_instances\
@@ -104,25 +113,28 @@ class WorkoutExerciseInstanceViewSet(ModelViewSet):
 
     def get_serializer_context(self):
         return {'workout_id': self.kwargs['workout_pk'],
-                'user_id': self.request.user.id}
+                'trainee': self.request.trainee}
 
 
-class PerformedWorkoutViewSet(ModelViewSet):
+class PerformedWorkoutViewSet(DashboardInvalidationMixin, SparseFieldsetMixin, ModelViewSet):
     http_method_names = ['get', 'post', 'patch', 'delete', 'head', 'options']
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_class = PerformedWorkoutFilter
-    pagination_class = DefaultPagination
+    pagination_class = TimelinePagination
     search_fields = ['name']
     ordering_fields = ['time_performed']
+    ordering = ['-time_performed', '-id']
+    prefetches = {
+        'workouts': ['workouts__exercise_instances__exercise'],
+        'exercise_instances': ['exercise_instances__exercise'],
+        'total_calories': ['workouts__exercise_instances__exercise',
+                           'exercise_instances__exercise'],
+    }
 
     def get_queryset(self):
-        user_id = self.request.user.id
-        trainee = get_object_or_404(Trainee, user_id=user_id)
-        return PerformedWorkout.objects.\
-            filter(trainee=trainee).\
-            prefetch_related('workouts__exercise_instances__exercise').\
-            prefetch_related('exercise_instances__exercise').\
-            order_by('-time_performed')
+        trainee = self.request.trainee
+        return self.prefetch(PerformedWorkout.objects.filter(trainee=trainee))\
+            .order_by('-time_performed', '-id')
 
     def get_serializer_class(self):
         if self.request.method == 'PATCH':
@@ -130,21 +142,20 @@ class PerformedWorkoutViewSet(ModelViewSet):
         return serializers.PerformedWorkoutSerializer
 
     def get_serializer_context(self):
-        return {'user_id': self.request.user.id}
+        return {'trainee': self.request.trainee}
 
 
-class PerformedWorkoutWorkoutViewSet(ModelViewSet):
+class PerformedWorkoutWorkoutViewSet(DashboardInvalidationMixin, SparseFieldsetMixin, ModelViewSet):
     http_method_names = ['get', 'post', 'delete', 'head', 'options']
+    prefetches = WORKOUT_PREFETCHES
 
     def get_queryset(self):
-        user_id = self.request.user.id
-        trainee = get_object_or_404(Trainee, user_id=user_id)
+        trainee = self.request.trainee
         performed_workout_id = self.kwargs['performed_workout_pk']
         performed_workout = get_object_or_404(PerformedWorkout,
                                               id=performed_workout_id,
                                               trainee=trainee)
-        return performed_workout.workouts\
-            .prefetch_related('exercise_instances__exercise')\
+        return self.prefetch(performed_workout.workouts.all())\
             .order_by('name')
 
     def get_serializer_class(self):
@@ -154,7 +165,7 @@ class PerformedWorkoutWorkoutViewSet(ModelViewSet):
 
     def get_serializer_context(self):
         return {'performed_workout_id': self.kwargs['performed_workout_pk'],
-                'user_id': self.request.user.id}
+                'trainee': self.request.trainee}
 
     def destroy(self, request, *args, **kwargs):
         workout = self.get_object()
@@ -166,12 +177,12 @@ class PerformedWorkoutWorkoutViewSet(ModelViewSet):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
-class PerformedWorkoutExerciseInstanceViewSet(ModelViewSet):
+class PerformedWorkoutExerciseInstanceViewSet(DashboardInvalidationMixin, SparseFieldsetMixin, FastListMixin, ModelViewSet):
     http_method_names = ['get', 'post', 'patch', 'delete', 'head', 'options']
+    row_reader = rows.exercise_instance_reader
 
     def get_queryset(self):
-        user_id = self.request.user.id
-        trainee = get_object_or_404(Trainee, user_id=user_id)
+        trainee = self.request.trainee
         performed_workout_id = self.kwargs['performed_workout_pk']
         performed_workout = get_object_or_404(PerformedWorkout,
                                               id=performed_workout_id,
@@ -189,4 +200,4 @@ class PerformedWorkoutExerciseInstanceViewSet(ModelViewSet):
 
     def get_serializer_context(self):
         return {'performed_workout_id': self.kwargs['performed_workout_pk'],
-                'user_id': self.request.user.id}
+                'trainee': self.request.trainee}